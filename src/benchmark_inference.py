@@ -0,0 +1,51 @@
+import argparse
+import time
+import numpy as np
+from utils import load_trained_model, preprocess_image_bgr, run_inference
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description='Per-frame inference cost: model.predict vs compiled fast path')
+    p.add_argument('--model', default='models/asl_model_latest.h5')
+    p.add_argument('--img_size', type=int, default=64)
+    p.add_argument('--iters', type=int, default=300)
+    p.add_argument('--warmup', type=int, default=20)
+    return p.parse_args()
+
+
+def time_calls(fn, x, iters, warmup):
+    for _ in range(warmup):
+        fn(x)
+    times = np.empty(iters)
+    for i in range(iters):
+        t0 = time.perf_counter()
+        fn(x)
+        times[i] = time.perf_counter() - t0
+    return times * 1000.0
+
+
+def report(name, times_ms):
+    p50, p95, p99 = np.percentile(times_ms, [50, 95, 99])
+    print(f'{name:<16} mean {times_ms.mean():7.3f} ms | p50 {p50:7.3f} | p95 {p95:7.3f} | p99 {p99:7.3f}')
+
+
+def main():
+    args = parse_args()
+    model = load_trained_model(args.model)
+
+    # synthetic hand ROI, same shape as a typical padded crop
+    rng = np.random.default_rng(0)
+    roi = rng.integers(0, 256, size=(240, 240, 3), dtype=np.uint8)
+    x = preprocess_image_bgr(roi, img_size=args.img_size)
+
+    before = time_calls(lambda a: model.predict(a, verbose=0), x, args.iters, args.warmup)
+    after = time_calls(lambda a: run_inference(model, a), x, args.iters, args.warmup)
+
+    print(f'{args.iters} single-frame calls on {x.shape}')
+    report('model.predict', before)
+    report('run_inference', after)
+    print(f'speedup (mean): {before.mean() / after.mean():.1f}x')
+
+
+if __name__ == '__main__':
+    main()
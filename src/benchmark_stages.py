@@ -0,0 +1,215 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tracemalloc
+from types import SimpleNamespace
+import cv2
+import numpy as np
+from utils import load_trained_model, preprocess_image_bgr, run_inference, hand_bbox, NUM_LANDMARKS
+from translation import smart_translation
+from hud import draw_arabic_text, draw_hud
+
+# Per-stage cost of one frame of live_cam_mediapipe_advanced, each stage
+# isolated on fixed inputs (synthetic frames, plus one dataset image for
+# hand tracking) so runs are comparable across machines and releases.
+# Results go to JSON for regression tracking.
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description='Per-stage latency (p50/p95/p99) and allocations per call')
+    p.add_argument('--model', default='models/asl_model_latest.h5', help='skipped if missing')
+    p.add_argument('--width', type=int, default=640)
+    p.add_argument('--height', type=int, default=480)
+    p.add_argument('--img_size', type=int, default=64)
+    p.add_argument('--hand_image', default=None,
+                   help='image with a hand for the tracking stage (default: first image under --data_dir)')
+    p.add_argument('--data_dir', default='dataset')
+    p.add_argument('--iters', type=int, default=200)
+    p.add_argument('--warmup', type=int, default=10)
+    p.add_argument('--alloc_iters', type=int, default=20, help='calls traced for allocations')
+    p.add_argument('--stages', nargs='+', default=None, help='run only these stages')
+    p.add_argument('--out', default='benchmark_stages.json')
+    return p.parse_args(argv)
+
+
+def synthetic_landmarks(width, height, seed=0):
+    """A hand-sized cloud of 21 normalized points, shaped like MediaPipe's output."""
+    rng = np.random.default_rng(seed)
+    center = np.array([0.5, 0.5])
+    size = 200.0 / np.array([width, height])
+    pts = center + (rng.random((NUM_LANDMARKS, 2)) - 0.5) * size
+    return SimpleNamespace(landmark=[SimpleNamespace(x=float(x), y=float(y), z=0.0) for x, y in pts])
+
+
+def find_image(root):
+    for dirpath, dirnames, files in os.walk(root):
+        dirnames.sort()
+        for f in sorted(files):
+            if f.lower().endswith(('.jpg', '.jpeg', '.png', '.bmp')):
+                return os.path.join(dirpath, f)
+    return None
+
+
+def hand_frame(path, width, height):
+    """The image scaled to the frame height and centered on a gray frame."""
+    img = cv2.imread(path) if path else None
+    if img is None:
+        return None
+    scale = min(height / img.shape[0], width / img.shape[1])
+    img = cv2.resize(img, (int(img.shape[1] * scale), int(img.shape[0] * scale)))
+    frame = np.full((height, width, 3), 128, dtype=np.uint8)
+    y0, x0 = (height - img.shape[0]) // 2, (width - img.shape[1]) // 2
+    frame[y0:y0 + img.shape[0], x0:x0 + img.shape[1]] = img
+    return frame
+
+
+def time_stage(fn, iters, warmup):
+    for _ in range(warmup):
+        fn()
+    times = np.empty(iters)
+    for i in range(iters):
+        t0 = time.perf_counter()
+        fn()
+        times[i] = time.perf_counter() - t0
+    return times * 1000.0
+
+
+def trace_allocations(fn, iters):
+    """Per call: bytes and blocks allocated and still alive on return (its
+    result included), and peak traced bytes during the call.
+
+    Counts Python and NumPy buffers (NumPy reports to tracemalloc); memory
+    allocated inside native libraries (OpenCV internals, TF, MediaPipe) is
+    not visible.
+    """
+    fn()
+    tracemalloc.start()
+    peaks, sizes, blocks = [], [], []
+    try:
+        for _ in range(iters):
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            result = fn()
+            _, peak = tracemalloc.get_traced_memory()
+            diff = tracemalloc.take_snapshot().compare_to(before, 'filename')
+            del result
+            peaks.append(peak - base)
+            sizes.append(sum(d.size_diff for d in diff))
+            blocks.append(sum(d.count_diff for d in diff))
+    finally:
+        tracemalloc.stop()
+    return {'peak_kb': float(np.mean(peaks)) / 1024, 'alloc_kb': float(np.mean(sizes)) / 1024,
+            'alloc_blocks': float(np.mean(blocks))}
+
+
+def build_stages(args):
+    """name -> zero-argument callable, on inputs built once up front."""
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, size=(args.height, args.width, 3), dtype=np.uint8)
+    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    lm = synthetic_landmarks(args.width, args.height)
+    x_min, y_min, x_max, y_max = hand_bbox(lm, args.width, args.height)
+    roi = frame[y_min:y_max, x_min:x_max]
+
+    def roi_stage():
+        x0, y0, x1, y1 = hand_bbox(lm, args.width, args.height)
+        return frame[y0:y1, x0:x1]
+
+    stages = {
+        'cvtColor': lambda: cv2.cvtColor(frame, cv2.COLOR_BGR2RGB),
+        'bbox_roi': roi_stage,
+        'preprocess_image_bgr': lambda: preprocess_image_bgr(roi, img_size=args.img_size),
+        'smart_translation': lambda: smart_translation('HELLOIWANTWATERTHANKYOU', 'en', True),
+        'draw_arabic_text': lambda: draw_arabic_text(frame.copy(), 'مرحبا شكرا', (10, 50), font_size=18),
+        'hud': lambda: draw_hud(frame.copy(), 'HELLOIWANT', 'Hello I Want', 'A (93.0%)', (0, 255, 0),
+                                'en', True),
+        # the copy draw_hud and draw_arabic_text work on, to subtract from them
+        'frame_copy': lambda: frame.copy(),
+    }
+
+    import mediapipe as mp
+
+    def make_hands():
+        return mp.solutions.hands.Hands(static_image_mode=False, max_num_hands=1,
+                                        min_detection_confidence=0.7, min_tracking_confidence=0.5)
+
+    # noise holds no hand: the palm-detection path, taken every frame until a hand shows up
+    no_hand = make_hands()
+    stages['hands.process.no_hand'] = lambda: no_hand.process(rgb)
+
+    skipped = {}
+    # a hand on screen: after the first detection, each call is landmark
+    # tracking from the previous frame's box, the live steady state
+    hand_path = args.hand_image or find_image(args.data_dir)
+    hand_rgb = hand_frame(hand_path, args.width, args.height)
+    if hand_rgb is not None:
+        hand_rgb = cv2.cvtColor(hand_rgb, cv2.COLOR_BGR2RGB)
+        tracking = make_hands()
+        if tracking.process(hand_rgb).multi_hand_landmarks:
+            stages['hands.process'] = lambda: tracking.process(hand_rgb)
+        else:
+            skipped['hands.process'] = f'no hand detected in {hand_path}'
+    else:
+        skipped['hands.process'] = f'no readable hand image (--hand_image, or images under {args.data_dir})'
+
+    if os.path.exists(args.model):
+        model = load_trained_model(args.model)
+        x = preprocess_image_bgr(roi, img_size=args.img_size)
+        if getattr(model, 'input_kind', 'float') == 'landmarks':
+            from utils import landmark_features
+            x = landmark_features(lm, args.width, args.height)
+        if hasattr(model, 'predict'):
+            stages['model.predict'] = lambda: model.predict(x, verbose=0)
+        stages['run_inference'] = lambda: run_inference(model, x)
+    else:
+        skipped['model.predict'] = skipped['run_inference'] = f'{args.model} not found'
+    return stages, skipped
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    stages, skipped = build_stages(args)
+    if args.stages:
+        stages = {name: fn for name, fn in stages.items() if name in args.stages}
+
+    results = {}
+    for name, fn in stages.items():
+        times = time_stage(fn, args.iters, args.warmup)
+        p50, p95, p99 = np.percentile(times, [50, 95, 99])
+        results[name] = {'mean_ms': float(times.mean()), 'p50_ms': float(p50), 'p95_ms': float(p95),
+                         'p99_ms': float(p99), 'max_ms': float(times.max()),
+                         **trace_allocations(fn, args.alloc_iters)}
+        r = results[name]
+        print(f"{name:<22} p50 {p50:8.3f} ms | p95 {p95:8.3f} | p99 {p99:8.3f} | "
+              f"peak {r['peak_kb']:9.1f} KB/call")
+    for name, reason in skipped.items():
+        print(f'{name:<22} skipped: {reason}')
+
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': sys.version.split()[0],
+            'numpy': np.__version__,
+            'opencv': cv2.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'frame': [args.height, args.width],
+            'img_size': args.img_size,
+            'model': args.model,
+            'hand_image': args.hand_image or find_image(args.data_dir),
+            'iters': args.iters,
+        },
+        'stages': results,
+        'skipped': skipped,
+    }
+    with open(args.out, 'w') as f:
+        json.dump(report, f, indent=2)
+    print('Report saved to:', args.out)
+
+
+if __name__ == '__main__':
+    main()
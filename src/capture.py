@@ -0,0 +1,102 @@
+import time
+import threading
+import cv2
+
+
+class LatestFrameGrabber:
+    """Camera reader that always hands out the newest frame.
+
+    cv2.VideoCapture queues frames in the driver whenever the consumer is
+    slower than the camera, so a plain cap.read() returns a frame that may
+    be several hundred ms old. Here a background thread grabs continuously
+    and keeps only the latest frame with its capture timestamp
+    (time.perf_counter()); read() waits for a frame newer than the last one
+    it returned. Drop-in for cv2.VideoCapture in the live scripts.
+    """
+
+    def __init__(self, index=0, width=None, height=None, fps=None, fourcc=None, buffer_size=1):
+        self.cap = cv2.VideoCapture(index)
+        if fourcc:
+            # e.g. 'MJPG': most USB cameras only reach full fps at 720p+ in MJPG
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+        if width:
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        if height:
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        if fps:
+            self.cap.set(cv2.CAP_PROP_FPS, fps)
+        if buffer_size:
+            # not every backend honours it; the grab thread covers the rest
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)
+
+        self._cond = threading.Condition()
+        self._frame = None
+        self._t_capture = 0.0
+        self._seq = 0
+        self._read_seq = 0
+        self._running = False
+        self._thread = None
+        self.frames_grabbed = 0
+        self.frames_read = 0
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    @property
+    def settings(self):
+        """What the driver actually applied (it may ignore requests)."""
+        fourcc = int(self.cap.get(cv2.CAP_PROP_FOURCC))
+        return {
+            'width': int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            'height': int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            'fps': self.cap.get(cv2.CAP_PROP_FPS),
+            'fourcc': ''.join(chr((fourcc >> 8 * i) & 0xFF) for i in range(4)),
+        }
+
+    def start(self):
+        if self._thread is None and self.cap.isOpened():
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name='camera-grabber', daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        while self._running:
+            ok, frame = self.cap.read()
+            t_capture = time.perf_counter()
+            with self._cond:
+                if not ok:
+                    self._running = False
+                else:
+                    self._frame = frame
+                    self._t_capture = t_capture
+                    self._seq += 1
+                    self.frames_grabbed += 1
+                self._cond.notify_all()
+
+    def read_timed(self, timeout=5.0):
+        """(ok, frame, t_capture) for the newest frame not returned yet."""
+        self.start()
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._seq != self._read_seq or not self._running, timeout):
+                return False, None, None
+            if self._seq == self._read_seq:
+                return False, None, None
+            self._read_seq = self._seq
+            self.frames_read += 1
+            return True, self._frame, self._t_capture
+
+    def read(self):
+        ok, frame, _ = self.read_timed()
+        return ok, frame
+
+    @property
+    def frames_skipped(self):
+        # frames grabbed but superseded before anyone read them
+        return self.frames_grabbed - self.frames_read
+
+    def release(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self.cap.release()
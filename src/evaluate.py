@@ -0,0 +1,139 @@
+import os
+import json
+import time
+import argparse
+import numpy as np
+from utils import load_trained_model, load_labels, list_dataset_images, run_inference, Preprocessor, \
+    normalize_landmarks, iter_batches
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description='Accuracy, confusion matrix and throughput on a dataset split')
+    p.add_argument('--models', nargs='+', default=['models/asl_model_latest.h5'],
+                   help='any backend: .h5, .tflite (float or INT8), .npz; several to compare')
+    p.add_argument('--data_dir', default='dataset', help='dataset root (train/ valid/ test)')
+    p.add_argument('--models_dir', default='models', help='where labels.json lives')
+    p.add_argument('--split', default='test')
+    p.add_argument('--img_size', type=int, default=64)
+    p.add_argument('--batch_size', type=int, default=64)
+    p.add_argument('--workers', type=int, default=None, help='decode threads (default: all cores)')
+    p.add_argument('--num_threads', type=int, default=None, help='TFLite interpreter threads')
+    p.add_argument('--limit', type=int, default=None, help='evaluate the first N images only')
+    p.add_argument('--out', default=None, help='report JSON (default: <models_dir>/eval_<split>.json)')
+    return p.parse_args(argv)
+
+
+def image_batches(items, batch_size, workers, img_size):
+    """(y, images) batches; unreadable images are dropped."""
+    paths = [p for p, _ in items]
+    ys = np.array([y for _, y in items], dtype=np.int64)
+    for start, (_, images) in zip(range(0, len(paths), batch_size),
+                                   iter_batches(paths, batch_size, workers, img_size=img_size)):
+        keep = [i for i, img in enumerate(images) if img is not None]
+        yield ys[start:start + batch_size][keep], [images[i] for i in keep]
+
+
+def landmark_batches(npz_path, batch_size, limit=None):
+    """(y, features) batches from extract_landmarks output; frames without a hand are dropped."""
+    if not os.path.exists(npz_path):
+        raise FileNotFoundError(f'{npz_path} not found: run extract_landmarks.py first')
+    with np.load(npz_path) as data:
+        mask = data['mask']
+        X, y = data['landmarks'][mask], data['labels'][mask].astype(np.int64)
+    if limit:
+        X, y = X[:limit], y[:limit]
+    for start in range(0, len(X), batch_size):
+        yield y[start:start + batch_size], normalize_landmarks(X[start:start + batch_size])
+
+
+def evaluate_model(model, batches, num_classes, preprocess=None):
+    """Stream batches through run_inference and collect metrics."""
+    confusion = np.zeros((num_classes, num_classes), dtype=np.int64)
+    batch_ms = []
+    per_image_ms = []
+    t0 = time.perf_counter()
+    for y, items in batches:
+        if not len(y):
+            continue
+        x = preprocess.batch_of(items) if preprocess is not None else items
+        t_infer = time.perf_counter()
+        preds = run_inference(model, x)
+        dt = (time.perf_counter() - t_infer) * 1000.0
+        batch_ms.append(dt)
+        per_image_ms.append(dt / len(y))
+        np.add.at(confusion, (y, np.asarray(preds).argmax(axis=1)), 1)
+    elapsed = time.perf_counter() - t0
+
+    n = int(confusion.sum())
+    tp = np.diag(confusion)
+    support = confusion.sum(axis=1)
+    predicted = confusion.sum(axis=0)
+    recall = np.divide(tp, support, out=np.zeros(num_classes), where=support > 0)
+    precision = np.divide(tp, predicted, out=np.zeros(num_classes), where=predicted > 0)
+    batch_ms = np.array(batch_ms) if batch_ms else np.zeros(1)
+    per_image_ms = np.array(per_image_ms) if per_image_ms else np.zeros(1)
+    p50, p95, p99 = np.percentile(batch_ms, [50, 95, 99])
+    return {
+        'num_images': n,
+        'accuracy': float(tp.sum() / max(n, 1)),
+        # inference only vs. end to end (decode + preprocess + inference)
+        'images_per_s': float(n / max(batch_ms.sum() / 1000.0, 1e-9)),
+        'images_per_s_end_to_end': float(n / max(elapsed, 1e-9)),
+        'batch_latency_ms': {'mean': float(batch_ms.mean()), 'p50': float(p50), 'p95': float(p95),
+                             'p99': float(p99)},
+        'image_latency_ms_mean': float(per_image_ms.mean()),
+        'precision': precision.tolist(),
+        'recall': recall.tolist(),
+        'support': support.tolist(),
+        'confusion': confusion.tolist(),
+    }
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    labels = load_labels(models_dir=args.models_dir)
+    split_dir = os.path.join(args.data_dir, args.split)
+    items = list_dataset_images(split_dir, labels) if os.path.isdir(split_dir) else []
+    if args.limit:
+        items = items[:args.limit]
+    workers = args.workers or os.cpu_count()
+
+    report = {'split': args.split, 'labels': list(labels), 'models': {}}
+    for model_path in args.models:
+        model = load_trained_model(model_path, num_threads=args.num_threads)
+        if getattr(model, 'input_kind', 'float') == 'landmarks':
+            # landmark models classify MediaPipe keypoints, not pixels
+            npz_path = os.path.join(args.data_dir, 'landmarks', f'{args.split}.npz')
+            stats = evaluate_model(model, landmark_batches(npz_path, args.batch_size, args.limit), len(labels))
+        else:
+            if not items:
+                raise FileNotFoundError(f'no images found under {split_dir}')
+            preprocess = Preprocessor.for_model(model, img_size=args.img_size, max_batch=args.batch_size)
+            batches = image_batches(items, args.batch_size, workers, args.img_size)
+            stats = evaluate_model(model, batches, len(labels), preprocess=preprocess)
+        stats['size_kb'] = os.path.getsize(model_path) / 1024
+        report['models'][model_path] = stats
+        print(f'✅ {model_path}: {stats["accuracy"]*100:.2f}% sur {stats["num_images"]} images')
+
+    out_path = args.out or os.path.join(args.models_dir, f'eval_{args.split}.json')
+    with open(out_path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    name_w = max(12, *(len(os.path.basename(m)) + 2 for m in args.models))
+    print(f"\n{'':<{name_w}}{'accuracy':>10}{'img/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'size KB':>10}")
+    for model_path, st in report['models'].items():
+        lat = st['batch_latency_ms']
+        print(f"{os.path.basename(model_path):<{name_w}}{st['accuracy']*100:>9.2f}%{st['images_per_s']:>10.0f}"
+              f"{lat['p50']:>10.3f}{lat['p95']:>10.3f}{lat['p99']:>10.3f}{st['size_kb']:>10.1f}")
+    print(f'(latency per batch of {args.batch_size})')
+
+    for model_path, st in report['models'].items():
+        # the classes the model gets wrong most often
+        worst = sorted((r, l) for r, l, s in zip(st['recall'], labels, st['support']) if s)[:5]
+        print(f"{os.path.basename(model_path)} — rappel le plus faible: "
+              + ', '.join(f'{l} {r*100:.0f}%' for r, l in worst))
+    print('Report saved to:', out_path)
+
+
+if __name__ == '__main__':
+    main()
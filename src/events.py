@@ -0,0 +1,50 @@
+import sys
+import json
+import time
+
+# Structured output for headless runs: one JSON object per line.
+
+
+def wall_time(t_perf):
+    """Convert a time.perf_counter() stamp (e.g. Packet.t_capture) to epoch seconds."""
+    return time.time() - (time.perf_counter() - t_perf)
+
+
+class EventWriter:
+    """Append JSONL events to a file, or to stdout with path '-'."""
+
+    def __init__(self, path='-'):
+        self.path = path
+        if path == '-':
+            self._f = sys.stdout
+        else:
+            self._f = open(path, 'a', encoding='utf-8')
+
+    def emit(self, event_type, **fields):
+        event = {'type': event_type, 'ts': round(time.time(), 6)}
+        event.update(fields)
+        self._f.write(json.dumps(event, ensure_ascii=False) + '\n')
+        if self._f is sys.stdout:
+            # consumers read stdout line by line
+            self._f.flush()
+
+    def close(self):
+        if self._f is not sys.stdout:
+            self._f.close()
+        else:
+            self._f.flush()
+
+
+def frame_event_fields(packet, label=None, prob=None, top_k=None, bbox=None):
+    """Fields of a 'frame' event: prediction, bbox and stage latencies (ms)."""
+    latency = {name: round(t * 1000.0, 3) for name, t in packet.timings.items()}
+    latency['total'] = round((time.perf_counter() - packet.t_capture) * 1000.0, 3)
+    return {
+        'seq': packet.seq,
+        't_capture': round(wall_time(packet.t_capture), 6),
+        'label': label,
+        'prob': None if prob is None else round(float(prob), 4),
+        'top_k': [[l, round(float(p), 4)] for l, p in (top_k or [])],
+        'bbox': None if bbox is None else [int(v) for v in bbox],
+        'latency_ms': latency,
+    }
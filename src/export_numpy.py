@@ -0,0 +1,96 @@
+import os
+import argparse
+import numpy as np
+import tensorflow as tf
+from numpy_models import load_numpy_model
+
+
+def export_landmark_mlp(model, out_path):
+    """Dump the Dense layers of a landmark MLP to .npz (Dropout is a no-op at inference)."""
+    dense = [layer for layer in model.layers if isinstance(layer, tf.keras.layers.Dense)]
+    arrays = {'kind': np.array('landmark_mlp'), 'num_layers': np.array(len(dense)),
+              'activations': np.array([layer.activation.__name__ for layer in dense])}
+    for i, layer in enumerate(dense):
+        w, b = layer.get_weights()
+        arrays[f'W{i}'] = w.astype(np.float32)
+        arrays[f'b{i}'] = b.astype(np.float32)
+    np.savez(out_path, **arrays)
+    return out_path
+
+
+def export_cnn(model, out_path):
+    """Dump a build_simple_cnn model to .npz, layer by layer."""
+    L = tf.keras.layers
+    layer_types = []
+    arrays = {'kind': np.array('cnn'), 'input_shape': np.array(model.input_shape[1:])}
+    for layer in model.layers:
+        i = len(layer_types)
+        if isinstance(layer, L.Conv2D):
+            if layer.strides != (1, 1) or layer.padding != 'valid' or layer.dilation_rate != (1, 1):
+                raise ValueError(f'unsupported Conv2D config in layer {layer.name}')
+            layer_types.append('conv')
+        elif isinstance(layer, L.MaxPooling2D):
+            if layer.pool_size[0] != layer.pool_size[1] or tuple(layer.strides) != tuple(layer.pool_size) \
+                    or layer.padding != 'valid':
+                raise ValueError(f'unsupported MaxPooling2D config in layer {layer.name}')
+            layer_types.append('pool')
+            arrays[f'pool{i}'] = np.array(layer.pool_size[0])
+            continue
+        elif isinstance(layer, L.Flatten):
+            layer_types.append('flatten')
+            continue
+        elif isinstance(layer, L.Dense):
+            layer_types.append('dense')
+        elif isinstance(layer, L.Dropout):
+            continue
+        else:
+            raise ValueError(f'unsupported layer {layer.name} ({type(layer).__name__})')
+        w, b = layer.get_weights()
+        arrays[f'W{i}'] = w.astype(np.float32)
+        arrays[f'b{i}'] = b.astype(np.float32)
+        arrays[f'act{i}'] = np.array(layer.activation.__name__)
+    arrays['layer_types'] = np.array(layer_types)
+    np.savez(out_path, **arrays)
+    return out_path
+
+
+def validate(model, np_model, num_samples=256, seed=0):
+    """Max absolute difference between Keras and NumPy outputs."""
+    rng = np.random.default_rng(seed)
+    # images are fed as [0, 1] floats, landmark features lie in [-1, 1]
+    low = 0.0 if len(model.input_shape) == 4 else -1.0
+    x = rng.uniform(low, 1.0, size=(num_samples,) + tuple(model.input_shape[1:])).astype(np.float32)
+    ref = model(x, training=False).numpy()
+    out = np_model.infer(x)
+    return float(np.abs(ref - out).max()), float(np.mean(ref.argmax(1) == out.argmax(1)))
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description='Export a trained model to a TensorFlow-free .npz')
+    p.add_argument('--model', default='models/asl_model_latest.h5',
+                   help='pixel CNN (build_simple_cnn) or landmark MLP .h5')
+    p.add_argument('--out', default=None, help='output path (default: same name with .npz)')
+    p.add_argument('--atol', type=float, default=1e-4, help='max allowed output difference vs Keras')
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    out_path = args.out or os.path.splitext(args.model)[0] + '.npz'
+    model = tf.keras.models.load_model(args.model)
+    if len(model.input_shape) == 2:
+        export_landmark_mlp(model, out_path)
+    else:
+        export_cnn(model, out_path)
+
+    num_samples = 256 if len(model.input_shape) == 2 else 32
+    max_diff, agreement = validate(model, load_numpy_model(out_path), num_samples=num_samples)
+    size_kb = os.path.getsize(out_path) / 1024
+    print(f'NumPy model saved to: {out_path} ({size_kb:.1f} KB)')
+    print(f'max |keras - numpy| = {max_diff:.2e} | top-1 agreement {agreement*100:.2f}%')
+    if max_diff > args.atol:
+        raise SystemExit(f'❌ validation failed: {max_diff:.2e} > {args.atol:.0e}')
+
+
+if __name__ == '__main__':
+    main()
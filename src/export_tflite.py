@@ -0,0 +1,39 @@
+import os
+import argparse
+import tensorflow as tf
+
+
+def export_tflite(model, out_path):
+    """Convert an in-memory Keras model to a float32 .tflite file."""
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    tflite_model = converter.convert()
+    with open(out_path, 'wb') as f:
+        f.write(tflite_model)
+    return out_path
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description='Export a trained .h5 model to TFLite')
+    p.add_argument('--model', default='models/asl_model_latest.h5')
+    p.add_argument('--out', default=None, help='output path (default: same name with .tflite)')
+    p.add_argument('--raw_input', action='store_true',
+                   help='embed resize, BGR->RGB and /255 in the graph (input: uint8 BGR crop of any size)')
+    p.add_argument('--img_size', type=int, default=64)
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    suffix = '_raw.tflite' if args.raw_input else '.tflite'
+    out_path = args.out or os.path.splitext(args.model)[0] + suffix
+    model = tf.keras.models.load_model(args.model)
+    if args.raw_input and model.input_shape[1] is not None:
+        from train import build_raw_input_model
+        model = build_raw_input_model(model, img_size=args.img_size)
+    export_tflite(model, out_path)
+    size_kb = os.path.getsize(out_path) / 1024
+    print(f'TFLite model saved to: {out_path} ({size_kb:.1f} KB)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+import os
+import time
+import argparse
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from utils import load_labels, list_dataset_images, landmarks_to_array, NUM_LANDMARKS
+
+_hands = None
+
+
+def _init_worker(min_detection_confidence):
+    # one MediaPipe graph per process; OpenCV stays single-threaded so
+    # the pool does not oversubscribe the cores
+    global _hands
+    import cv2
+    import mediapipe as mp
+    cv2.setNumThreads(1)
+    _hands = mp.solutions.hands.Hands(static_image_mode=True, max_num_hands=1,
+                                      min_detection_confidence=min_detection_confidence)
+
+
+def _process_shard(paths, class_ids, out_path):
+    import cv2
+    X = np.zeros((len(paths), NUM_LANDMARKS, 3), dtype=np.float32)
+    mask = np.zeros(len(paths), dtype=bool)
+    for i, path in enumerate(paths):
+        img = cv2.imread(path)
+        if img is None:
+            continue
+        results = _hands.process(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
+        if results.multi_hand_landmarks:
+            h, w, _ = img.shape
+            X[i] = landmarks_to_array(results.multi_hand_landmarks[0], w, h)
+            mask[i] = True
+    # write-then-rename: a shard file on disk is always complete
+    tmp_path = out_path + '.tmp.npz'
+    np.savez(tmp_path, landmarks=X, labels=np.asarray(class_ids, dtype=np.int32),
+             mask=mask, paths=np.asarray(paths))
+    os.replace(tmp_path, out_path)
+    return len(paths), int(mask.sum())
+
+
+def _shard_done(shard_path, paths):
+    # resume only if the shard covers exactly the same images
+    if not os.path.exists(shard_path):
+        return False
+    try:
+        with np.load(shard_path) as data:
+            return list(data['paths']) == list(paths)
+    except Exception:
+        return False
+
+
+def extract_split(split_dir, labels, out_path, shard_dir, shard_size=500, workers=None,
+                  min_detection_confidence=0.5):
+    """Extract landmarks for every image of a split on a process pool.
+
+    Work is split into shards written to shard_dir as they finish, so an
+    interrupted run picks up where it stopped. The shards are merged into
+    out_path with arrays landmarks (N, 21, 3), labels (N,), mask (N,) and
+    paths (N,), in list_dataset_images order.
+    """
+    items = list_dataset_images(split_dir, labels)
+    paths = [p for p, _ in items]
+    class_ids = [c for _, c in items]
+    os.makedirs(shard_dir, exist_ok=True)
+
+    shards = []
+    for k, start in enumerate(range(0, len(items), shard_size)):
+        shard_path = os.path.join(shard_dir, f'shard_{k:05d}.npz')
+        shards.append((shard_path, paths[start:start + shard_size], class_ids[start:start + shard_size]))
+    todo = [s for s in shards if not _shard_done(s[0], s[1])]
+    print(f'{os.path.basename(split_dir)}: {len(items)} images, {len(shards)} shards '
+          f'({len(shards) - len(todo)} déjà faits)')
+
+    t0 = time.perf_counter()
+    done_images = 0
+    if todo:
+        workers = workers or os.cpu_count()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(min_detection_confidence,)) as pool:
+            futures = [pool.submit(_process_shard, shard_paths, shard_ids, shard_path)
+                       for shard_path, shard_paths, shard_ids in todo]
+            for n_done, fut in enumerate(as_completed(futures), 1):
+                n, _ = fut.result()
+                done_images += n
+                rate = done_images / (time.perf_counter() - t0)
+                print(f'  shard {n_done}/{len(todo)} | {rate:.0f} img/s', end='\r')
+        print()
+
+    parts = [np.load(shard_path) for shard_path, _, _ in shards]
+    merged = {key: np.concatenate([p[key] for p in parts]) if parts else np.zeros(0)
+              for key in ('landmarks', 'labels', 'mask', 'paths')}
+    for p in parts:
+        p.close()
+    tmp_path = out_path + '.tmp.npz'
+    np.savez_compressed(tmp_path, **merged)
+    os.replace(tmp_path, out_path)
+    print(f'  {int(merged["mask"].sum())}/{len(items)} mains détectées -> {out_path}')
+    return out_path
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description='Parallel MediaPipe landmark extraction for train/valid/test')
+    p.add_argument('--data_dir', default='../dataset', help='dataset root (train/ valid/ test)')
+    p.add_argument('--models_dir', default='../models', help='where labels.json lives')
+    p.add_argument('--out_dir', default=None, help='output dir (default: <data_dir>/landmarks)')
+    p.add_argument('--splits', nargs='+', default=['train', 'valid', 'test'])
+    p.add_argument('--workers', type=int, default=None, help='processes (default: all cores)')
+    p.add_argument('--shard_size', type=int, default=500)
+    p.add_argument('--min_detection_confidence', type=float, default=0.5)
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    out_dir = args.out_dir or os.path.join(args.data_dir, 'landmarks')
+    labels = load_labels(models_dir=args.models_dir)
+    for split in args.splits:
+        split_dir = os.path.join(args.data_dir, split)
+        if not os.path.isdir(split_dir):
+            print(f'⚠️  {split_dir} introuvable, ignoré')
+            continue
+        extract_split(split_dir, labels,
+                      out_path=os.path.join(out_dir, f'{split}.npz'),
+                      shard_dir=os.path.join(out_dir, 'shards', split),
+                      shard_size=args.shard_size, workers=args.workers,
+                      min_detection_confidence=args.min_detection_confidence)
+
+
+if __name__ == '__main__':
+    main()
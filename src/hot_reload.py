@@ -0,0 +1,78 @@
+import os
+import time
+import threading
+from utils import get_model, get_labels, load_trained_model, load_labels
+from logs import get_logger
+
+log = get_logger('hot_reload')
+
+
+class ModelWatcher:
+    """Reload a model in the background when its file changes.
+
+    The live loop reads `watcher.current` once per frame and gets a
+    (model, labels, version) tuple. A new model is loaded and warmed up on
+    the watcher thread, then published by rebinding that single attribute,
+    so a frame never sees a half-loaded model and never waits on the load.
+    """
+
+    def __init__(self, model_path, models_dir='models', poll_interval=2.0, settle_time=1.0, **load_kwargs):
+        self.model_path = model_path
+        self.models_dir = models_dir
+        self.poll_interval = poll_interval
+        self.settle_time = settle_time
+        self.load_kwargs = load_kwargs
+        self._stamp = self._file_stamp()
+        self.current = (get_model(model_path, **load_kwargs), get_labels(models_dir), 0)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _file_stamp(self):
+        # (mtime, size) of the model file and of labels.json, so a retrain
+        # that only changes the class set is picked up too; None while
+        # either is missing
+        try:
+            model_st = os.stat(self.model_path)
+            labels_st = os.stat(os.path.join(self.models_dir, 'labels.json'))
+        except FileNotFoundError:
+            return None
+        return model_st.st_mtime_ns, model_st.st_size, labels_st.st_mtime_ns, labels_st.st_size
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='model-watcher', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval + 1.0)
+
+    def _run(self):
+        while not self._stop.wait(self.poll_interval):
+            stamp = self._file_stamp()
+            if stamp is None or stamp == self._stamp:
+                continue
+            # let the writer finish: the file must stay unchanged for settle_time
+            time.sleep(self.settle_time)
+            if self._file_stamp() != stamp:
+                continue
+            try:
+                model = load_trained_model(self.model_path, **self.load_kwargs)
+                labels = load_labels(self.models_dir)
+            except Exception as e:
+                # _stamp is left as is: the next poll tries again
+                log.error("❌ Rechargement du modèle échoué: %s", e, extra={'every': 30.0})
+                continue
+            # labels.json and the model are written separately: a model
+            # still being saved pairs the new labels with the old weights
+            num_classes = getattr(model, 'num_classes', None)
+            if num_classes is not None and num_classes != len(labels):
+                log.warning("❌ Modèle (%s classes) et labels.json (%s) incohérents, ancien modèle conservé",
+                            num_classes, len(labels), extra={'every': 30.0})
+                # retried once either file changes again (new stamp)
+                self._stamp = stamp
+                continue
+            self._stamp = stamp
+            self.current = (model, labels, self.current[2] + 1)
+            log.info(f"🔄 Nouveau modèle chargé (v{self.current[2]}): {self.model_path}")
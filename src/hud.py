@@ -0,0 +1,75 @@
+import cv2
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+from translation import detect_semantic_words
+from logs import get_logger
+
+# Drawing of the advanced live loop's top panel.
+
+
+def draw_arabic_text(image, text, position, font_size=30, color=(255, 255, 0)):
+    """Dessiner du texte arabe sur une image OpenCV"""
+    try:
+        image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        image_pil = Image.fromarray(image_rgb)
+        draw = ImageDraw.Draw(image_pil)
+        
+        font_paths = [
+            "C:/Windows/Fonts/arial.ttf",
+            "C:/Windows/Fonts/tahoma.ttf",  
+            "C:/Windows/Fonts/segoeui.ttf",
+        ]
+        
+        font = None
+        for font_path in font_paths:
+            try:
+                font = ImageFont.truetype(font_path, font_size)
+                break
+            except:
+                continue
+                
+        if font is None:
+            font = ImageFont.load_default()
+        
+        draw.text(position, text, font=font, fill=color)
+        return cv2.cvtColor(np.array(image_pil), cv2.COLOR_RGB2BGR)
+        
+    except Exception as e:
+        # called every frame while Arabic is on: do not flood the log
+        get_logger('hud').warning('❌ Erreur affichage arabe: %s', e, extra={'every': 5.0})
+        return image
+
+
+def draw_hud(frame, current_word, semantic_translation, display_text, display_color, language, translation_mode):
+    """Draw the top panel; returns the frame (a new one when Arabic text is drawn)."""
+    w = frame.shape[1]
+    # Dessiner l'interface
+    cv2.rectangle(frame, (0, 0), (w, 150), (50, 50, 50), -1)
+    
+    # Mot en cours
+    cv2.putText(frame, f"LETTERS: {current_word}", (10, 25), 
+               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+    
+    # Traduction
+    mode_text = "🔤 TRADUCTION" if translation_mode else "🔠 LETTRES"
+    if language == 'ar':
+        frame = draw_arabic_text(frame, f"{mode_text}: {semantic_translation}", 
+                               (10, 50), font_size=18, color=(255, 255, 0))
+    else:
+        cv2.putText(frame, f"{mode_text}: {semantic_translation}", (10, 50), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
+    
+    # Détection actuelle
+    cv2.putText(frame, f"DETECTED: {display_text}", (10, 80), 
+               cv2.FONT_HERSHEY_SIMPLEX, 0.7, display_color, 2)
+    
+    # Info mots détectés
+    detected_words, _ = detect_semantic_words(current_word)
+    if detected_words and translation_mode:
+        cv2.putText(frame, f"WORDS: {', '.join(detected_words[:3])}", (10, 105), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 255, 255), 1)
+    
+    # Instructions
+    cv2.putText(frame, "SPACE:Add  C:Clear  D:Del  F/A/E:Lang  T:Mode  Q:Quit", 
+               (10, 130), cv2.FONT_HERSHEY_SIMPLEX, 0.35, (200, 200, 200), 1)
+    return frame
@@ -1,48 +1,140 @@
+import sys
+import argparse
 import cv2
 import time
-from utils import load_trained_model, load_labels, preprocess_image_bgr
+from utils import get_model, get_labels, run_inference, preprocess_for_model, decode_predictions, Preprocessor
+from pipeline import Pipeline
+from sources import open_source
+from capture import LatestFrameGrabber
+from events import EventWriter, frame_event_fields
+from metrics import Metrics
+from tracing import Tracer
+from logs import setup_logging
 
 MODEL_PATH = 'models/asl_model_latest.h5'
 
 
-def main():
-    model = load_trained_model(MODEL_PATH)
-    labels = load_labels(models_dir='models')
+def parse_args(argv=None):
+    p = argparse.ArgumentParser()
+    p.add_argument('--model', default=MODEL_PATH)
+    p.add_argument('--serial', action='store_true', help='run all stages in one loop (no worker threads)')
+    p.add_argument('--source', default='0',
+                   help="camera index, video file, image folder or 'synthetic[:N]'")
+    p.add_argument('--realtime', action='store_true', help='pace file/synthetic sources at their fps')
+    p.add_argument('--width', type=int, default=None)
+    p.add_argument('--height', type=int, default=None)
+    p.add_argument('--fps', type=int, default=None)
+    p.add_argument('--fourcc', default=None, help="e.g. MJPG")
+    p.add_argument('--headless', action='store_true', help='no window: emit JSONL events instead')
+    p.add_argument('--events', default=None,
+                   help="JSONL event output, '-' for stdout (default: '-' when --headless)")
+    p.add_argument('--metrics', default=None,
+                   help='dump stage histograms to this file (.prom: Prometheus text, else JSON)')
+    p.add_argument('--metrics_interval', type=float, default=10.0, help='seconds between dumps')
+    p.add_argument('--no_metrics', action='store_true', help='disable stage timers entirely')
+    p.add_argument('--trace', default=None,
+                   help='record stage spans and write a Chrome trace JSON here on exit (and on P)')
+    p.add_argument('--trace_capacity', type=int, default=200000, help='spans kept in the ring buffer')
+    p.add_argument('--log_level', default=None,
+                   help='DEBUG shows per-frame predictions (default: $ASL_LOG_LEVEL or INFO)')
+    p.add_argument('--log_json', action='store_true', help='log as JSON lines')
+    return p.parse_args(argv)
 
-    cap = cv2.VideoCapture(0)
-    time.sleep(1.0)
+
+def main(argv=None, source=None):
+    """source: any sources.FrameSource (or cv2.VideoCapture-like object);
+    defaults to the one described by --source."""
+    args = parse_args(argv)
+    if args.headless and args.events is None:
+        args.events = '-'
+    # keep stdout clean for JSONL events in headless mode
+    log = setup_logging(level=args.log_level, stream=sys.stderr if args.events == '-' else sys.stdout,
+                        json_lines=args.log_json)
+    model = get_model(args.model)
+    labels = get_labels(models_dir='models')
+    preprocess = Preprocessor.for_model(model, img_size=64)
+
+    if source is None:
+        source = open_source(args.source, realtime=args.realtime, width=args.width,
+                             height=args.height, fps=args.fps, fourcc=args.fourcc)
+    cap = source
+    if isinstance(cap, LatestFrameGrabber):
+        time.sleep(1.0)  # camera warm-up
 
     if not cap.isOpened():
-        print('Cannot open camera')
+        log.error('Cannot open camera')
         return
 
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
-
+    def classify(packet):
+        # preprocessing and inference stay in one stage: the Preprocessor
+        # buffer is reused on the next call
         try:
-            label, prob = predict(frame, model, labels)
-            text = f'{label} {prob*100:.1f}%'
+            packet.data['pred'] = predict(packet.frame, model, labels, preprocess)
         except Exception as e:
-            text = '---'
+            packet.data['pred'] = None
+            log.error('❌ Erreur de prédiction: %s', e, exc_info=True, extra={'every': 5.0})
+
+    events = EventWriter(args.events) if args.events else None
+    tracer = Tracer(capacity=args.trace_capacity) if args.trace else None
+    metrics = Metrics(enabled=not args.no_metrics, tracer=tracer)
+    if args.metrics:
+        metrics.start_dumper(args.metrics, interval=args.metrics_interval)
+
+    t_start = time.perf_counter()
+    n_frames = 0
+    # unpaced file/synthetic sources must not lose frames: back-pressure instead of drop-oldest
+    drop_oldest = getattr(cap, 'realtime', True)
+    pipeline = Pipeline(cap, [('classify', classify)], drop_oldest=drop_oldest,
+                        threaded=not args.serial, metrics=metrics)
+    for packet in pipeline:
+        frame = packet.frame
+        n_frames += 1
+        text = '---'
+        label, prob, top_5 = packet.data['pred'] or (None, None, None)
+        if label is not None:
+            text = f'{label} {prob*100:.1f}%'
+
+        if events:
+            # the whole frame is classified: its bbox is the full image
+            h, w = frame.shape[:2]
+            events.emit('frame', **frame_event_fields(packet, label=label, prob=prob, top_k=top_5,
+                                                      bbox=(0, 0, w, h)))
+        # capture -> prediction available, whatever the output
+        metrics.frame(packet.seq, packet.t_capture, time.perf_counter())
+        if args.headless:
+            continue
 
-        cv2.putText(frame, text, (10, 40), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0,255,0), 2)
-        cv2.imshow('ASL - Simple Webcam', frame)
+        with metrics.timer('render', packet.seq):
+            cv2.putText(frame, text, (10, 40), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0,255,0), 2)
+            cv2.imshow('ASL - Simple Webcam', frame)
 
-        if cv2.waitKey(1) & 0xFF == ord('q'):
+        key = cv2.waitKey(1) & 0xFF
+        if key == ord('p') and tracer:
+            log.info(f"🧵 Trace: {tracer.dump(args.trace)} événements -> {args.trace}")
+        elif key == ord('q'):
             break
 
+    pipeline.stop()
+    pipeline.join()
+    elapsed = time.perf_counter() - t_start
+    log.info(f"⏱️ {n_frames} frames en {elapsed:.1f}s ({n_frames / max(elapsed, 1e-9):.1f} FPS), "
+             f"{pipeline.dropped} ignorées")
+    if events:
+        events.close()
+    metrics.stop(args.metrics)
+    if tracer:
+        tracer.dump(args.trace)
+    if args.metrics:
+        log.info('stage timings\n' + metrics.summary())
     cap.release()
-    cv2.destroyAllWindows()
+    if not args.headless:
+        cv2.destroyAllWindows()
 
 
-def predict(frame, model, labels):
-    label, prob = None, 0.0
-    label, prob = None, 0.0
-    from src.utils import predict_from_frame
-    label, prob = predict_from_frame(model, frame, labels, img_size=64)
-    return label, prob
+def predict(frame, model, labels, preprocess=None, top_k=5):
+    """(label, prob, [(label, prob), ...] top_k) for the whole frame."""
+    x = preprocess(frame) if preprocess is not None else preprocess_for_model(model, frame, img_size=64)
+    return decode_predictions(run_inference(model, x), labels, top_k=top_k)[0]
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
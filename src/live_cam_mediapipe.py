@@ -1,71 +1,152 @@
+import sys
+import logging
+import argparse
 import cv2
 import mediapipe as mp
 import time
-import numpy as np
-from utils import load_trained_model, load_labels, preprocess_image_bgr
+from utils import get_model, get_labels, run_inference, Preprocessor, landmark_features, decode_predictions
+from pipeline import Pipeline
+from sources import open_source
+from events import EventWriter, frame_event_fields
+from metrics import Metrics
+from tracing import Tracer
+from logs import setup_logging
+from recorder import DebugRecorder
 
 MODEL_PATH = 'models/asl_model_latest.h5'
 PAD = 80  # pixels of padding around hand bbox
 
 
-def main():
-    model = load_trained_model(MODEL_PATH)
-    labels = load_labels(models_dir='models')
+def parse_args(argv=None):
+    p = argparse.ArgumentParser()
+    p.add_argument('--model', default=MODEL_PATH,
+                   help='pixel CNN (.h5/.tflite) or landmark MLP (asl_landmarks_latest.h5/.npz)')
+    p.add_argument('--serial', action='store_true', help='run all stages in one loop (no worker threads)')
+    p.add_argument('--source', default='0',
+                   help="camera index, video file, image folder or 'synthetic[:N]'")
+    p.add_argument('--realtime', action='store_true', help='pace file/synthetic sources at their fps')
+    p.add_argument('--width', type=int, default=None)
+    p.add_argument('--height', type=int, default=None)
+    p.add_argument('--fps', type=int, default=None)
+    p.add_argument('--fourcc', default=None, help="e.g. MJPG")
+    p.add_argument('--headless', action='store_true', help='no window: emit JSONL events instead')
+    p.add_argument('--events', default=None,
+                   help="JSONL event output, '-' for stdout (default: '-' when --headless)")
+    p.add_argument('--metrics', default=None,
+                   help='dump stage histograms to this file (.prom: Prometheus text, else JSON)')
+    p.add_argument('--metrics_interval', type=float, default=10.0, help='seconds between dumps')
+    p.add_argument('--no_metrics', action='store_true', help='disable stage timers entirely')
+    p.add_argument('--trace', default=None,
+                   help='record stage spans and write a Chrome trace JSON here on exit (and on P)')
+    p.add_argument('--trace_capacity', type=int, default=200000, help='spans kept in the ring buffer')
+    p.add_argument('--log_level', default=None,
+                   help='DEBUG shows per-frame predictions (default: $ASL_LOG_LEVEL or INFO)')
+    p.add_argument('--log_json', action='store_true', help='log as JSON lines')
+    p.add_argument('--debug_dir', default='debug_frames', help='where sampled hand crops are saved')
+    p.add_argument('--debug_every', type=int, default=30, help='save one crop every N frames (0: off)')
+    p.add_argument('--debug_low_conf', type=float, default=None,
+                   help='also save every crop whose top-1 prob is below this')
+    p.add_argument('--debug_max_files', type=int, default=200, help='oldest crops are deleted beyond this')
+    return p.parse_args(argv)
+
+
+def main(argv=None, source=None):
+    """source: any sources.FrameSource (or cv2.VideoCapture-like object);
+    defaults to the one described by --source."""
+    args = parse_args(argv)
+    if args.headless and args.events is None:
+        args.events = '-'
+    # keep stdout clean for JSONL events in headless mode
+    log = setup_logging(level=args.log_level, stream=sys.stderr if args.events == '-' else sys.stdout,
+                        json_lines=args.log_json)
+    model = get_model(args.model)
+    labels = get_labels(models_dir='models')
+    # reused across frames: no per-frame preprocessing allocations
+    preprocess = Preprocessor.for_model(model, img_size=64)
+    use_landmarks = getattr(model, 'input_kind', 'float') == 'landmarks'
 
     mp_hands = mp.solutions.hands
     hands = mp_hands.Hands(static_image_mode=False, max_num_hands=1, min_detection_confidence=0.7)
     mp_draw = mp.solutions.drawing_utils
 
-    cap = cv2.VideoCapture(0)
+    if source is None:
+        source = open_source(args.source, realtime=args.realtime, width=args.width,
+                             height=args.height, fps=args.fps, fourcc=args.fourcc)
+    cap = source
 
     if not cap.isOpened():
-        print('Cannot open camera')
+        log.error('Cannot open camera')
         return
 
+    tracer = Tracer(capacity=args.trace_capacity) if args.trace else None
+    metrics = Metrics(enabled=not args.no_metrics, tracer=tracer)
+    if args.metrics:
+        metrics.start_dumper(args.metrics, interval=args.metrics_interval)
+
+    def detect(packet):
+        rgb = cv2.cvtColor(packet.frame, cv2.COLOR_BGR2RGB)
+        with metrics.timer('hands_process', packet.seq):
+            results = hands.process(rgb)
+        packet.data['lm'] = results.multi_hand_landmarks[0] if results.multi_hand_landmarks else None
+
+    def classify(packet):
+        lm = packet.data['lm']
+        packet.data['preds'] = None
+        if lm is None:
+            return
+        frame = packet.frame
+        h, w, _ = frame.shape
+        with metrics.timer('roi_crop', packet.seq):
+            x_coords = [int(p.x * w) for p in lm.landmark]
+            y_coords = [int(p.y * h) for p in lm.landmark]
+            x_min, x_max = max(min(x_coords)-PAD, 0), min(max(x_coords)+PAD, w)
+            y_min, y_max = max(min(y_coords)-PAD, 0), min(max(y_coords)+PAD, h)
+
+            hand_roi = frame[y_min:y_max, x_min:x_max]
+        packet.data['roi'] = hand_roi
+        packet.data['bbox'] = (x_min, y_min, x_max, y_max)
+        if hand_roi.size != 0:
+            # landmark models classify the 21 keypoints, not the crop
+            with metrics.timer('preprocess', packet.seq):
+                x = landmark_features(lm, w, h) if use_landmarks else preprocess(hand_roi)
+            with metrics.timer('inference', packet.seq):
+                packet.data['preds'] = run_inference(model, x)
+
+    events = EventWriter(args.events) if args.events else None
+    # sampled, written on a background thread; R saves the next crop
+    recorder = DebugRecorder(args.debug_dir, every_n=args.debug_every, low_confidence=args.debug_low_conf,
+                             max_files=args.debug_max_files)
+
     # simple smoothing
     prev_label = None
     label_buffer = []
     buffer_len = 5
 
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
-
-        h, w, _ = frame.shape
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = hands.process(rgb)
+    t_start = time.perf_counter()
+    n_frames = 0
+    # unpaced file/synthetic sources must not lose frames: back-pressure instead of drop-oldest
+    drop_oldest = getattr(cap, 'realtime', True)
+    pipeline = Pipeline(cap, [('detect', detect), ('classify', classify)], drop_oldest=drop_oldest,
+                        threaded=not args.serial, metrics=metrics)
+    for packet in pipeline:
+        frame = packet.frame
+        n_frames += 1
+        lm = packet.data['lm']
+        preds = packet.data['preds']
 
         display_text = '---'
+        label, prob, top_5 = None, None, None
 
-        if results.multi_hand_landmarks:
-            lm = results.multi_hand_landmarks[0]
-            x_coords = [int(p.x * w) for p in lm.landmark]
-            y_coords = [int(p.y * h) for p in lm.landmark]
-            x_min, x_max = max(min(x_coords)-PAD, 0), min(max(x_coords)+PAD, w)
-            y_min, y_max = max(min(y_coords)-PAD, 0), min(max(y_coords)+PAD, h)
+        if lm is not None:
+            if preds is not None:
+                label, prob, top_5 = decode_predictions(preds, labels, top_k=5)[0]
 
-            hand_roi = frame[y_min:y_max, x_min:x_max]
-            if hand_roi.size != 0:
-                debug_img = cv2.resize(hand_roi, (64, 64))
-                cv2.imwrite('debug_webcam.jpg', debug_img)
-                print("📸 Image sauvegardée: debug_webcam.jpg")
-                x = preprocess_image_bgr(hand_roi, img_size=64)
-                preds = model.predict(x, verbose=0)
-
-# DEBUG: Afficher les top prédictions
-                top_5 = np.argsort(preds[0])[-5:][::-1]
-                print("\n" + "="*50)
-                print("🔍 TOP 5 PRÉDICTIONS:")
-                for i, idx in enumerate(top_5):
-                    confidence = preds[0][idx] * 100
-                    print(f"  {i+1}. {labels[idx]}: {confidence:.1f}%")
-
-                idx = int(np.argmax(preds))
-                prob = float(np.max(preds))
-                label = labels[idx]
-                print(f"✅ CHOISI: {label} ({prob*100:.1f}%)")
-                print("="*50)
+                recorder.offer(packet.data['roi'], packet.seq, label, prob)
+
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug('🔍 top 5', extra={'every': 0.5, 'fields': {
+                        'frame': packet.seq, 'label': label, 'prob': round(prob, 3),
+                        'top_5': ','.join(f'{name}:{p:.2f}' for name, p in top_5)}})
 
                 label_buffer.append((label, prob))
                 if len(label_buffer) > buffer_len:
@@ -79,16 +160,49 @@ def main():
                 display_prob = max(p for l,p in label_buffer if l==display_label)
                 display_text = f"{display_label} {display_prob*100:.1f}%"
 
-            mp_draw.draw_landmarks(frame, lm, mp_hands.HAND_CONNECTIONS)
-
-        cv2.putText(frame, display_text, (10, 40), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0,255,0), 2)
-        cv2.imshow('ASL - Mediapipe', frame)
-
-        if cv2.waitKey(1) & 0xFF == ord('q'):
+            if not args.headless:
+                mp_draw.draw_landmarks(frame, lm, mp_hands.HAND_CONNECTIONS)
+
+        if events:
+            events.emit('frame', **frame_event_fields(packet, label=label, prob=prob, top_k=top_5,
+                                                      bbox=packet.data.get('bbox')))
+        # capture -> prediction available, whatever the output
+        metrics.frame(packet.seq, packet.t_capture, time.perf_counter())
+        if args.headless:
+            continue
+
+        with metrics.timer('render', packet.seq):
+            cv2.putText(frame, display_text, (10, 40), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0,255,0), 2)
+            cv2.imshow('ASL - Mediapipe', frame)
+
+        key = cv2.waitKey(1) & 0xFF
+        if key == ord('r'):
+            recorder.request()
+        elif key == ord('p') and tracer:
+            log.info(f"🧵 Trace: {tracer.dump(args.trace)} événements -> {args.trace}")
+        elif key == ord('q'):
             break
 
+    pipeline.stop()
+    pipeline.join()
+    elapsed = time.perf_counter() - t_start
+    log.info(f"⏱️ {n_frames} frames en {elapsed:.1f}s ({n_frames / max(elapsed, 1e-9):.1f} FPS), "
+             f"{pipeline.dropped} ignorées")
+    if events:
+        events.close()
+    recorder.close()
+    if recorder.saved:
+        log.info(f"📸 {recorder.saved} images de debug dans {args.debug_dir}/ ({recorder.dropped} ignorées)")
+    if recorder.failed:
+        log.warning(f"❌ {recorder.failed} images de debug non écrites dans {args.debug_dir}/")
+    metrics.stop(args.metrics)
+    if tracer:
+        tracer.dump(args.trace)
+    if args.metrics:
+        log.info('stage timings\n' + metrics.summary())
     cap.release()
-    cv2.destroyAllWindows()
+    if not args.headless:
+        cv2.destroyAllWindows()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
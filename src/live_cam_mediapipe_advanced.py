@@ -1,309 +1,69 @@
+import sys
+import argparse
+import logging
 import cv2
 import mediapipe as mp
-import numpy as np
-from utils import load_trained_model, load_labels, preprocess_image_bgr
-from PIL import Image, ImageDraw, ImageFont
+import time
+from utils import run_inference, Preprocessor, landmark_features, decode_predictions, hand_bbox
+from hot_reload import ModelWatcher
+from pipeline import Pipeline
+from sources import open_source
+from smoothing import LetterSmoother
+from events import EventWriter, frame_event_fields
+from metrics import Metrics
+from tracing import Tracer
+from logs import setup_logging
+from translation import SEMANTIC_TRANSLATIONS, smart_translation, detect_semantic_words
+from hud import draw_hud
 
 MODEL_PATH = 'models/asl_model_latest.h5'
 PAD = 70
 
-# DICTIONNAIRE OPTIMISÉ (150 MOTS FRÉQUENTS)
-SEMANTIC_TRANSLATIONS = {
-    'en': {
-        # ========== PRONOMS & BASIQUES ==========
-        'I': 'I', 'YOU': 'You', 'HE': 'He', 'SHE': 'She', 'WE': 'We', 
-        'THEY': 'They', 'ME': 'Me', 'MY': 'My', 'YOUR': 'Your', 'OUR': 'Our',
-        'THEIR': 'Their', 'HIS': 'His', 'HER': 'Her', 'IT': 'It', 'ITS': 'Its',
-        
-        # ========== VERBES COURANTS ==========
-        'BE': 'Be', 'IS': 'Is', 'ARE': 'Are', 'AM': 'Am', 'HAVE': 'Have',
-        'HAS': 'Has', 'DO': 'Do', 'DONT': "Don't", 'CAN': 'Can', 'CANNOT': 'Cannot',
-        'WILL': 'Will', 'WOULD': 'Would', 'SHOULD': 'Should', 'COULD': 'Could',
-        'MAY': 'May', 'MIGHT': 'Might', 'MUST': 'Must', 'WANT': 'Want',
-        'NEED': 'Need', 'LIKE': 'Like', 'LOVE': 'Love', 'HATE': 'Hate',
-        
-        # ========== SALUTATIONS & RÉPONSES ==========
-        'HELLO': 'Hello', 'HI': 'Hi', 'GOODBYE': 'Goodbye', 'BYE': 'Bye',
-        'WELCOME': 'Welcome', 'THANKS': 'Thanks', 'THANKYOU': 'Thank you',
-        'PLEASE': 'Please', 'SORRY': 'Sorry', 'EXCUSEME': 'Excuse me',
-        'YES': 'Yes', 'NO': 'No', 'OK': 'OK', 'FINE': 'Fine', 'GOOD': 'Good',
-        'BAD': 'Bad', 'WELL': 'Well', 'GREAT': 'Great', 'PERFECT': 'Perfect',
-        'MAYBE': 'Maybe', 'SURE': 'Sure', 'NOT': 'Not',
-        
-        # ========== QUESTIONS ==========
-        'WHAT': 'What', 'WHERE': 'Where', 'WHEN': 'When', 'WHY': 'Why',
-        'HOW': 'How', 'WHO': 'Who', 'WHICH': 'Which', 'WHOSE': 'Whose',
-        
-        # ========== FAMILLE & PERSONNES ==========
-        'FAMILY': 'Family', 'FATHER': 'Father', 'MOTHER': 'Mother', 
-        'PARENTS': 'Parents', 'SON': 'Son', 'DAUGHTER': 'Daughter',
-        'BROTHER': 'Brother', 'SISTER': 'Sister', 'BABY': 'Baby',
-        'CHILD': 'Child', 'MAN': 'Man', 'WOMAN': 'Woman', 'BOY': 'Boy',
-        'GIRL': 'Girl', 'FRIEND': 'Friend', 'NAME': 'Name',
-        
-        # ========== ÉMOTIONS & SENTIMENTS ==========
-        'HAPPY': 'Happy', 'SAD': 'Sad', 'ANGRY': 'Angry', 'EXCITED': 'Excited',
-        'SCARED': 'Scared', 'CALM': 'Calm', 'TIRED': 'Tired', 'SICK': 'Sick',
-        
-        # ========== LIEUX & MAISON ==========
-        'HOME': 'Home', 'HOUSE': 'House', 'ROOM': 'Room', 'BATHROOM': 'Bathroom',
-        'BEDROOM': 'Bedroom', 'KITCHEN': 'Kitchen', 'SCHOOL': 'School',
-        'WORK': 'Work', 'OFFICE': 'Office', 'HOSPITAL': 'Hospital',
-        'PARK': 'Park', 'STORE': 'Store', 'CITY': 'City',
-        
-        # ========== NOURRITURE & BOISSONS ==========
-        'FOOD': 'Food', 'EAT': 'Eat', 'DRINK': 'Drink', 'WATER': 'Water',
-        'HUNGRY': 'Hungry', 'THIRSTY': 'Thirsty', 'BREAD': 'Bread',
-        'MEAT': 'Meat', 'FRUIT': 'Fruit', 'MILK': 'Milk', 'COFFEE': 'Coffee',
-        
-        # ========== ACTIONS & MOUVEMENTS ==========
-        'GO': 'Go', 'COME': 'Come', 'SEE': 'See', 'LOOK': 'Look',
-        'HEAR': 'Hear', 'LISTEN': 'Listen', 'SPEAK': 'Speak', 'TALK': 'Talk',
-        'SAY': 'Say', 'ASK': 'Ask', 'ANSWER': 'Answer', 'THINK': 'Think',
-        'KNOW': 'Know', 'UNDERSTAND': 'Understand', 'REMEMBER': 'Remember',
-        'FORGET': 'Forget', 'HELP': 'Help', 'STOP': 'Stop', 'START': 'Start',
-        'WAIT': 'Wait', 'SIT': 'Sit', 'STAND': 'Stand', 'WALK': 'Walk',
-        'RUN': 'Run', 'SLEEP': 'Sleep', 'WAKE': 'Wake',
-        
-        # ========== OBJETS & COULEURS ==========
-        'BOOK': 'Book', 'PEN': 'Pen', 'PAPER': 'Paper', 'PHONE': 'Phone',
-        'COMPUTER': 'Computer', 'CAR': 'Car', 'BUS': 'Bus', 'TRAIN': 'Train',
-        'BED': 'Bed', 'TABLE': 'Table', 'CHAIR': 'Chair', 'DOOR': 'Door',
-        'WINDOW': 'Window', 'RED': 'Red', 'BLUE': 'Blue', 'GREEN': 'Green',
-        'YELLOW': 'Yellow', 'BLACK': 'Black', 'WHITE': 'White',
-        
-        # ========== TEMPS & NOMBRES ==========
-        'TIME': 'Time', 'DAY': 'Day', 'NIGHT': 'Night', 'TODAY': 'Today',
-        'TOMORROW': 'Tomorrow', 'NOW': 'Now', 'LATER': 'Later',
-        'ONE': 'One', 'TWO': 'Two', 'THREE': 'Three', 'FOUR': 'Four',
-        'FIVE': 'Five', 'TEN': 'Ten',
-        
-        # ========== PHRASES COURANTES ==========
-        'ILOVEYOU': 'I love you', 'HOWAREYOU': 'How are you',
-        'WHATISYOURNAME': 'What is your name', 'MYNAMEIS': 'My name is',
-        'NICETOMEETYOU': 'Nice to meet you', 'WHEREAREYOUFROM': 'Where are you from',
-        'CANYOUHELPME': 'Can you help me', 'IDONTUNDERSTAND': "I don't understand",
-        'GOODMORNING': 'Good morning', 'GOODNIGHT': 'Good night',
-        'SEEYOULATER': 'See you later', 'HAVEANICEDAY': 'Have a nice day'
-    },
-    
-    'fr': {
-        # Version française
-        'I': 'Je', 'YOU': 'Tu', 'HE': 'Il', 'SHE': 'Elle', 'WE': 'Nous',
-        'THEY': 'Ils', 'ME': 'Moi', 'MY': 'Mon', 'YOUR': 'Ton', 'OUR': 'Notre',
-        'THEIR': 'Leur', 'HIS': 'Son', 'HER': 'Sa', 'IT': 'Il', 'ITS': 'Son',
-        
-        'BE': 'Être', 'IS': 'Est', 'ARE': 'Sont', 'AM': 'Suis', 'HAVE': 'Avoir',
-        'HAS': 'A', 'DO': 'Faire', 'DONT': 'Ne pas', 'CAN': 'Pouvoir',
-        'CANNOT': 'Ne peut pas', 'WILL': 'Vouloir', 'WOULD': 'Voudrait',
-        'SHOULD': 'Devrait', 'COULD': 'Pourrait', 'MAY': 'Peut-être',
-        'MIGHT': 'Pourrait', 'MUST': 'Doit', 'WANT': 'Vouloir',
-        'NEED': 'Avoir besoin', 'LIKE': 'Aimer', 'LOVE': 'Aimer', 'HATE': 'Détester',
-        
-        'HELLO': 'Bonjour', 'HI': 'Salut', 'GOODBYE': 'Au revoir', 'BYE': 'Salut',
-        'WELCOME': 'Bienvenue', 'THANKS': 'Merci', 'THANKYOU': 'Merci',
-        'PLEASE': 'S il vous plaît', 'SORRY': 'Désolé', 'EXCUSEME': 'Excusez-moi',
-        'YES': 'Oui', 'NO': 'Non', 'OK': 'D accord', 'FINE': 'Bien', 'GOOD': 'Bon',
-        'BAD': 'Mauvais', 'WELL': 'Bien', 'GREAT': 'Génial', 'PERFECT': 'Parfait',
-        'MAYBE': 'Peut-être', 'SURE': 'Bien sûr', 'NOT': 'Pas',
-        
-        'WHAT': 'Quoi', 'WHERE': 'Où', 'WHEN': 'Quand', 'WHY': 'Pourquoi',
-        'HOW': 'Comment', 'WHO': 'Qui', 'WHICH': 'Quel', 'WHOSE': 'À qui',
-        
-        'FAMILY': 'Famille', 'FATHER': 'Père', 'MOTHER': 'Mère',
-        'PARENTS': 'Parents', 'SON': 'Fils', 'DAUGHTER': 'Fille',
-        'BROTHER': 'Frère', 'SISTER': 'Sœur', 'BABY': 'Bébé',
-        'CHILD': 'Enfant', 'MAN': 'Homme', 'WOMAN': 'Femme', 'BOY': 'Garçon',
-        'GIRL': 'Fille', 'FRIEND': 'Ami', 'NAME': 'Nom',
-        
-        'HAPPY': 'Heureux', 'SAD': 'Triste', 'ANGRY': 'En colère',
-        'EXCITED': 'Excité', 'SCARED': 'Peur', 'CALM': 'Calme',
-        'TIRED': 'Fatigué', 'SICK': 'Malade',
-        
-        'HOME': 'Maison', 'HOUSE': 'Maison', 'ROOM': 'Pièce',
-        'BATHROOM': 'Salle de bain', 'BEDROOM': 'Chambre',
-        'KITCHEN': 'Cuisine', 'SCHOOL': 'École', 'WORK': 'Travail',
-        'OFFICE': 'Bureau', 'HOSPITAL': 'Hôpital', 'PARK': 'Parc',
-        'STORE': 'Magasin', 'CITY': 'Ville',
-        
-        'FOOD': 'Nourriture', 'EAT': 'Manger', 'DRINK': 'Boire',
-        'WATER': 'Eau', 'HUNGRY': 'Faim', 'THIRSTY': 'Soif',
-        'BREAD': 'Pain', 'MEAT': 'Viande', 'FRUIT': 'Fruit', 'MILK': 'Lait',
-        'COFFEE': 'Café',
-        
-        'GO': 'Aller', 'COME': 'Venir', 'SEE': 'Voir', 'LOOK': 'Regarder',
-        'HEAR': 'Entendre', 'LISTEN': 'Écouter', 'SPEAK': 'Parler',
-        'TALK': 'Parler', 'SAY': 'Dire', 'ASK': 'Demander',
-        'ANSWER': 'Répondre', 'THINK': 'Penser', 'KNOW': 'Savoir',
-        'UNDERSTAND': 'Comprendre', 'REMEMBER': 'Se souvenir',
-        'FORGET': 'Oublier', 'HELP': 'Aider', 'STOP': 'Arrêter',
-        'START': 'Commencer', 'WAIT': 'Attendre', 'SIT': 'S asseoir',
-        'STAND': 'Se lever', 'WALK': 'Marcher', 'RUN': 'Courir',
-        'SLEEP': 'Dormir', 'WAKE': 'Se réveiller',
-        
-        'BOOK': 'Livre', 'PEN': 'Stylo', 'PAPER': 'Papier', 'PHONE': 'Téléphone',
-        'COMPUTER': 'Ordinateur', 'CAR': 'Voiture', 'BUS': 'Bus',
-        'TRAIN': 'Train', 'BED': 'Lit', 'TABLE': 'Table', 'CHAIR': 'Chaise',
-        'DOOR': 'Porte', 'WINDOW': 'Fenêtre', 'RED': 'Rouge', 'BLUE': 'Bleu',
-        'GREEN': 'Vert', 'YELLOW': 'Jaune', 'BLACK': 'Noir', 'WHITE': 'Blanc',
-        
-        'TIME': 'Temps', 'DAY': 'Jour', 'NIGHT': 'Nuit', 'TODAY': 'Aujourd hui',
-        'TOMORROW': 'Demain', 'NOW': 'Maintenant', 'LATER': 'Plus tard',
-        'ONE': 'Un', 'TWO': 'Deux', 'THREE': 'Trois', 'FOUR': 'Quatre',
-        'FIVE': 'Cinq', 'TEN': 'Dix',
-        
-        'ILOVEYOU': 'Je t aime', 'HOWAREYOU': 'Comment allez-vous',
-        'WHATISYOURNAME': 'Comment vous appelez-vous', 'MYNAMEIS': 'Je m appelle',
-        'NICETOMEETYOU': 'Enchanté de vous rencontrer',
-        'WHEREAREYOUFROM': 'D où venez-vous', 'CANYOUHELPME': 'Pouvez-vous m aider',
-        'IDONTUNDERSTAND': 'Je ne comprends pas', 'GOODMORNING': 'Bonjour',
-        'GOODNIGHT': 'Bonne nuit', 'SEEYOULATER': 'À plus tard',
-        'HAVEANICEDAY': 'Bonne journée'
-    },
-    
-    'ar': {
-        # Version arabe
-        'I': 'أنا', 'YOU': 'أنت', 'HE': 'هو', 'SHE': 'هي', 'WE': 'نحن',
-        'THEY': 'هم', 'ME': 'أنا', 'MY': 'لي', 'YOUR': 'لك', 'OUR': 'لنا',
-        'THEIR': 'لهم', 'HIS': 'له', 'HER': 'لها', 'IT': 'هو', 'ITS': 'له',
-        
-        'BE': 'يكون', 'IS': 'هو', 'ARE': 'هم', 'AM': 'أنا', 'HAVE': 'يملك',
-        'HAS': 'يملك', 'DO': 'يفعل', 'DONT': 'لا', 'CAN': 'يستطيع',
-        'CANNOT': 'لا يستطيع', 'WILL': 'سوف', 'WOULD': 'سوف', 'SHOULD': 'يجب',
-        'COULD': 'يمكن', 'MAY': 'قد', 'MIGHT': 'قد', 'MUST': 'يجب',
-        'WANT': 'يريد', 'NEED': 'يحتاج', 'LIKE': 'يحب', 'LOVE': 'يحب',
-        'HATE': 'يكره',
-        
-        'HELLO': 'مرحبا', 'HI': 'أهلا', 'GOODBYE': 'مع السلامة', 'BYE': 'وداعا',
-        'WELCOME': 'أهلا وسهلا', 'THANKS': 'شكرا', 'THANKYOU': 'شكرا لك',
-        'PLEASE': 'من فضلك', 'SORRY': 'آسف', 'EXCUSEME': 'اعذرني',
-        'YES': 'نعم', 'NO': 'لا', 'OK': 'موافق', 'FINE': 'بخير', 'GOOD': 'جيد',
-        'BAD': 'سيء', 'WELL': 'جيد', 'GREAT': 'عظيم', 'PERFECT': 'ممتاز',
-        'MAYBE': 'ربما', 'SURE': 'بالتأكيد', 'NOT': 'ليس',
-        
-        'WHAT': 'ماذا', 'WHERE': 'أين', 'WHEN': 'متى', 'WHY': 'لماذا',
-        'HOW': 'كيف', 'WHO': 'من', 'WHICH': 'أي', 'WHOSE': 'لمن',
-        
-        'FAMILY': 'عائلة', 'FATHER': 'أب', 'MOTHER': 'أم',
-        'PARENTS': 'والدان', 'SON': 'ابن', 'DAUGHTER': 'ابنة',
-        'BROTHER': 'أخ', 'SISTER': 'أخت', 'BABY': 'طفل',
-        'CHILD': 'طفل', 'MAN': 'رجل', 'WOMAN': 'امرأة', 'BOY': 'ولد',
-        'GIRL': 'بنت', 'FRIEND': 'صديق', 'NAME': 'اسم',
-        
-        'HAPPY': 'سعيد', 'SAD': 'حزين', 'ANGRY': 'غاضب',
-        'EXCITED': 'متحمس', 'SCARED': 'خائف', 'CALM': 'هادئ',
-        'TIRED': 'متعب', 'SICK': 'مريض',
-        
-        'HOME': 'بيت', 'HOUSE': 'منزل', 'ROOM': 'غرفة',
-        'BATHROOM': 'حمام', 'BEDROOM': 'غرفة نوم', 'KITCHEN': 'مطبخ',
-        'SCHOOL': 'مدرسة', 'WORK': 'عمل', 'OFFICE': 'مكتب',
-        'HOSPITAL': 'مستشفى', 'PARK': 'حديقة', 'STORE': 'متجر',
-        'CITY': 'مدينة',
-        
-        'FOOD': 'طعام', 'EAT': 'يأكل', 'DRINK': 'يشرب', 'WATER': 'ماء',
-        'HUNGRY': 'جوعان', 'THIRSTY': 'عطشان', 'BREAD': 'خبز',
-        'MEAT': 'لحم', 'FRUIT': 'فاكهة', 'MILK': 'حليب', 'COFFEE': 'قهوة',
-        
-        'GO': 'يذهب', 'COME': 'يأتي', 'SEE': 'يرى', 'LOOK': 'ينظر',
-        'HEAR': 'يسمع', 'LISTEN': 'يستمع', 'SPEAK': 'يتكلم',
-        'TALK': 'يتحدث', 'SAY': 'يقول', 'ASK': 'يسأل', 'ANSWER': 'يجيب',
-        'THINK': 'يفكر', 'KNOW': 'يعرف', 'UNDERSTAND': 'يفهم',
-        'REMEMBER': 'يتذكر', 'FORGET': 'ينسى', 'HELP': 'يساعد',
-        'STOP': 'يتوقف', 'START': 'يبدأ', 'WAIT': 'ينتظر', 'SIT': 'يجلس',
-        'STAND': 'يقف', 'WALK': 'يمشي', 'RUN': 'يركض', 'SLEEP': 'ينام',
-        'WAKE': 'يستيقظ',
-        
-        'BOOK': 'كتاب', 'PEN': 'قلم', 'PAPER': 'ورقة', 'PHONE': 'هاتف',
-        'COMPUTER': 'كمبيوتر', 'CAR': 'سيارة', 'BUS': 'حافلة',
-        'TRAIN': 'قطار', 'BED': 'سرير', 'TABLE': 'طاولة', 'CHAIR': 'كرسي',
-        'DOOR': 'باب', 'WINDOW': 'نافذة', 'RED': 'أحمر', 'BLUE': 'أزرق',
-        'GREEN': 'أخضر', 'YELLOW': 'أصفر', 'BLACK': 'أسود', 'WHITE': 'أبيض',
-        
-        'TIME': 'وقت', 'DAY': 'يوم', 'NIGHT': 'ليل', 'TODAY': 'اليوم',
-        'TOMORROW': 'غدا', 'NOW': 'الآن', 'LATER': 'لاحقا',
-        'ONE': 'واحد', 'TWO': 'اثنان', 'THREE': 'ثلاثة', 'FOUR': 'أربعة',
-        'FIVE': 'خمسة', 'TEN': 'عشرة',
-        
-        'ILOVEYOU': 'أحبك', 'HOWAREYOU': 'كيف حالك',
-        'WHATISYOURNAME': 'ما اسمك', 'MYNAMEIS': 'اسمي هو',
-        'NICETOMEETYOU': 'تشرفت بلقائك', 'WHEREAREYOUFROM': 'من أين أنت',
-        'CANYOUHELPME': 'هل يمكنك مساعدتي', 'IDONTUNDERSTAND': 'أنا لا أفهم',
-        'GOODMORNING': 'صباح الخير', 'GOODNIGHT': 'تصبح على خير',
-        'SEEYOULATER': 'أراك لاحقا', 'HAVEANICEDAY': 'أتمنى لك يوما سعيدا'
-    }
-}
-
-def detect_semantic_words(text):
-    """Détection optimisée des mots sémantiques"""
-    text_upper = text.upper().replace(' ', '')
-    detected_words = []
-    remaining_text = text_upper
-    
-    # Chercher les mots du plus long au plus court (optimisation)
-    for word_length in range(20, 1, -1):  # Mots de 20 lettres à 2 lettres
-        for word in SEMANTIC_TRANSLATIONS['en']:
-            if len(word) == word_length and word in remaining_text:
-                detected_words.append(word)
-                remaining_text = remaining_text.replace(word, '', 1)
-    
-    return detected_words, remaining_text
+def parse_args(argv=None):
+    p = argparse.ArgumentParser()
+    p.add_argument('--model', default=MODEL_PATH,
+                   help='pixel CNN (.h5/.tflite) or landmark MLP (asl_landmarks_latest.h5/.npz)')
+    p.add_argument('--serial', action='store_true', help='run all stages in one loop (no worker threads)')
+    p.add_argument('--source', default='0',
+                   help="camera index, video file, image folder or 'synthetic[:N]'")
+    p.add_argument('--realtime', action='store_true', help='pace file/synthetic sources at their fps')
+    p.add_argument('--width', type=int, default=None)
+    p.add_argument('--height', type=int, default=None)
+    p.add_argument('--fps', type=int, default=None)
+    p.add_argument('--fourcc', default=None, help="e.g. MJPG")
+    p.add_argument('--headless', action='store_true', help='no window: emit JSONL events instead')
+    p.add_argument('--events', default=None,
+                   help="JSONL event output, '-' for stdout (default: '-' when --headless)")
+    p.add_argument('--auto_commit', type=int, default=None,
+                   help='commit a letter after N stable frames, once per held sign (default: 15 when --headless, else off)')
+    p.add_argument('--metrics', default=None,
+                   help='dump stage histograms to this file (.prom: Prometheus text, else JSON)')
+    p.add_argument('--metrics_interval', type=float, default=10.0, help='seconds between dumps')
+    p.add_argument('--no_metrics', action='store_true', help='disable stage timers entirely')
+    p.add_argument('--trace', default=None,
+                   help='record stage spans and write a Chrome trace JSON here on exit (and on P)')
+    p.add_argument('--trace_capacity', type=int, default=200000, help='spans kept in the ring buffer')
+    p.add_argument('--log_level', default=None,
+                   help='DEBUG shows per-frame predictions (default: $ASL_LOG_LEVEL or INFO)')
+    p.add_argument('--log_json', action='store_true', help='log as JSON lines')
+    return p.parse_args(argv)
 
-def smart_translation(current_word, language, translation_mode):
-    """Traduction intelligente optimisée"""
-    if not translation_mode or not current_word.strip():
-        return current_word
-    
-    detected_words, remaining = detect_semantic_words(current_word)
-    
-    if detected_words:
-        # Traduire les mots détectés
-        translated_parts = []
-        for word in detected_words:
-            if word in SEMANTIC_TRANSLATIONS[language]:
-                translated_parts.append(SEMANTIC_TRANSLATIONS[language][word])
-        
-        # Ajouter les lettres restantes
-        if remaining:
-            translated_parts.append(remaining)
-        
-        return ' '.join(translated_parts)
-    else:
-        return current_word
 
-def draw_arabic_text(image, text, position, font_size=30, color=(255, 255, 0)):
-    """Dessiner du texte arabe sur une image OpenCV"""
-    try:
-        image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        image_pil = Image.fromarray(image_rgb)
-        draw = ImageDraw.Draw(image_pil)
-        
-        font_paths = [
-            "C:/Windows/Fonts/arial.ttf",
-            "C:/Windows/Fonts/tahoma.ttf",  
-            "C:/Windows/Fonts/segoeui.ttf",
-        ]
-        
-        font = None
-        for font_path in font_paths:
-            try:
-                font = ImageFont.truetype(font_path, font_size)
-                break
-            except:
-                continue
-                
-        if font is None:
-            font = ImageFont.load_default()
-        
-        draw.text(position, text, font=font, fill=color)
-        return cv2.cvtColor(np.array(image_pil), cv2.COLOR_RGB2BGR)
-        
-    except Exception as e:
-        print(f"❌ Erreur affichage arabe: {e}")
-        return image
-
-def main():
-    model = load_trained_model(MODEL_PATH)
-    labels = load_labels(models_dir='models')
+def main(argv=None, source=None):
+    """source: any sources.FrameSource (or cv2.VideoCapture-like object);
+    defaults to the one described by --source."""
+    args = parse_args(argv)
+    if args.headless and args.events is None:
+        args.events = '-'
+    # keep stdout clean for JSONL events in headless mode
+    log = setup_logging(level=args.log_level, stream=sys.stderr if args.events == '-' else sys.stdout,
+                        json_lines=args.log_json)
+    # a retrained asl_model_latest.h5 is picked up without restarting the session
+    watcher = ModelWatcher(args.model, models_dir='models').start()
+    model, labels, model_version = watcher.current
+    # reused across frames: no per-frame preprocessing allocations
+    preprocess = Preprocessor.for_model(model, img_size=64)
+    use_landmarks = getattr(model, 'input_kind', 'float') == 'landmarks'
 
     mp_hands = mp.solutions.hands
     hands = mp_hands.Hands(
@@ -313,85 +73,124 @@ def main():
         min_tracking_confidence=0.5
     )
 
-    cap = cv2.VideoCapture(0)
+    if source is None:
+        source = open_source(args.source, realtime=args.realtime, width=args.width,
+                             height=args.height, fps=args.fps, fourcc=args.fourcc)
+    cap = source
     if not cap.isOpened():
-        print('Cannot open camera')
+        log.error('Cannot open camera')
         return
+    if hasattr(cap, 'settings'):
+        log.info(f"📷 Caméra: {cap.settings}")
+
+    tracer = Tracer(capacity=args.trace_capacity) if args.trace else None
+    metrics = Metrics(enabled=not args.no_metrics, tracer=tracer)
+    if args.metrics:
+        metrics.start_dumper(args.metrics, interval=args.metrics_interval)
+
+    def detect(packet):
+        rgb = cv2.cvtColor(packet.frame, cv2.COLOR_BGR2RGB)
+        with metrics.timer('hands_process', packet.seq):
+            results = hands.process(rgb)
+        packet.data['lm'] = results.multi_hand_landmarks[0] if results.multi_hand_landmarks else None
+
+    def classify(packet):
+        nonlocal model, labels, model_version, preprocess, use_landmarks
+        # swap in a freshly reloaded model between frames
+        if watcher.current[2] != model_version:
+            model, labels, model_version = watcher.current
+            preprocess = Preprocessor.for_model(model, img_size=64)
+            use_landmarks = getattr(model, 'input_kind', 'float') == 'landmarks'
+
+        lm = packet.data['lm']
+        packet.data['preds'] = None
+        packet.data['labels'] = labels
+        if lm is None:
+            return
+        frame = packet.frame
+        h, w, _ = frame.shape
+        with metrics.timer('roi_crop', packet.seq):
+            x_min, y_min, x_max, y_max = hand_bbox(lm, w, h, pad=PAD)
+            hand_roi = frame[y_min:y_max, x_min:x_max]
+        packet.data['bbox'] = (x_min, y_min, x_max, y_max)
+
+        if hand_roi.size != 0:
+            # landmark models classify the 21 keypoints, not the crop
+            with metrics.timer('preprocess', packet.seq):
+                x = landmark_features(lm, w, h) if use_landmarks else preprocess(hand_roi)
+            with metrics.timer('inference', packet.seq):
+                packet.data['preds'] = run_inference(model, x)
 
     # Variables
-    current_word = ""
     semantic_translation = ""
-    label_buffer = []
-    buffer_len = 8
     confidence_threshold = 0.7
-    last_prediction = None
+    # headless runs have no SPACE key: commit letters that stay stable (a
+    # held sign is committed once; repeating it takes a new winner or the
+    # hand leaving the frame)
+    auto_commit = args.auto_commit if args.auto_commit is not None else (15 if args.headless else None)
+    smoother = LetterSmoother(buffer_len=8, confidence_threshold=confidence_threshold,
+                              cooldown_frames=20, auto_commit_frames=auto_commit)
     language = 'en'
-    frame_count = 0
-    cooldown_frames = 0
     translation_mode = True
+    events = EventWriter(args.events) if args.events else None
 
-    print("🎯 SYSTÈME ASL - DICTIONNAIRE OPTIMISÉ (150 MOTS)")
-    print(f"📚 Mots disponibles: {len(SEMANTIC_TRANSLATIONS['en'])}")
-    print("⌨️  Touches: ESPACE=Ajouter, C=Effacer, D=Supprimer, F/A/E=Langue, T=Mode, Q=Quitter")
+    log.info("🎯 SYSTÈME ASL - DICTIONNAIRE OPTIMISÉ (150 MOTS)")
+    log.info(f"📚 Mots disponibles: {len(SEMANTIC_TRANSLATIONS['en'])}")
+    if not args.headless:
+        log.info("⌨️  Touches: ESPACE=Ajouter, C=Effacer, D=Supprimer, F/A/E=Langue, T=Mode, Q=Quitter")
 
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
+    def on_commit(token):
+        # Détection et affichage des mots
+        detected_words, _ = detect_semantic_words(smoother.current_word)
+        if detected_words and translation_mode:
+            log.info(f"🎯 Mots détectés: {detected_words}")
+            for word in detected_words:
+                log.info(f"   → {word}: {SEMANTIC_TRANSLATIONS[language][word]}")
+        if events:
+            latency = smoother.last_commit_latency
+            events.emit('commit', letter=token, word=smoother.current_word,
+                        translation=smart_translation(smoother.current_word, language, translation_mode),
+                        glass_to_text_ms=None if latency is None else round(latency * 1000.0, 1))
 
-        frame_count += 1
+    t_start = time.perf_counter()
+    n_frames = 0
+    # unpaced file/synthetic sources must not lose frames: back-pressure instead of drop-oldest
+    drop_oldest = getattr(cap, 'realtime', True)
+    pipeline = Pipeline(cap, [('detect', detect), ('classify', classify)], drop_oldest=drop_oldest,
+                        threaded=not args.serial, metrics=metrics)
+    for packet in pipeline:
+        frame = packet.frame
+        n_frames += 1
         h, w, _ = frame.shape
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = hands.process(rgb)
 
-        if cooldown_frames > 0:
-            cooldown_frames -= 1
+        label, prob, top_k = None, 0.0, None
+        preds = packet.data['preds']
+        if preds is not None:
+            # labels of the model that produced preds (it may have been swapped since)
+            label, prob, top_k = decode_predictions(preds, packet.data['labels'], top_k=3)[0]
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug('🔍 prediction', extra={'every': 0.5, 'fields': {
+                    'frame': packet.seq, 'label': label, 'prob': round(prob, 3),
+                    'top_3': ','.join(f'{l}:{p:.2f}' for l, p in top_k)}})
 
-        current_prediction = None
-        current_confidence = 0
+        current_prediction, current_confidence, committed = smoother.update(label, prob,
+                                                                            t_capture=packet.t_capture)
+        if committed:
+            on_commit(committed)
 
-        if results.multi_hand_landmarks and cooldown_frames == 0:
-            lm = results.multi_hand_landmarks[0]
-            x_coords = [int(p.x * w) for p in lm.landmark]
-            y_coords = [int(p.y * h) for p in lm.landmark]
-            
-            bbox_size = max(max(x_coords) - min(x_coords), max(y_coords) - min(y_coords))
-            x_center = (min(x_coords) + max(x_coords)) // 2
-            y_center = (min(y_coords) + max(y_coords)) // 2
-            
-            x_min = max(x_center - bbox_size//2 - PAD, 0)
-            x_max = min(x_center + bbox_size//2 + PAD, w)
-            y_min = max(y_center - bbox_size//2 - PAD, 0)
-            y_max = min(y_center + bbox_size//2 + PAD, h)
-
-            hand_roi = frame[y_min:y_max, x_min:x_max]
-            if hand_roi.size != 0:
-                x = preprocess_image_bgr(hand_roi, img_size=64)
-                preds = model.predict(x, verbose=0)
+        if events:
+            events.emit('frame', **frame_event_fields(packet, label=label, prob=prob if label else None,
+                                                      top_k=top_k, bbox=packet.data.get('bbox')))
 
-                idx = int(np.argmax(preds))
-                prob = float(np.max(preds))
-                label = labels[idx]
-
-                if frame_count % 15 == 0:
-                    top_3 = np.argsort(preds[0])[-3:][::-1]
-                    print(f"\n🔍 Frame {frame_count}: {labels[top_3[0]]}({preds[0][top_3[0]]*100:.1f}%)")
-
-                if prob > confidence_threshold:
-                    label_buffer.append((label, prob))
-                    if len(label_buffer) > buffer_len:
-                        label_buffer.pop(0)
-
-                    if label_buffer:
-                        votes = {}
-                        for L, P in label_buffer:
-                            votes[L] = votes.get(L, 0) + (P * 10)
-                        
-                        current_prediction = max(votes.items(), key=lambda x: x[1])[0]
-                        current_confidence = max(p for l, p in label_buffer if l == current_prediction)
+        # capture -> prediction available, whatever the output
+        metrics.frame(packet.seq, packet.t_capture, time.perf_counter())
+        if args.headless:
+            continue
 
+        current_word = smoother.current_word
         # TRADUCTION SÉMANTIQUE OPTIMISÉE
-        semantic_translation = smart_translation(current_word, language, translation_mode)
+        with metrics.timer('translation', packet.seq):
+            semantic_translation = smart_translation(current_word, language, translation_mode)
 
         # Interface utilisateur
         display_text = "Show hand 👋"
@@ -400,98 +199,85 @@ def main():
         if current_prediction and current_confidence > confidence_threshold:
             display_text = f"{current_prediction} ({current_confidence*100:.1f}%)"
             display_color = (0, 255, 0) if current_confidence > 0.8 else (0, 255, 255)
-            last_prediction = current_prediction
 
-        # Dessiner l'interface
-        cv2.rectangle(frame, (0, 0), (w, 150), (50, 50, 50), -1)
-        
-        # Mot en cours
-        cv2.putText(frame, f"LETTERS: {current_word}", (10, 25), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-        
-        # Traduction
-        mode_text = "🔤 TRADUCTION" if translation_mode else "🔠 LETTRES"
-        if language == 'ar':
-            frame = draw_arabic_text(frame, f"{mode_text}: {semantic_translation}", 
-                                   (10, 50), font_size=18, color=(255, 255, 0))
-        else:
-            cv2.putText(frame, f"{mode_text}: {semantic_translation}", (10, 50), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
-        
-        # Détection actuelle
-        cv2.putText(frame, f"DETECTED: {display_text}", (10, 80), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, display_color, 2)
-        
-        # Info mots détectés
-        detected_words, _ = detect_semantic_words(current_word)
-        if detected_words and translation_mode:
-            cv2.putText(frame, f"WORDS: {', '.join(detected_words[:3])}", (10, 105), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 255, 255), 1)
-        
-        # Instructions
-        cv2.putText(frame, "SPACE:Add  C:Clear  D:Del  F/A/E:Lang  T:Mode  Q:Quit", 
-                   (10, 130), cv2.FONT_HERSHEY_SIMPLEX, 0.35, (200, 200, 200), 1)
+        with metrics.timer('render', packet.seq):
+            frame = draw_hud(frame, current_word, semantic_translation, display_text, display_color,
+                             language, translation_mode)
 
-        cv2.imshow('ASL - Optimized Dictionary (150 words)', frame)
+            cv2.imshow('ASL - Optimized Dictionary (150 words)', frame)
 
         # Gestion des touches
         key = cv2.waitKey(1) & 0xFF
         
         if key == ord(' '):  # ESPACE - Ajouter lettre
-            if last_prediction and last_prediction != 'nothing':
-                if last_prediction == 'space':
-                    current_word += ' '
-                elif last_prediction == 'del':
-                    current_word = current_word[:-1] if current_word else ""
-                else:
-                    current_word += last_prediction
-                
-                # Détection et affichage des mots
-                detected_words, _ = detect_semantic_words(current_word)
-                if detected_words and translation_mode:
-                    print(f"🎯 Mots détectés: {detected_words}")
-                    for word in detected_words:
-                        print(f"   → {word}: {SEMANTIC_TRANSLATIONS[language][word]}")
-                
-                cooldown_frames = 20
+            token = smoother.commit(now=time.perf_counter())
+            if token:
+                on_commit(token)
                 
         elif key == ord('c'):  # C - Effacer
-            current_word = ""
-            print("🗑️ Mot effacé")
+            smoother.current_word = ""
+            log.info("🗑️ Mot effacé")
             
         elif key == ord('d') and current_word:  # D - Supprimer
             removed = current_word[-1]
-            current_word = current_word[:-1]
-            print(f"⌫ Supprimé: '{removed}'")
+            smoother.current_word = current_word[:-1]
+            log.info(f"⌫ Supprimé: '{removed}'")
                 
         elif key == ord('f'):  # F - Français
             language = 'fr'
-            print("🇫🇷 Langue: Français")
+            log.info("🇫🇷 Langue: Français")
             
         elif key == ord('a'):  # A - Arabe
             language = 'ar' 
-            print("🇸🇦 اللغة: العربية")
+            log.info("🇸🇦 اللغة: العربية")
             
         elif key == ord('e'):  # E - English
             language = 'en'
-            print("🇺🇸 Language: English")
+            log.info("🇺🇸 Language: English")
             
         elif key == ord('t'):  # T - Basculer mode
             translation_mode = not translation_mode
             mode_name = "TRADUCTION" if translation_mode else "LETTRES"
-            print(f"🔁 Mode: {mode_name}")
+            log.info(f"🔁 Mode: {mode_name}")
+            
+        elif key == ord('p') and tracer:  # P - Exporter la trace
+            log.info(f"🧵 Trace: {tracer.dump(args.trace)} événements -> {args.trace}")
             
         elif key == ord('q'):  # Q - Quitter
             break
 
+    pipeline.stop()
+    pipeline.join()
+    elapsed = time.perf_counter() - t_start
+    log.info(f"⏱️ {n_frames} frames en {elapsed:.1f}s ({n_frames / max(elapsed, 1e-9):.1f} FPS), "
+        f"{pipeline.dropped} ignorées")
+    metrics.stop(args.metrics)
+    if tracer:
+        tracer.dump(args.trace)
+    if args.metrics:
+        log.info('stage timings\n' + metrics.summary())
     cap.release()
-    cv2.destroyAllWindows()
+    if not args.headless:
+        cv2.destroyAllWindows()
+    watcher.stop()
+
+    current_word = smoother.current_word
+    if events:
+        events.emit('session_end', word=current_word, frames=n_frames, fps=n_frames / max(elapsed, 1e-9),
+                    latency=smoother.latency_summary())
+        events.close()
     
-    print(f"\n🎉 Session terminée!")
-    print(f"📝 Mot final: '{current_word}'")
+    log.info("🎉 Session terminée!")
+    log.info(f"📝 Mot final: '{current_word}'")
+    # glass-to-text: pose on camera -> vote winner / letter in current_word
+    for kind, name in (('stable', 'Prédiction stable'), ('commit', 'Lettre validée')):
+        st = smoother.latency_summary()[kind]
+        if st['count']:
+            log.info(f"⏱️ {name}: p50 {st['p50_ms']:.0f} ms | p95 {st['p95_ms']:.0f} ms | "
+                f"max {st['max_ms']:.0f} ms (n={st['count']})")
     if translation_mode and current_word:
         final_translation = smart_translation(current_word, language, True)
-        print(f"🌍 Traduction: '{final_translation}'")
+        log.info(f"🌍 Traduction: '{final_translation}'")
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,130 @@
+import os
+import sys
+import json
+import time
+import queue
+import atexit
+import logging
+import threading
+import logging.handlers
+
+# Diagnostic output of the live loops, off the hot path. Loggers put raw
+# records on a bounded queue (no formatting, no I/O on the calling thread);
+# a QueueListener thread formats and writes them. Per-message rate limits
+# and structured fields ride on the standard `extra` argument:
+#
+#   log.debug('prediction', extra={'fields': {'label': 'A', 'prob': 0.93}, 'every': 1.0})
+#
+# 'every' lets at most one record per (logger, message) through every that
+# many seconds; the next one that passes reports how many were suppressed.
+# The message is the unformatted format string: pass the variable parts as
+# arguments (log.warning('failed: %s', e, ...)), not in an f-string, or
+# each distinct text escapes the limit.
+
+LOGGER_NAME = 'asl'
+
+
+def get_logger(name=None):
+    return logging.getLogger(LOGGER_NAME if not name else f'{LOGGER_NAME}.{name}')
+
+
+class RateLimitFilter(logging.Filter):
+    def __init__(self):
+        super().__init__()
+        self._last = {}
+        self._suppressed = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        every = getattr(record, 'every', None)
+        if not every:
+            return True
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            last = self._last.get(key)
+            if last is not None and now - last < every:
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                return False
+            self._last[key] = now
+            record.suppressed = self._suppressed.pop(key, 0)
+        return True
+
+
+class StructuredFormatter(logging.Formatter):
+    """'time level name: message key=value ...', or one JSON object per line."""
+
+    def __init__(self, json_lines=False):
+        super().__init__('%(asctime)s %(levelname)-7s %(name)s: %(message)s', datefmt='%H:%M:%S')
+        self.json_lines = json_lines
+
+    def format(self, record):
+        fields = dict(getattr(record, 'fields', None) or {})
+        if getattr(record, 'suppressed', 0):
+            fields['suppressed'] = record.suppressed
+        if self.json_lines:
+            entry = {'ts': round(record.created, 6), 'level': record.levelname, 'logger': record.name,
+                     'msg': record.getMessage(), **fields}
+            if record.exc_info:
+                entry['exc'] = self.formatException(record.exc_info)
+            return json.dumps(entry, ensure_ascii=False, default=str)
+        text = super().format(record)
+        if fields:
+            text += ' ' + ' '.join(f'{k}={v}' for k, v in fields.items())
+        return text
+
+
+class _NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    # a full queue drops the record rather than stalling the frame loop
+    def __init__(self, q):
+        super().__init__(q)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # formatting is left to the listener thread
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_listener = None
+
+
+def setup_logging(level=None, stream=None, json_lines=False, queue_size=10000):
+    """Route the 'asl' loggers through a background writer thread.
+
+    level defaults to $ASL_LOG_LEVEL or INFO; stream to sys.stdout.
+    Calling it again reconfigures. The writer is flushed at exit.
+    """
+    global _listener
+    shutdown_logging()
+    level = level or os.environ.get('ASL_LOG_LEVEL', 'INFO')
+    out = logging.StreamHandler(stream or sys.stdout)
+    out.setFormatter(StructuredFormatter(json_lines=json_lines))
+
+    q = queue.Queue(maxsize=queue_size)
+    handler = _NonBlockingQueueHandler(q)
+    handler.addFilter(RateLimitFilter())
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.handlers[:] = [handler]
+    logger.setLevel(level.upper() if isinstance(level, str) else level)
+    logger.propagate = False
+
+    _listener = logging.handlers.QueueListener(q, out)
+    _listener.start()
+    return logger
+
+
+def shutdown_logging():
+    """Stop the writer thread after it has written everything queued."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,203 @@
+import os
+import json
+import time
+import bisect
+import threading
+import contextlib
+
+# Always-on stage timing for the live loops. Each timed stage feeds a
+# fixed-bucket histogram (a bisect and two additions per observation, so
+# the cost is a couple of microseconds against a ~30 ms frame). Snapshots
+# can be dumped periodically as JSON or Prometheus text format.
+
+# upper bounds in seconds, Prometheus style (+Inf is implicit)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+class Histogram:
+    """Counts of observations per bucket, plus their sum."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.sum += value
+            self.count += 1
+
+    def snapshot(self):
+        with self._lock:
+            return list(self.counts), self.sum, self.count
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-quantile (None if empty)."""
+        counts, _, count = self.snapshot()
+        if not count:
+            return None
+        target = q * count
+        seen = 0
+        for bound, c in zip(self.buckets + (float('inf'),), counts):
+            seen += c
+            if seen >= target:
+                return bound
+        return float('inf')
+
+
+class _Timer:
+    __slots__ = ('hist', 'tracer', 'name', 'frame_id', 't0')
+
+    def __init__(self, hist, tracer, name, frame_id):
+        self.hist = hist
+        self.tracer = tracer
+        self.name = name
+        self.frame_id = frame_id
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        t1 = time.perf_counter()
+        if self.hist is not None:
+            self.hist.observe(t1 - self.t0)
+        if self.tracer is not None:
+            self.tracer.add(self.name, self.t0, t1, self.frame_id)
+        return False
+
+
+_NULL_TIMER = contextlib.nullcontext()
+
+
+class Metrics:
+    """Registry of stage histograms.
+
+    metrics.timer('inference', frame_id) is a context manager timing its
+    block; metrics.record(name, t0, t1, frame_id) records an already
+    measured span. With a tracing.Tracer attached, the same calls also
+    feed the timeline. With enabled=False and no tracer they are no-ops,
+    so call sites need no checks.
+    """
+
+    def __init__(self, enabled=True, buckets=DEFAULT_BUCKETS, prefix='asl', tracer=None):
+        self.enabled = enabled
+        self.tracer = tracer
+        self.buckets = tuple(buckets)
+        self.prefix = prefix
+        self.histograms = {}
+        self._lock = threading.Lock()
+        self._dumper = None
+        self._stop = threading.Event()
+
+    def histogram(self, name):
+        hist = self.histograms.get(name)
+        if hist is None:
+            with self._lock:
+                hist = self.histograms.setdefault(name, Histogram(self.buckets))
+        return hist
+
+    def observe(self, name, seconds):
+        if self.enabled:
+            self.histogram(name).observe(seconds)
+
+    def record(self, name, t0, t1, frame_id=None):
+        if self.enabled:
+            self.histogram(name).observe(t1 - t0)
+        if self.tracer is not None:
+            self.tracer.add(name, t0, t1, frame_id)
+
+    def frame(self, frame_id, t_capture, t_end):
+        """A whole frame, capture to result."""
+        if self.enabled:
+            self.histogram('frame').observe(t_end - t_capture)
+        if self.tracer is not None:
+            self.tracer.frame(frame_id, t_capture, t_end)
+
+    def timer(self, name, frame_id=None):
+        if not self.enabled and self.tracer is None:
+            return _NULL_TIMER
+        return _Timer(self.histogram(name) if self.enabled else None, self.tracer, name, frame_id)
+
+    def to_dict(self):
+        stages = {}
+        for name, hist in list(self.histograms.items()):
+            counts, total, count = hist.snapshot()
+            stages[name] = {
+                'count': count,
+                'sum_s': total,
+                'mean_ms': total / count * 1000.0 if count else None,
+                'p50_le_ms': _ms(hist.quantile(0.5)),
+                'p95_le_ms': _ms(hist.quantile(0.95)),
+                'p99_le_ms': _ms(hist.quantile(0.99)),
+                'buckets_le_s': list(self.buckets) + ['+Inf'],
+                'counts': counts,
+            }
+        return {'timestamp': time.time(), 'stages': stages}
+
+    def to_prometheus(self):
+        family = f'{self.prefix}_stage_duration_seconds'
+        lines = [f'# HELP {family} Time spent per frame in each pipeline stage.',
+                 f'# TYPE {family} histogram']
+        for name, hist in sorted(self.histograms.items()):
+            counts, total, count = hist.snapshot()
+            cumulative = 0
+            for bound, c in zip(self.buckets + (float('inf'),), counts):
+                cumulative += c
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{family}_bucket{{stage="{name}",le="{le}"}} {cumulative}')
+            lines.append(f'{family}_sum{{stage="{name}"}} {total!r}')
+            lines.append(f'{family}_count{{stage="{name}"}} {count}')
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path):
+        """Write a snapshot to path: Prometheus text for .prom/.txt, JSON otherwise."""
+        if path.endswith(('.prom', '.txt')):
+            text = self.to_prometheus()
+        else:
+            text = json.dumps(self.to_dict(), indent=2)
+        # write-then-rename: scrapers never read a half-written file
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def start_dumper(self, path, interval=10.0):
+        """Dump to path every `interval` seconds from a daemon thread."""
+        if not self.enabled or self._dumper is not None:
+            return self
+
+        def run():
+            while not self._stop.wait(interval):
+                self.dump(path)
+
+        self._dumper = threading.Thread(target=run, name='metrics-dumper', daemon=True)
+        self._dumper.start()
+        return self
+
+    def stop(self, path=None):
+        """Stop the dumper; with path, write a last snapshot."""
+        self._stop.set()
+        if self._dumper is not None:
+            self._dumper.join(timeout=1.0)
+        if path and self.enabled:
+            self.dump(path)
+
+    def summary(self):
+        """One line per stage: count, mean and p95 bucket bound."""
+        lines = []
+        for name, st in self.to_dict()['stages'].items():
+            if st['count']:
+                lines.append(f"{name:<14} n={st['count']:<6} mean {st['mean_ms']:7.2f} ms | "
+                             f"p95 ≤ {st['p95_le_ms']} ms")
+        return '\n'.join(lines)
+
+
+def _ms(seconds):
+    if seconds is None:
+        return None
+    return 'inf' if seconds == float('inf') else round(seconds * 1000.0, 3)
@@ -0,0 +1,129 @@
+import numpy as np
+
+# TensorFlow-free runtimes for models exported by export_numpy.py. They
+# expose the same infer(x) / input_shape / input_kind / num_classes contract
+# as the Keras and TFLite backends in utils, so run_inference works unchanged.
+
+
+def relu(x):
+    return np.maximum(x, 0, out=x)
+
+
+def softmax(x):
+    x = x - x.max(axis=-1, keepdims=True)
+    np.exp(x, out=x)
+    x /= x.sum(axis=-1, keepdims=True)
+    return x
+
+
+ACTIVATIONS = {'relu': relu, 'softmax': softmax, 'linear': lambda x: x}
+
+
+class NumpyMLP:
+    """Dense stack (e.g. train_landmarks.build_landmark_mlp) in plain NumPy."""
+
+    input_kind = 'landmarks'
+
+    def __init__(self, weights, biases, activations):
+        self.weights = [np.ascontiguousarray(w, dtype=np.float32) for w in weights]
+        self.biases = [np.asarray(b, dtype=np.float32) for b in biases]
+        self.activations = [ACTIVATIONS[a] for a in activations]
+        self.input_shape = (None, self.weights[0].shape[0])
+        self.num_classes = int(self.weights[-1].shape[-1])
+
+    @classmethod
+    def from_npz(cls, data):
+        n = int(data['num_layers'])
+        return cls([data[f'W{i}'] for i in range(n)],
+                   [data[f'b{i}'] for i in range(n)],
+                   [str(a) for a in data['activations']])
+
+    def infer(self, x):
+        # one sample (63,) or a batch (N, 63)
+        x = np.asarray(x, dtype=np.float32)
+        if x.ndim == 1:
+            x = x[np.newaxis]
+        for w, b, act in zip(self.weights, self.biases, self.activations):
+            x = act(x @ w + b)
+        return x
+
+
+def conv2d(x, w, b):
+    """'valid', stride-1 convolution as im2col + one matmul.
+
+    x: (N, H, W, C), w: (kh, kw, C, F) Keras HWIO layout -> (N, H-kh+1, W-kw+1, F)
+    """
+    kh, kw, c, f = w.shape
+    n, h, wd, _ = x.shape
+    ho, wo = h - kh + 1, wd - kw + 1
+    # (N, Ho, Wo, C, kh, kw) view, reordered to match the kernel's (kh, kw, C)
+    windows = np.lib.stride_tricks.sliding_window_view(x, (kh, kw), axis=(1, 2))
+    cols = windows.transpose(0, 1, 2, 4, 5, 3).reshape(n * ho * wo, kh * kw * c)
+    out = cols @ w.reshape(kh * kw * c, f)
+    out += b
+    return out.reshape(n, ho, wo, f)
+
+
+def max_pool2d(x, size=2):
+    # 'valid' pooling with stride == size, like keras MaxPooling2D(2, 2)
+    n, h, w, c = x.shape
+    ho, wo = h // size, w // size
+    x = x[:, :ho * size, :wo * size]
+    return x.reshape(n, ho, size, wo, size, c).max(axis=(2, 4))
+
+
+class NumpyCNN:
+    """train.build_simple_cnn (Conv2D/MaxPool blocks, Flatten, Dense) in plain NumPy.
+
+    Takes the same float32 batch as the Keras model, i.e. the output of
+    preprocess_image_bgr / Preprocessor.
+    """
+
+    input_kind = 'float'
+
+    def __init__(self, layers, input_shape):
+        # layers: list of (type, params) with type in conv/pool/flatten/dense
+        self.layers = layers
+        self.input_shape = (None,) + tuple(int(d) for d in input_shape)
+        dense = [params for kind, params in layers if kind == 'dense']
+        self.num_classes = int(dense[-1][0].shape[-1])
+
+    @classmethod
+    def from_npz(cls, data):
+        layers = []
+        for i, kind in enumerate(str(t) for t in data['layer_types']):
+            if kind in ('conv', 'dense'):
+                params = (np.ascontiguousarray(data[f'W{i}'], dtype=np.float32),
+                          np.asarray(data[f'b{i}'], dtype=np.float32),
+                          ACTIVATIONS[str(data[f'act{i}'])])
+            elif kind == 'pool':
+                params = int(data[f'pool{i}'])
+            else:
+                params = None
+            layers.append((kind, params))
+        return cls(layers, data['input_shape'])
+
+    def infer(self, x):
+        x = np.asarray(x, dtype=np.float32)
+        for kind, params in self.layers:
+            if kind == 'conv':
+                w, b, act = params
+                x = act(conv2d(x, w, b))
+            elif kind == 'pool':
+                x = max_pool2d(x, params)
+            elif kind == 'flatten':
+                x = x.reshape(len(x), -1)
+            elif kind == 'dense':
+                w, b, act = params
+                x = act(x @ w + b)
+        return x
+
+
+def load_numpy_model(path):
+    with np.load(path) as data:
+        kind = str(data['kind'])
+        if kind == 'landmark_mlp':
+            return NumpyMLP.from_npz(data)
+        if kind == 'cnn':
+            return NumpyCNN.from_npz(data)
+    raise ValueError(f"Unknown NumPy model kind '{kind}' in {path}")
@@ -0,0 +1,199 @@
+import time
+import threading
+import collections
+
+# Capture -> detect -> classify -> render as a chain of threads connected by
+# small bounded queues. Each frame travels as a Packet tagged with its
+# capture sequence number, so whatever a stage computed is always drawn on
+# the frame it was computed from. cv2.imshow/waitKey must stay on the main
+# thread, so the last step (render) is simply the caller iterating over the
+# pipeline.
+
+END = object()
+
+
+class Packet:
+    """One captured frame plus everything the stages attached to it."""
+
+    __slots__ = ('seq', 'frame', 't_capture', 'data', 'timings')
+
+    def __init__(self, seq, frame, t_capture):
+        self.seq = seq
+        self.frame = frame
+        self.t_capture = t_capture  # time.perf_counter() at capture
+        self.data = {}
+        self.timings = {}  # stage name -> seconds spent in that stage
+
+
+class FrameQueue:
+    """Bounded queue between two stages.
+
+    With drop_oldest=True a full queue discards its oldest item instead of
+    blocking the producer, so a slow consumer always gets the freshest
+    frame (live mode). With drop_oldest=False put() blocks, which gives
+    back-pressure and no frame loss (offline mode).
+    """
+
+    def __init__(self, maxsize=2, drop_oldest=True):
+        self.maxsize = maxsize
+        self.drop_oldest = drop_oldest
+        self.dropped = 0
+        self._items = collections.deque()
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def put(self, item):
+        with self._cond:
+            while len(self._items) >= self.maxsize and not self._closed:
+                if self.drop_oldest:
+                    self._items.popleft()
+                    self.dropped += 1
+                    break
+                self._cond.wait()
+            if self._closed:
+                return
+            self._items.append(item)
+            self._cond.notify_all()
+
+    def get(self):
+        """Next item, or END once the queue is closed and drained."""
+        with self._cond:
+            while not self._items and not self._closed:
+                self._cond.wait()
+            if not self._items:
+                return END
+            item = self._items.popleft()
+            self._cond.notify_all()
+            return item
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+def read_timed(source):
+    """(ok, frame, t_capture) from a frame source or a plain cv2.VideoCapture."""
+    if hasattr(source, 'read_timed'):
+        return source.read_timed()
+    ok, frame = source.read()
+    return ok, frame, time.perf_counter()
+
+
+class Pipeline:
+    """Run `stages` over frames read from `source`.
+
+    stages is a list of (name, fn); fn(packet) fills packet.data. Iterating
+    the pipeline yields finished packets in capture order. With
+    threaded=False the same stages run inline, one frame at a time, which
+    is the original serial loop. With a metrics.Metrics, the time spent
+    reading each frame ('capture') and in each stage is recorded too
+    (and traced, tagged with the frame's seq, if it has a tracer).
+    """
+
+    def __init__(self, source, stages, queue_size=2, drop_oldest=True, threaded=True, metrics=None):
+        self.source = source
+        self.stages = list(stages)
+        self.queue_size = queue_size
+        self.drop_oldest = drop_oldest
+        self.threaded = threaded
+        self.metrics = metrics
+        self.queues = []
+        self._threads = []
+        self._stop = threading.Event()
+        self._error = None
+        self._seq = 0
+
+    def _next_packet(self):
+        t0 = time.perf_counter()
+        ok, frame, t_capture = read_timed(self.source)
+        if not ok:
+            return None
+        self._seq += 1
+        if self.metrics is not None:
+            self.metrics.record('capture', t0, time.perf_counter(), self._seq)
+        return Packet(self._seq, frame, t_capture)
+
+    def _run_stage(self, name, fn, packet):
+        t0 = time.perf_counter()
+        fn(packet)
+        t1 = time.perf_counter()
+        packet.timings[name] = t1 - t0
+        if self.metrics is not None:
+            self.metrics.record(name, t0, t1, packet.seq)
+
+    def _capture_loop(self, out_q):
+        try:
+            while not self._stop.is_set():
+                packet = self._next_packet()
+                if packet is None:
+                    break
+                out_q.put(packet)
+        except Exception as e:
+            self._fail(e)
+        finally:
+            out_q.close()
+
+    def _stage_loop(self, name, fn, in_q, out_q):
+        try:
+            while True:
+                packet = in_q.get()
+                if packet is END:
+                    break
+                self._run_stage(name, fn, packet)
+                out_q.put(packet)
+        except Exception as e:
+            self._fail(e)
+        finally:
+            out_q.close()
+
+    def _fail(self, error):
+        if self._error is None:
+            self._error = error
+        self.stop()
+
+    def start(self):
+        self.queues = [FrameQueue(self.queue_size, self.drop_oldest) for _ in range(len(self.stages) + 1)]
+        self._threads = [threading.Thread(target=self._capture_loop, args=(self.queues[0],),
+                                          name='pipeline-capture', daemon=True)]
+        for i, (name, fn) in enumerate(self.stages):
+            self._threads.append(threading.Thread(target=self._stage_loop,
+                                                  args=(name, fn, self.queues[i], self.queues[i + 1]),
+                                                  name=f'pipeline-{name}', daemon=True))
+        for t in self._threads:
+            t.start()
+        return self
+
+    def __iter__(self):
+        if not self.threaded:
+            while not self._stop.is_set():
+                packet = self._next_packet()
+                if packet is None:
+                    break
+                for name, fn in self.stages:
+                    self._run_stage(name, fn, packet)
+                yield packet
+            return
+        if not self._threads:
+            self.start()
+        out_q = self.queues[-1]
+        while True:
+            packet = out_q.get()
+            if packet is END:
+                break
+            yield packet
+        if self._error is not None:
+            raise self._error
+
+    @property
+    def dropped(self):
+        return sum(q.dropped for q in self.queues)
+
+    def stop(self):
+        self._stop.set()
+        for q in self.queues:
+            q.close()
+
+    def join(self, timeout=2.0):
+        for t in self._threads:
+            t.join(timeout=timeout)
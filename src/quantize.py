@@ -0,0 +1,127 @@
+import os
+import json
+import time
+import random
+import argparse
+import cv2
+import numpy as np
+import tensorflow as tf
+from utils import (load_trained_model, load_labels, list_dataset_images, preprocess_image_bgr,
+                   preprocess_for_model, run_inference)
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description='INT8 post-training quantization calibrated on dataset/valid')
+    p.add_argument('--model', default='models/asl_model_latest.h5')
+    p.add_argument('--out', default=None, help='output path (default: <model>_int8.tflite)')
+    p.add_argument('--data_dir', default='dataset', help='dataset root (train/ valid/ test)')
+    p.add_argument('--models_dir', default='models', help='where labels.json lives')
+    p.add_argument('--img_size', type=int, default=64)
+    p.add_argument('--num_calib', type=int, default=300, help='representative images drawn from valid/')
+    p.add_argument('--num_eval', type=int, default=1000, help='images used for the comparison report')
+    p.add_argument('--eval_split', default='valid', help='split used for the report (valid or test)')
+    p.add_argument('--num_threads', type=int, default=None)
+    p.add_argument('--seed', type=int, default=0)
+    return p.parse_args()
+
+
+def representative_dataset(paths, img_size):
+    def gen():
+        for path in paths:
+            img = cv2.imread(path)
+            if img is None:
+                continue
+            # same [0, 1] float input the float model sees in serving
+            yield [preprocess_image_bgr(img, img_size=img_size)]
+    return gen
+
+
+def quantize_int8(keras_model, calib_paths, img_size, out_path):
+    """Full-integer quantization with uint8 input/output tensors."""
+    converter = tf.lite.TFLiteConverter.from_keras_model(keras_model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = representative_dataset(calib_paths, img_size)
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    converter.inference_input_type = tf.uint8
+    converter.inference_output_type = tf.uint8
+    with open(out_path, 'wb') as f:
+        f.write(converter.convert())
+    return out_path
+
+
+def evaluate(model, items, img_size):
+    correct = 0
+    preds_idx = []
+    times = []
+    for path, y in items:
+        img = cv2.imread(path)
+        if img is None:
+            continue
+        x = preprocess_for_model(model, img, img_size=img_size)
+        t0 = time.perf_counter()
+        preds = run_inference(model, x)
+        times.append(time.perf_counter() - t0)
+        idx = int(np.argmax(preds))
+        preds_idx.append(idx)
+        correct += int(idx == y)
+    times_ms = np.array(times) * 1000.0
+    return {
+        'accuracy': correct / max(len(preds_idx), 1),
+        'latency_ms_mean': float(times_ms.mean()),
+        'latency_ms_p50': float(np.percentile(times_ms, 50)),
+        'latency_ms_p95': float(np.percentile(times_ms, 95)),
+    }, preds_idx
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(args.seed)
+    labels = load_labels(models_dir=args.models_dir)
+    out_path = args.out or os.path.splitext(args.model)[0] + '_int8.tflite'
+
+    valid_items = list_dataset_images(os.path.join(args.data_dir, 'valid'), labels)
+    if not valid_items:
+        raise FileNotFoundError(f"no images found under {os.path.join(args.data_dir, 'valid')}")
+    calib = rng.sample(valid_items, min(args.num_calib, len(valid_items)))
+
+    keras_model = load_trained_model(args.model)
+    print(f'🔧 Calibration sur {len(calib)} images de valid/')
+    quantize_int8(keras_model, [p for p, _ in calib], args.img_size, out_path)
+
+    # report on images not used for calibration
+    calib_paths = {p for p, _ in calib}
+    eval_items = list_dataset_images(os.path.join(args.data_dir, args.eval_split), labels)
+    eval_items = [it for it in eval_items if it[0] not in calib_paths]
+    eval_items = rng.sample(eval_items, min(args.num_eval, len(eval_items)))
+
+    int8_model = load_trained_model(out_path, num_threads=args.num_threads)
+    float_stats, float_preds = evaluate(keras_model, eval_items, args.img_size)
+    int8_stats, int8_preds = evaluate(int8_model, eval_items, args.img_size)
+    agreement = float(np.mean(np.array(float_preds) == np.array(int8_preds))) if float_preds else 0.0
+
+    float_stats['size_kb'] = os.path.getsize(args.model) / 1024
+    int8_stats['size_kb'] = os.path.getsize(out_path) / 1024
+    report = {
+        'eval_split': args.eval_split,
+        'num_images': len(float_preds),
+        'float_h5': float_stats,
+        'int8_tflite': int8_stats,
+        'top1_agreement': agreement,
+        'size_ratio': float_stats['size_kb'] / int8_stats['size_kb'],
+        'int8_accepts_uint8_roi': int8_model.input_kind == 'uint8',
+    }
+    report_path = os.path.splitext(out_path)[0] + '_report.json'
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"{'':<12}{'accuracy':>10}{'mean ms':>10}{'p95 ms':>10}{'size KB':>10}")
+    for name, st in (('float .h5', float_stats), ('int8', int8_stats)):
+        print(f"{name:<12}{st['accuracy']*100:>9.2f}%{st['latency_ms_mean']:>10.3f}"
+              f"{st['latency_ms_p95']:>10.3f}{st['size_kb']:>10.1f}")
+    print(f"top-1 agreement: {agreement*100:.2f}% | size ratio: {report['size_ratio']:.1f}x")
+    print('INT8 model saved to:', out_path)
+    print('Report saved to:', report_path)
+
+
+if __name__ == '__main__':
+    main()
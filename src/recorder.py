@@ -0,0 +1,125 @@
+import os
+import time
+import queue
+import threading
+import collections
+import cv2
+from logs import get_logger
+
+log = get_logger('recorder')
+
+
+class DebugRecorder:
+    """Save sampled hand ROIs for debugging, off the frame loop.
+
+    offer() is called for every classified ROI and decides on the calling
+    thread, cheaply, whether to keep it:
+      - every_n: one ROI out of every N frames (0 = off)
+      - low_confidence: every ROI whose top-1 prob is below it (None = off)
+      - request(): the next ROI offered (key press)
+    Kept ROIs are resized (a copy, so later drawing on the frame does not
+    leak into it) and handed to a worker thread through a bounded queue;
+    when the queue is full the ROI is dropped rather than stalling the
+    caller. The worker encodes and writes
+    <out_dir>/<session>_<seq>_<reason>_<label>.jpg, the session stamp
+    keeping runs from overwriting each other, and deletes the oldest .jpg
+    beyond max_files, counting those left by earlier runs.
+    """
+
+    def __init__(self, out_dir='debug_frames', every_n=0, low_confidence=None, size=64, max_files=200,
+                 queue_size=8):
+        self.out_dir = out_dir
+        self.every_n = every_n
+        self.low_confidence = low_confidence
+        self.size = size
+        self.max_files = max_files
+        self.saved = 0
+        self.dropped = 0
+        self.failed = 0
+        self.session = time.strftime('%Y%m%d-%H%M%S')
+        self._requested = False
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._files = collections.deque()
+        self._thread = None
+
+    def request(self):
+        """Save the next ROI offered, whatever the policies say."""
+        self._requested = True
+
+    def _reason(self, seq, prob):
+        if self._requested:
+            self._requested = False
+            return 'key'
+        if self.low_confidence is not None and prob is not None and prob < self.low_confidence:
+            return 'lowconf'
+        if self.every_n and seq % self.every_n == 0:
+            return 'every'
+        return None
+
+    def offer(self, roi, seq, label=None, prob=None):
+        reason = self._reason(seq, prob)
+        if reason is None or roi is None or roi.size == 0:
+            return False
+        img = cv2.resize(roi, (self.size, self.size)) if self.size else roi.copy()
+        self.start()
+        try:
+            self._queue.put_nowait((img, seq, reason, label, prob))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='debug-recorder', daemon=True)
+            self._thread.start()
+        return self
+
+    def _existing_files(self):
+        # crops of earlier runs, oldest first, so rotation covers them too
+        entries = [e for e in os.scandir(self.out_dir) if e.is_file() and e.name.lower().endswith('.jpg')]
+        return [e.path for e in sorted(entries, key=lambda e: (e.stat().st_mtime_ns, e.name))]
+
+    def _rotate(self):
+        while self.max_files and len(self._files) > self.max_files:
+            try:
+                os.remove(self._files.popleft())
+            except OSError:
+                pass
+
+    def _run(self):
+        try:
+            os.makedirs(self.out_dir, exist_ok=True)
+            self._files.extend(self._existing_files())
+        except OSError as e:
+            log.warning('❌ debug frame directory unusable: %s', e)
+        self._rotate()
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            img, seq, reason, label, prob = item
+            name = f'{self.session}_{seq:07d}_{reason}_{label or "none"}'
+            if prob is not None:
+                name += f'_{prob * 100:.0f}'
+            path = os.path.join(self.out_dir, name + '.jpg')
+            try:
+                # cv2.imwrite reports most failures by returning False
+                ok = cv2.imwrite(path, img)
+                error = None if ok else 'imwrite returned False'
+            except Exception as e:
+                ok, error = False, e
+            if not ok:
+                self.failed += 1
+                log.warning('❌ debug frame not written: %s (%s)', path, error, extra={'every': 5.0})
+                continue
+            self.saved += 1
+            self._files.append(path)
+            self._rotate()
+
+    def close(self, timeout=2.0):
+        """Write what is queued, then stop the worker."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=timeout)
+            self._thread = None
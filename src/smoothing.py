@@ -0,0 +1,155 @@
+import time
+import numpy as np
+
+
+class LetterSmoother:
+    """Label vote, cooldown and letter-commit rules of the advanced live loop.
+
+    Feed it the raw top-1 (label, prob) of every frame (None when there is
+    no hand); it keeps the last `buffer_len` confident predictions, votes
+    with probability weights and tracks `current_word`. commit() is what
+    SPACE does in the GUI. With auto_commit_frames set, a prediction that
+    stays the vote winner for that many consecutive frames is committed
+    automatically (headless and offline modes, where nobody presses keys).
+    A held sign is committed once: the same letter can only be
+    auto-committed again after the vote winner has changed or the hand
+    has left the frame.
+
+    Given each frame's capture time, it also measures glass-to-text
+    latency: from the first frame of a label's run (the pose appearing)
+    to that label winning the vote (time to stable) and to it being
+    committed to current_word (time to commit). A run survives gaps of up
+    to buffer_len frames (misclassified frames, a dropped hand), the
+    flicker the vote is there to absorb, so a single stray frame does not
+    restart the clock.
+    """
+
+    def __init__(self, buffer_len=8, confidence_threshold=0.7, cooldown_frames=20, auto_commit_frames=None):
+        self.buffer_len = buffer_len
+        self.confidence_threshold = confidence_threshold
+        self.cooldown_frames = cooldown_frames
+        self.auto_commit_frames = auto_commit_frames
+        self.label_buffer = []
+        self.cooldown = 0
+        self.last_prediction = None
+        self.current_word = ""
+        self._stable_label = None
+        self._stable_count = 0
+        # last committed token, not auto-committed again while still held
+        self._held = None
+        # glass-to-text latency tracking: label -> (onset time, last frame seen)
+        self._runs = {}
+        self._frame = 0
+        self._winner = None
+        self._now = None
+        self.last_commit_latency = None
+        self.latencies = {'stable': [], 'commit': []}
+
+    def update(self, label=None, prob=0.0, t_capture=None, now=None):
+        """Advance one frame.
+
+        t_capture is the frame's capture time and now the time its result
+        is applied (default time.perf_counter(); offline callers pass video
+        time for both). Returns (current_prediction, current_confidence,
+        committed) where committed is the token auto-committed on this
+        frame, else None.
+        """
+        if t_capture is not None:
+            self._frame += 1
+            if label is not None:
+                run = self._runs.get(label)
+                self._runs[label] = (run[0] if self._is_live(run) else t_capture, self._frame)
+            self._now = time.perf_counter() if now is None else now
+
+        if self.cooldown > 0:
+            self.cooldown -= 1
+
+        current_prediction = None
+        current_confidence = 0
+
+        if label is not None and self.cooldown == 0 and prob > self.confidence_threshold:
+            self.label_buffer.append((label, prob))
+            if len(self.label_buffer) > self.buffer_len:
+                self.label_buffer.pop(0)
+
+            votes = {}
+            for L, P in self.label_buffer:
+                votes[L] = votes.get(L, 0) + (P * 10)
+            current_prediction = max(votes.items(), key=lambda x: x[1])[0]
+            current_confidence = max(p for l, p in self.label_buffer if l == current_prediction)
+
+        if current_prediction and current_confidence > self.confidence_threshold:
+            self.last_prediction = current_prediction
+            if current_prediction != self._winner:
+                self._record('stable', current_prediction)
+        self._winner = current_prediction
+
+        committed = None
+        if self.auto_commit_frames:
+            # the cooldown yields no winner, hand on screen or not: only a
+            # missing hand or a different winner ends the held sign
+            if label is None or (current_prediction is not None and current_prediction != self._held):
+                self._held = None
+            if current_prediction is not None and current_prediction == self._stable_label:
+                self._stable_count += 1
+            else:
+                self._stable_label = current_prediction
+                self._stable_count = 1 if current_prediction is not None else 0
+            if self._stable_count >= self.auto_commit_frames and current_prediction != self._held:
+                committed = self.commit()
+        return current_prediction, current_confidence, committed
+
+    def commit(self, now=None):
+        """Apply last_prediction to current_word; returns the token or None.
+
+        now: time of a commit made outside update() (the SPACE key), on the
+        same clock as the capture times.
+        """
+        if now is not None:
+            self._now = now
+        token = self.last_prediction
+        if not token or token == 'nothing':
+            return None
+        if token == 'space':
+            self.current_word += ' '
+        elif token == 'del':
+            self.current_word = self.current_word[:-1] if self.current_word else ""
+        else:
+            self.current_word += token
+        self.cooldown = self.cooldown_frames
+        # votes cast before the commit must not carry over to the next letter
+        self.label_buffer = []
+        self._stable_label = None
+        self._stable_count = 0
+        self._held = token
+        self.last_commit_latency = self._record('commit', token)
+        # holding the same sign again must start a new run
+        self._runs.pop(token, None)
+        return token
+
+    def _is_live(self, run):
+        return run is not None and self._frame - run[1] <= self.buffer_len
+
+    def _record(self, kind, label):
+        # only when the label's run is still on screen: a vote winner
+        # carried by older buffer entries has no meaningful onset
+        run = self._runs.get(label)
+        if not self._is_live(run):
+            return None
+        latency = self._now - run[0]
+        self.latencies[kind].append(latency)
+        return latency
+
+    def latency_summary(self):
+        """{'stable': {...}, 'commit': {...}} with count, mean and percentiles in ms."""
+        summary = {}
+        for kind, values in self.latencies.items():
+            ms = np.asarray(values) * 1000.0
+            if not len(ms):
+                summary[kind] = {'count': 0}
+                continue
+            p50, p90, p95, p99 = np.percentile(ms, [50, 90, 95, 99])
+            summary[kind] = {'count': int(len(ms)), 'mean_ms': float(ms.mean()), 'p50_ms': float(p50),
+                             'p90_ms': float(p90), 'p95_ms': float(p95), 'p99_ms': float(p99),
+                             'max_ms': float(ms.max())}
+        return summary
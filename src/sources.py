@@ -0,0 +1,149 @@
+import os
+import time
+import cv2
+import numpy as np
+from capture import LatestFrameGrabber
+
+IMAGE_EXTS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+
+class FrameSource:
+    """Common interface of every frame source.
+
+    Same surface as cv2.VideoCapture (isOpened/read/release) plus
+    read_timed() -> (ok, frame, t_capture), which the pipeline uses. With
+    realtime=True frames are paced at `fps`, as a camera would deliver
+    them; otherwise they come as fast as the consumer asks (benchmarks,
+    offline jobs).
+    """
+
+    def __init__(self, fps=30.0, realtime=False):
+        self.fps = fps or 30.0
+        self.realtime = realtime
+        self.frames_read = 0
+        self._t_start = None
+
+    def _next_frame(self):
+        raise NotImplementedError
+
+    def isOpened(self):
+        return True
+
+    def read_timed(self):
+        frame = self._next_frame()
+        if frame is None:
+            return False, None, None
+        if self.realtime:
+            if self._t_start is None:
+                self._t_start = time.perf_counter()
+            delay = self._t_start + self.frames_read / self.fps - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        self.frames_read += 1
+        return True, frame, time.perf_counter()
+
+    def read(self):
+        ok, frame, _ = self.read_timed()
+        return ok, frame
+
+    def __iter__(self):
+        while True:
+            ok, frame, t_capture = self.read_timed()
+            if not ok:
+                return
+            yield frame, t_capture
+
+    def release(self):
+        pass
+
+
+class VideoFileSource(FrameSource):
+    def __init__(self, path, realtime=False):
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        self.cap = cv2.VideoCapture(path)
+        super().__init__(fps=self.cap.get(cv2.CAP_PROP_FPS), realtime=realtime)
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def _next_frame(self):
+        ok, frame = self.cap.read()
+        return frame if ok else None
+
+    def release(self):
+        self.cap.release()
+
+
+class ImageFolderSource(FrameSource):
+    """Images of a directory in name order, e.g. a dumped production capture."""
+
+    def __init__(self, path, fps=30.0, realtime=False, loop=False):
+        super().__init__(fps=fps, realtime=realtime)
+        self.paths = sorted(os.path.join(path, f) for f in os.listdir(path) if f.lower().endswith(IMAGE_EXTS))
+        self.loop = loop
+        self._i = 0
+
+    def isOpened(self):
+        return bool(self.paths)
+
+    def _next_frame(self):
+        while self.paths:
+            if self._i >= len(self.paths):
+                if not self.loop:
+                    return None
+                self._i = 0
+            frame = cv2.imread(self.paths[self._i])
+            self._i += 1
+            if frame is not None:
+                return frame
+        return None
+
+
+class SyntheticSource(FrameSource):
+    """Deterministic in-memory frames, no camera or files needed.
+
+    Replays `frames` if given (once, unless `count` says otherwise),
+    otherwise generates `count` (default 300) seeded noise frames of
+    `size` (h, w). Each read returns a copy, since the pipeline
+    draws on the frames it gets.
+    """
+
+    def __init__(self, frames=None, count=None, size=(480, 640), fps=30.0, realtime=False, seed=0):
+        super().__init__(fps=fps, realtime=realtime)
+        if frames is None:
+            count = 300 if count is None else count
+            rng = np.random.default_rng(seed)
+            h, w = size
+            # a handful of distinct frames cycled: cheap to build, stable to replay
+            frames = [rng.integers(0, 256, size=(h, w, 3), dtype=np.uint8) for _ in range(min(count, 8))]
+        self.frames = list(frames)
+        self.count = len(self.frames) if count is None else count
+        self._i = 0
+
+    def _next_frame(self):
+        if self._i >= self.count or not self.frames:
+            return None
+        frame = self.frames[self._i % len(self.frames)].copy()
+        self._i += 1
+        return frame
+
+
+def open_source(spec='0', realtime=False, width=None, height=None, fps=None, fourcc=None):
+    """Frame source from a command-line spec.
+
+    '0', '1', ...     webcam index (LatestFrameGrabber)
+    'synthetic[:N]'   N generated frames (default 300)
+    <directory>       ImageFolderSource
+    <file>            VideoFileSource
+    """
+    spec = str(spec)
+    if spec.isdigit():
+        return LatestFrameGrabber(int(spec), width=width, height=height, fps=fps, fourcc=fourcc)
+    if spec.startswith('synthetic'):
+        _, _, count = spec.partition(':')
+        size = (height or 480, width or 640)
+        return SyntheticSource(count=int(count or 300), size=size, fps=fps or 30.0, realtime=realtime)
+    if os.path.isdir(spec):
+        return ImageFolderSource(spec, fps=fps or 30.0, realtime=realtime)
+    return VideoFileSource(spec, realtime=realtime)
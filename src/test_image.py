@@ -1,33 +1,116 @@
+import os
+import sys
+import csv
+import glob
+import json
+import time
 import argparse
 import cv2
-from utils import load_trained_model, load_labels, preprocess_image_bgr
+from utils import get_model, get_labels, predict_batch, iter_batches
+from sources import IMAGE_EXTS
 
 
-def parse_args():
-    p = argparse.ArgumentParser()
+def expand_inputs(specs):
+    """Image paths from files, directories (recursive) and glob patterns, in order."""
+    paths = []
+    for spec in specs:
+        if os.path.isdir(spec):
+            found = [os.path.join(root, f) for root, _, files in os.walk(spec)
+                     for f in files if f.lower().endswith(IMAGE_EXTS)]
+            paths.extend(sorted(found))
+        elif glob.has_magic(spec):
+            paths.extend(sorted(glob.glob(spec, recursive=True)))
+        else:
+            paths.append(spec)
+    return paths
+
+
+class ResultWriter:
+    """Stream one result per image as CSV or JSONL ('-' = stdout)."""
+
+    FIELDS = ('path', 'label', 'prob', 'top_k')
+
+    def __init__(self, path, fmt=None):
+        self.fmt = fmt or ('csv' if path.endswith('.csv') else 'jsonl')
+        self._f = sys.stdout if path == '-' else open(path, 'w', encoding='utf-8', newline='')
+        self._csv = None
+        if self.fmt == 'csv':
+            self._csv = csv.writer(self._f)
+            self._csv.writerow(self.FIELDS)
+
+    def write(self, path, result):
+        label, prob, top_k = result if result is not None else (None, None, [])
+        if self._csv is not None:
+            self._csv.writerow([path, label if label is not None else '',
+                                '' if prob is None else f'{prob:.6f}',
+                                '|'.join(f'{l}:{p:.4f}' for l, p in top_k)])
+        else:
+            row = {'path': path, 'label': label, 'prob': None if prob is None else round(prob, 6),
+                   'top_k': [[l, round(p, 4)] for l, p in top_k]}
+            if result is None:
+                row['error'] = 'unreadable image'
+            self._f.write(json.dumps(row, ensure_ascii=False) + '\n')
+
+    def close(self):
+        if self._f is sys.stdout:
+            self._f.flush()
+        else:
+            self._f.close()
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description='Classify one image, or whole directories / globs in batches')
     p.add_argument('--model', default='models/asl_model_latest.h5')
-    p.add_argument('--img', required=True)
+    p.add_argument('--img', required=True, nargs='+', help='image files, directories or glob patterns')
     p.add_argument('--labels', default='models/labels.json')
     p.add_argument('--img_size', type=int, default=64)
-    return p.parse_args()
+    p.add_argument('--batch_size', type=int, default=64)
+    p.add_argument('--workers', type=int, default=None, help='decode threads (default: all cores)')
+    p.add_argument('--out', default=None,
+                   help="results file, .csv or .jsonl ('-' for JSONL on stdout); default: print for a single image")
+    p.add_argument('--format', choices=('csv', 'jsonl'), default=None, help='override the --out extension')
+    p.add_argument('--top_k', type=int, default=3)
+    return p.parse_args(argv)
+
 
+def main(argv=None):
+    args = parse_args(argv)
+    # loaded once for the whole run, however many images
+    model = get_model(args.model)
+    labels = get_labels(models_dir=os.path.dirname(args.labels) or '.')
 
-def main():
-    args = parse_args()
-    model = load_trained_model(args.model)
-    labels = load_labels(models_dir='models')
+    paths = expand_inputs(args.img)
+    if not paths:
+        raise FileNotFoundError(' '.join(args.img))
 
-    img = cv2.imread(args.img)
-    if img is None:
-        raise FileNotFoundError(args.img)
+    if len(paths) == 1 and args.out is None:
+        result = predict_batch(model, [cv2.imread(paths[0])], labels, img_size=args.img_size)[0]
+        if result is None:
+            raise FileNotFoundError(paths[0])
+        label, prob, _ = result
+        print(f'Prediction: {label} ({prob*100:.2f}%)')
+        return
 
-    from utils import preprocess_image_bgr
-    x = preprocess_image_bgr(img, img_size=args.img_size)
-    pred = model.predict(x)
-    idx = int(pred.argmax())
-    prob = float(pred.max())
+    out = ResultWriter(args.out or '-', fmt=args.format)
+    # progress never mixes with results streamed to stdout
+    log = sys.stderr if (args.out or '-') == '-' else sys.stdout
+    workers = args.workers or os.cpu_count()
+    t0 = time.perf_counter()
+    done = failed = 0
+    for batch_paths, images in iter_batches(paths, args.batch_size, workers, img_size=args.img_size):
+        results = predict_batch(model, images, labels, img_size=args.img_size, top_k=args.top_k,
+                                batch_size=args.batch_size)
+        for path, result in zip(batch_paths, results):
+            out.write(path, result)
+        done += len(batch_paths)
+        failed += sum(r is None for r in results)
+        print(f'  {done}/{len(paths)} | {done / (time.perf_counter() - t0):.0f} img/s', end='\r', file=log)
+    out.close()
+    elapsed = time.perf_counter() - t0
+    print(file=log)
+    print(f'⏱️ {done} images en {elapsed:.1f}s ({done / max(elapsed, 1e-9):.1f} img/s), '
+          f'{failed} illisibles', file=log)
 
-    print(f'Prediction: {labels[idx]} ({prob*100:.2f}%)')
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
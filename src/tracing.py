@@ -0,0 +1,67 @@
+import os
+import json
+import time
+import threading
+import collections
+
+# Opt-in session timeline. Stage spans (begin/end, thread, frame id) go to
+# a bounded ring buffer as plain tuples; they are turned into Chrome Trace
+# Event JSON only when dumped, so recording stays cheap. Open the file in
+# chrome://tracing or https://ui.perfetto.dev.
+
+
+class Tracer:
+    """Ring buffer of the last `capacity` spans.
+
+    add(name, t0, t1, frame_id) records a span on the calling thread, with
+    t0/t1 from time.perf_counter(). frame(frame_id, t0, t1) records a whole
+    frame (capture -> result) as an async span, since consecutive frames
+    overlap in the threaded pipeline.
+    """
+
+    def __init__(self, capacity=200000):
+        self.capacity = capacity
+        self._spans = collections.deque(maxlen=capacity)
+        self._thread_names = {}
+        self._t_origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, name, t0, t1, frame_id=None):
+        tid = threading.get_ident()
+        if tid not in self._thread_names:
+            # setdefault is atomic: safe against events() reading from another thread
+            self._thread_names.setdefault(tid, threading.current_thread().name)
+        # deque.append is atomic: no lock on the hot path
+        self._spans.append((name, t0, t1, tid, frame_id, False))
+
+    def frame(self, frame_id, t0, t1):
+        self._spans.append(('frame', t0, t1, 0, frame_id, True))
+
+    def events(self):
+        """The buffered spans as Chrome Trace Event dicts."""
+        pid = os.getpid()
+        us = 1e6
+        events = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+                  for tid, name in list(self._thread_names.items())]
+        for name, t0, t1, tid, frame_id, is_frame in list(self._spans):
+            ts = (t0 - self._t_origin) * us
+            args = {} if frame_id is None else {'frame': frame_id}
+            if is_frame:
+                common = {'name': name, 'cat': 'frame', 'id': frame_id, 'pid': pid, 'tid': tid, 'args': args}
+                events.append({**common, 'ph': 'b', 'ts': ts})
+                events.append({**common, 'ph': 'e', 'ts': (t1 - self._t_origin) * us})
+            else:
+                events.append({'name': name, 'cat': 'stage', 'ph': 'X', 'ts': ts, 'dur': (t1 - t0) * us,
+                               'pid': pid, 'tid': tid, 'args': args})
+        return events
+
+    def dump(self, path):
+        """Write the buffer as a Chrome trace file (the buffer is kept)."""
+        with self._lock:
+            trace = {'traceEvents': self.events(), 'displayTimeUnit': 'ms'}
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(trace, f)
+            os.replace(tmp_path, path)
+        return len(trace['traceEvents'])
+
@@ -2,6 +2,7 @@ import os
 import json
 import argparse
 import datetime
+import numpy as np
 import tensorflow as tf
 from tensorflow.keras import layers, models, callbacks
 from tensorflow.keras.preprocessing.image import ImageDataGenerator
@@ -23,6 +24,26 @@ def build_simple_cnn(input_shape=(64,64,3), num_classes=29):
     return model
 
 
+def build_raw_input_model(model, img_size=64):
+    """Wrap a trained classifier so it takes raw uint8 BGR crops of any size.
+
+    The serving preprocessing (resize, BGR->RGB, /255) becomes part of the
+    graph, so every backend exported from this model applies exactly the
+    same transform and the live loops can hand over the crop untouched.
+    """
+    inputs = layers.Input(shape=(None, None, 3), dtype='uint8', name='roi_bgr')
+    x = layers.Rescaling(1./255, name='scale')(inputs)
+    x = layers.Resizing(img_size, img_size, interpolation='bilinear', name='resize')(x)
+    # channel swap as a frozen 1x1 conv: serializable, unlike a Lambda
+    bgr_to_rgb = layers.Conv2D(3, 1, use_bias=False, trainable=False, name='bgr_to_rgb')
+    x = bgr_to_rgb(x)
+    kernel = np.zeros((1, 1, 3, 3), dtype=np.float32)
+    kernel[0, 0, 2, 0] = kernel[0, 0, 1, 1] = kernel[0, 0, 0, 2] = 1.0
+    bgr_to_rgb.set_weights([kernel])
+    outputs = model(x)
+    return models.Model(inputs, outputs, name=f'{model.name}_raw')
+
+
 def parse_args():
     p = argparse.ArgumentParser()
     p.add_argument('--data_dir', default='../dataset', help='dataset root (train/ valid/ test)')
@@ -30,6 +51,9 @@ def parse_args():
     p.add_argument('--img_size', type=int, default=64)
     p.add_argument('--batch_size', type=int, default=32)
     p.add_argument('--epochs', type=int, default=20)
+    p.add_argument('--export_tflite', action='store_true', help='also write asl_model_latest.tflite')
+    p.add_argument('--export_raw', action='store_true',
+                   help='also write asl_model_latest_raw.h5 taking raw uint8 BGR crops (preprocessing in-graph)')
     return p.parse_args()
 
 
@@ -94,20 +118,37 @@ def main():
 
     history = model.fit(train, validation_data=valid, epochs=args.epochs, callbacks=cb)
 
+    # save class_indices first: a live session reloading the new model
+    # must find its labels already in place (write then rename as well)
+    class_map = {v: k for k, v in train.class_indices.items()}  # index -> class
+    labels_path = os.path.join(args.models_dir, 'labels.json')
+    with open(labels_path + '.tmp', 'w') as f:
+        json.dump(class_map, f)
+    os.replace(labels_path + '.tmp', labels_path)
+
     # save final model (best was saved by checkpoint)
     final_path = os.path.join(args.models_dir, 'asl_model_latest.h5')
-    model.save(final_path)
-
-    # save history and class indices
+    # write then rename, so a running live session never reads a partial file
+    tmp_path = os.path.join(args.models_dir, 'asl_model_latest.tmp.h5')
+    model.save(tmp_path)
+    os.replace(tmp_path, final_path)
+
+    if args.export_tflite:
+        from export_tflite import export_tflite
+        tflite_path = os.path.join(args.models_dir, 'asl_model_latest.tflite')
+        export_tflite(model, tflite_path)
+        print('TFLite model saved to:', tflite_path)
+
+    if args.export_raw:
+        raw_path = os.path.join(args.models_dir, 'asl_model_latest_raw.h5')
+        build_raw_input_model(model, img_size=args.img_size).save(raw_path)
+        print('Raw-input model saved to:', raw_path)
+
+    # save history
     hist_path = os.path.join(args.models_dir, 'history.json')
     with open(hist_path, 'w') as f:
         json.dump({k: [float(x) for x in v] for k, v in history.history.items()}, f)
 
-    # save class_indices
-    class_map = {v: k for k, v in train.class_indices.items()}  # index -> class
-    with open(os.path.join(args.models_dir, 'labels.json'), 'w') as f:
-        json.dump(class_map, f)
-
     print('Training finished. Model saved to:', final_path)
 
 
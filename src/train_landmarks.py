@@ -0,0 +1,81 @@
+import os
+import json
+import argparse
+import numpy as np
+from tensorflow.keras import layers, models, callbacks
+from utils import load_labels, normalize_landmarks, NUM_LANDMARKS
+from extract_landmarks import extract_split
+
+
+def build_landmark_mlp(num_features=NUM_LANDMARKS * 3, num_classes=29):
+    model = models.Sequential([
+        layers.Input(shape=(num_features,)),
+        layers.Dense(128, activation='relu'),
+        layers.Dropout(0.3),
+        layers.Dense(64, activation='relu'),
+        layers.Dropout(0.3),
+        layers.Dense(num_classes, activation='softmax')
+    ])
+    return model
+
+
+def load_split(data_dir, landmarks_dir, split, labels):
+    # <landmarks_dir>/<split>.npz is written by extract_landmarks.py
+    # (landmarks, labels, mask); missing splits are extracted on the fly
+    cache_path = os.path.join(landmarks_dir, f'{split}.npz')
+    if not os.path.exists(cache_path):
+        print(f'🔧 Extraction des landmarks: {split}/')
+        extract_split(os.path.join(data_dir, split), labels, out_path=cache_path,
+                      shard_dir=os.path.join(landmarks_dir, 'shards', split))
+    data = np.load(cache_path)
+    mask = data['mask']
+    print(f'{split}: {int(mask.sum())}/{len(mask)} images avec une main détectée')
+    return normalize_landmarks(data['landmarks'][mask]), data['labels'][mask]
+
+
+def parse_args():
+    p = argparse.ArgumentParser()
+    p.add_argument('--data_dir', default='../dataset', help='dataset root (train/ valid/ test)')
+    p.add_argument('--models_dir', default='../models', help='where to save model (labels.json is read from here)')
+    p.add_argument('--landmarks_dir', default=None, help='landmark cache (default: <data_dir>/landmarks)')
+    p.add_argument('--batch_size', type=int, default=256)
+    p.add_argument('--epochs', type=int, default=100)
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    landmarks_dir = args.landmarks_dir or os.path.join(args.data_dir, 'landmarks')
+    os.makedirs(args.models_dir, exist_ok=True)
+
+    # same class indices as the pixel CNN, so both share labels.json
+    labels = load_labels(models_dir=args.models_dir)
+
+    X_train, y_train = load_split(args.data_dir, landmarks_dir, 'train', labels)
+    X_valid, y_valid = load_split(args.data_dir, landmarks_dir, 'valid', labels)
+
+    model = build_landmark_mlp(num_features=X_train.shape[1], num_classes=len(labels))
+    model.compile(optimizer='adam', loss='sparse_categorical_crossentropy', metrics=['accuracy'])
+    model.summary()
+
+    cb = [
+        callbacks.EarlyStopping(monitor='val_loss', patience=10, restore_best_weights=True)
+    ]
+
+    history = model.fit(X_train, y_train, validation_data=(X_valid, y_valid),
+                        epochs=args.epochs, batch_size=args.batch_size, callbacks=cb)
+
+    final_path = os.path.join(args.models_dir, 'asl_landmarks_latest.h5')
+    tmp_path = os.path.join(args.models_dir, 'asl_landmarks_latest.tmp.h5')
+    model.save(tmp_path)
+    os.replace(tmp_path, final_path)
+
+    hist_path = os.path.join(args.models_dir, 'landmarks_history.json')
+    with open(hist_path, 'w') as f:
+        json.dump({k: [float(x) for x in v] for k, v in history.history.items()}, f)
+
+    print('Training finished. Model saved to:', final_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,278 @@
+import os
+import json
+import time
+import argparse
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from smoothing import LetterSmoother
+
+# Offline transcription of a recorded signing session. The video is cut
+# into frame ranges handled by a pool of worker processes (decode ->
+# MediaPipe -> batched classification, as fast as the cores allow), then
+# the per-frame predictions are replayed in frame order through the same
+# LetterSmoother as live_cam_mediapipe_advanced to build the transcript.
+
+MODEL_PATH = 'models/asl_model_latest.h5'
+
+_hands = None
+_model = None
+_labels = None
+
+
+def _init_worker(model_path, models_dir, min_detection_confidence):
+    # one MediaPipe graph and one model per process, each single-threaded
+    # so that N workers use N cores without oversubscription
+    global _hands, _model, _labels
+    import cv2
+    import mediapipe as mp
+    cv2.setNumThreads(1)
+    if not model_path.endswith(('.tflite', '.npz')):
+        import tensorflow as tf
+        tf.config.threading.set_intra_op_parallelism_threads(1)
+        tf.config.threading.set_inter_op_parallelism_threads(1)
+    from utils import get_model, get_labels
+    _model = get_model(model_path, num_threads=1)
+    _labels = get_labels(models_dir=models_dir)
+    _hands = mp.solutions.hands.Hands(static_image_mode=False, max_num_hands=1,
+                                      min_detection_confidence=min_detection_confidence,
+                                      min_tracking_confidence=0.5)
+
+
+def _classify(items, preprocess, use_landmarks):
+    """One batched inference call for [(frame_idx, roi or features), ...]."""
+    from utils import run_inference, decode_predictions
+    if use_landmarks:
+        x = np.concatenate([feat for _, feat in items])
+    else:
+        x = preprocess.batch_of([roi for _, roi in items])
+    preds = run_inference(_model, x)
+    return [(idx, label, prob) for (idx, _), (label, prob, _) in
+            zip(items, decode_predictions(preds, _labels, top_k=1))]
+
+
+def _open_at(video_path, start):
+    """VideoCapture positioned exactly on frame `start`.
+
+    A CAP_PROP_POS_FRAMES seek lands on a nearby keyframe with many
+    codecs, so the reported position is checked and the remaining frames
+    are grabbed (decoded, not converted). A seek that overshoots starts
+    over from the first frame.
+    """
+    import cv2
+    cap = cv2.VideoCapture(video_path)
+    if not start:
+        return cap
+    cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+    pos = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+    if pos > start or pos < 0:
+        cap.release()
+        cap = cv2.VideoCapture(video_path)
+        pos = 0
+    while pos < start and cap.grab():
+        pos += 1
+    return cap
+
+
+def _transcribe_chunk(video_path, start, stop, batch_size):
+    """Top-1 (frame_idx, label, prob) for frames [start, stop) of the video.
+
+    label is None on frames without a hand. Also returns the seconds spent
+    decoding, detecting and classifying.
+    """
+    import cv2
+    from utils import Preprocessor, landmark_features, hand_bbox
+
+    use_landmarks = getattr(_model, 'input_kind', 'float') == 'landmarks'
+    preprocess = Preprocessor.for_model(_model, img_size=64, max_batch=batch_size)
+    timings = {'decode': 0.0, 'detect': 0.0, 'classify': 0.0}
+    results = []
+    pending = []
+
+    def flush():
+        t0 = time.perf_counter()
+        results.extend(_classify(pending, preprocess, use_landmarks))
+        timings['classify'] += time.perf_counter() - t0
+        pending.clear()
+
+    cap = _open_at(video_path, start)
+    idx = start
+    while stop is None or idx < stop:
+        t0 = time.perf_counter()
+        ok, frame = cap.read()
+        t1 = time.perf_counter()
+        timings['decode'] += t1 - t0
+        if not ok:
+            break
+        mp_results = _hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        timings['detect'] += time.perf_counter() - t1
+
+        lm = mp_results.multi_hand_landmarks[0] if mp_results.multi_hand_landmarks else None
+        item = None
+        if lm is not None:
+            h, w, _ = frame.shape
+            if use_landmarks:
+                item = landmark_features(lm, w, h)
+            else:
+                x_min, y_min, x_max, y_max = hand_bbox(lm, w, h)
+                roi = frame[y_min:y_max, x_min:x_max]
+                item = roi if roi.size != 0 else None
+        if item is None:
+            results.append((idx, None, 0.0))
+        else:
+            pending.append((idx, item))
+            if len(pending) >= batch_size:
+                flush()
+        idx += 1
+    if pending:
+        flush()
+    cap.release()
+    results.sort(key=lambda r: r[0])
+    return results, timings
+
+
+def video_info(video_path):
+    import cv2
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise FileNotFoundError(video_path)
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    num_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+    return fps, num_frames
+
+
+def frame_ranges(num_frames, workers, min_chunk=150):
+    """Split [0, num_frames) into a few chunks per worker.
+
+    Each chunk restarts MediaPipe tracking, so chunks are kept long enough
+    (min_chunk frames) for that to be negligible. The last chunk is
+    open-ended and reads until decoding stops: many containers
+    under-report their frame count, and an unknown count (some report 0)
+    gives a single open-ended chunk.
+    """
+    if num_frames <= 0:
+        return [(0, None)]
+    chunk = max(min_chunk, -(-num_frames // (workers * 4)))
+    ranges = [(s, s + chunk) for s in range(0, num_frames, chunk)]
+    ranges[-1] = (ranges[-1][0], None)
+    return ranges
+
+
+def group_words(letters):
+    """Word segments {'text', 'start', 'end'} from committed letter entries."""
+    words, current = [], None
+    for entry in letters:
+        token = entry['letter']
+        if token == 'space':
+            if current:
+                words.append(current)
+            current = None
+        elif token == 'del':
+            if current:
+                current['text'] = current['text'][:-1]
+                if not current['text']:
+                    current = None
+        else:
+            if current is None:
+                current = {'text': '', 'start': entry['time']}
+            current['text'] += token
+            current['end'] = entry['time']
+    if current:
+        words.append(current)
+    return words
+
+
+def build_transcript(frame_preds, fps, auto_commit_frames=15):
+    """Replay per-frame predictions through LetterSmoother, in frame order.
+
+    Latencies are in video time: the delay added by voting and cooldown,
+    not by processing.
+    """
+    smoother = LetterSmoother(buffer_len=8, confidence_threshold=0.7, cooldown_frames=20,
+                              auto_commit_frames=auto_commit_frames)
+    letters = []
+    for idx, label, prob in frame_preds:
+        t = idx / fps
+        _, _, committed = smoother.update(label, prob, t_capture=t, now=t)
+        if committed:
+            letters.append({'frame': idx, 'time': round(t, 3), 'letter': committed})
+    return {'text': smoother.current_word, 'letters': letters, 'words': group_words(letters),
+            'latency': smoother.latency_summary()}
+
+
+def format_time(seconds):
+    m, s = divmod(seconds, 60)
+    return f'{int(m):02d}:{s:06.3f}'
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description='Transcribe a recorded signing video to time-aligned text')
+    p.add_argument('video')
+    p.add_argument('--model', default=MODEL_PATH,
+                   help='pixel CNN (.h5/.tflite/.npz) or landmark MLP; .tflite/.npz load fastest per worker')
+    p.add_argument('--models_dir', default='models', help='where labels.json lives')
+    p.add_argument('--out', default=None, help='transcript JSON (default: <video>_transcript.json)')
+    p.add_argument('--workers', type=int, default=None, help='processes (default: all cores)')
+    p.add_argument('--batch_size', type=int, default=32, help='hand crops per inference call')
+    p.add_argument('--auto_commit', type=int, default=15, help='commit a letter after N stable frames')
+    p.add_argument('--min_detection_confidence', type=float, default=0.7)
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    out_path = args.out or os.path.splitext(args.video)[0] + '_transcript.json'
+    fps, num_frames = video_info(args.video)
+    workers = args.workers or os.cpu_count()
+    ranges = frame_ranges(num_frames, workers)
+    print(f'🎬 {args.video}: {num_frames} frames @ {fps:.1f} fps, {len(ranges)} segments, {workers} processus')
+
+    t0 = time.perf_counter()
+    frame_preds = []
+    timings = {}
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges)), initializer=_init_worker,
+                             initargs=(args.model, args.models_dir, args.min_detection_confidence)) as pool:
+        futures = [pool.submit(_transcribe_chunk, args.video, start, stop, args.batch_size)
+                   for start, stop in ranges]
+        for n_done, fut in enumerate(as_completed(futures), 1):
+            preds, chunk_timings = fut.result()
+            frame_preds.extend(preds)
+            for name, t in chunk_timings.items():
+                timings[name] = timings.get(name, 0.0) + t
+            rate = len(frame_preds) / (time.perf_counter() - t0)
+            print(f'  segment {n_done}/{len(ranges)} | {rate:.0f} frames/s', end='\r')
+    print()
+    elapsed = time.perf_counter() - t0
+    frame_preds.sort(key=lambda r: r[0])
+
+    transcript = build_transcript(frame_preds, fps, auto_commit_frames=args.auto_commit)
+    n = len(frame_preds)
+    duration = n / fps
+    report = {
+        'frames': n,
+        'hands': sum(1 for _, label, _ in frame_preds if label is not None),
+        'elapsed_s': round(elapsed, 3),
+        'fps': round(n / max(elapsed, 1e-9), 1),
+        'realtime_factor': round(duration / max(elapsed, 1e-9), 2),
+        'workers': workers,
+        # CPU seconds summed over workers
+        'stage_s': {name: round(t, 3) for name, t in timings.items()},
+    }
+    result = {'video': args.video, 'video_fps': fps, 'model': args.model, **transcript, 'report': report}
+    tmp_path = out_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, out_path)
+
+    for word in transcript['words']:
+        print(f"[{format_time(word['start'])} - {format_time(word['end'])}] {word['text']}")
+    print(f"📝 Transcription: '{transcript['text']}'")
+    commit = transcript['latency']['commit']
+    if commit['count']:
+        print(f"⏱️ Lettre validée après p50 {commit['p50_ms']:.0f} ms | p95 {commit['p95_ms']:.0f} ms (temps vidéo)")
+    print(f"⏱️ {n} frames en {elapsed:.1f}s ({report['fps']} FPS, x{report['realtime_factor']} temps réel)")
+    print(f'Transcript saved to: {out_path}')
+
+
+if __name__ == '__main__':
+    main()
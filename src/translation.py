@@ -0,0 +1,265 @@
+# Letters -> words: known words spotted in the spelled letters and
+# translated to English, French or Arabic.
+
+# DICTIONNAIRE OPTIMISÉ (150 MOTS FRÉQUENTS)
+SEMANTIC_TRANSLATIONS = {
+    'en': {
+        # ========== PRONOMS & BASIQUES ==========
+        'I': 'I', 'YOU': 'You', 'HE': 'He', 'SHE': 'She', 'WE': 'We', 
+        'THEY': 'They', 'ME': 'Me', 'MY': 'My', 'YOUR': 'Your', 'OUR': 'Our',
+        'THEIR': 'Their', 'HIS': 'His', 'HER': 'Her', 'IT': 'It', 'ITS': 'Its',
+        
+        # ========== VERBES COURANTS ==========
+        'BE': 'Be', 'IS': 'Is', 'ARE': 'Are', 'AM': 'Am', 'HAVE': 'Have',
+        'HAS': 'Has', 'DO': 'Do', 'DONT': "Don't", 'CAN': 'Can', 'CANNOT': 'Cannot',
+        'WILL': 'Will', 'WOULD': 'Would', 'SHOULD': 'Should', 'COULD': 'Could',
+        'MAY': 'May', 'MIGHT': 'Might', 'MUST': 'Must', 'WANT': 'Want',
+        'NEED': 'Need', 'LIKE': 'Like', 'LOVE': 'Love', 'HATE': 'Hate',
+        
+        # ========== SALUTATIONS & RÉPONSES ==========
+        'HELLO': 'Hello', 'HI': 'Hi', 'GOODBYE': 'Goodbye', 'BYE': 'Bye',
+        'WELCOME': 'Welcome', 'THANKS': 'Thanks', 'THANKYOU': 'Thank you',
+        'PLEASE': 'Please', 'SORRY': 'Sorry', 'EXCUSEME': 'Excuse me',
+        'YES': 'Yes', 'NO': 'No', 'OK': 'OK', 'FINE': 'Fine', 'GOOD': 'Good',
+        'BAD': 'Bad', 'WELL': 'Well', 'GREAT': 'Great', 'PERFECT': 'Perfect',
+        'MAYBE': 'Maybe', 'SURE': 'Sure', 'NOT': 'Not',
+        
+        # ========== QUESTIONS ==========
+        'WHAT': 'What', 'WHERE': 'Where', 'WHEN': 'When', 'WHY': 'Why',
+        'HOW': 'How', 'WHO': 'Who', 'WHICH': 'Which', 'WHOSE': 'Whose',
+        
+        # ========== FAMILLE & PERSONNES ==========
+        'FAMILY': 'Family', 'FATHER': 'Father', 'MOTHER': 'Mother', 
+        'PARENTS': 'Parents', 'SON': 'Son', 'DAUGHTER': 'Daughter',
+        'BROTHER': 'Brother', 'SISTER': 'Sister', 'BABY': 'Baby',
+        'CHILD': 'Child', 'MAN': 'Man', 'WOMAN': 'Woman', 'BOY': 'Boy',
+        'GIRL': 'Girl', 'FRIEND': 'Friend', 'NAME': 'Name',
+        
+        # ========== ÉMOTIONS & SENTIMENTS ==========
+        'HAPPY': 'Happy', 'SAD': 'Sad', 'ANGRY': 'Angry', 'EXCITED': 'Excited',
+        'SCARED': 'Scared', 'CALM': 'Calm', 'TIRED': 'Tired', 'SICK': 'Sick',
+        
+        # ========== LIEUX & MAISON ==========
+        'HOME': 'Home', 'HOUSE': 'House', 'ROOM': 'Room', 'BATHROOM': 'Bathroom',
+        'BEDROOM': 'Bedroom', 'KITCHEN': 'Kitchen', 'SCHOOL': 'School',
+        'WORK': 'Work', 'OFFICE': 'Office', 'HOSPITAL': 'Hospital',
+        'PARK': 'Park', 'STORE': 'Store', 'CITY': 'City',
+        
+        # ========== NOURRITURE & BOISSONS ==========
+        'FOOD': 'Food', 'EAT': 'Eat', 'DRINK': 'Drink', 'WATER': 'Water',
+        'HUNGRY': 'Hungry', 'THIRSTY': 'Thirsty', 'BREAD': 'Bread',
+        'MEAT': 'Meat', 'FRUIT': 'Fruit', 'MILK': 'Milk', 'COFFEE': 'Coffee',
+        
+        # ========== ACTIONS & MOUVEMENTS ==========
+        'GO': 'Go', 'COME': 'Come', 'SEE': 'See', 'LOOK': 'Look',
+        'HEAR': 'Hear', 'LISTEN': 'Listen', 'SPEAK': 'Speak', 'TALK': 'Talk',
+        'SAY': 'Say', 'ASK': 'Ask', 'ANSWER': 'Answer', 'THINK': 'Think',
+        'KNOW': 'Know', 'UNDERSTAND': 'Understand', 'REMEMBER': 'Remember',
+        'FORGET': 'Forget', 'HELP': 'Help', 'STOP': 'Stop', 'START': 'Start',
+        'WAIT': 'Wait', 'SIT': 'Sit', 'STAND': 'Stand', 'WALK': 'Walk',
+        'RUN': 'Run', 'SLEEP': 'Sleep', 'WAKE': 'Wake',
+        
+        # ========== OBJETS & COULEURS ==========
+        'BOOK': 'Book', 'PEN': 'Pen', 'PAPER': 'Paper', 'PHONE': 'Phone',
+        'COMPUTER': 'Computer', 'CAR': 'Car', 'BUS': 'Bus', 'TRAIN': 'Train',
+        'BED': 'Bed', 'TABLE': 'Table', 'CHAIR': 'Chair', 'DOOR': 'Door',
+        'WINDOW': 'Window', 'RED': 'Red', 'BLUE': 'Blue', 'GREEN': 'Green',
+        'YELLOW': 'Yellow', 'BLACK': 'Black', 'WHITE': 'White',
+        
+        # ========== TEMPS & NOMBRES ==========
+        'TIME': 'Time', 'DAY': 'Day', 'NIGHT': 'Night', 'TODAY': 'Today',
+        'TOMORROW': 'Tomorrow', 'NOW': 'Now', 'LATER': 'Later',
+        'ONE': 'One', 'TWO': 'Two', 'THREE': 'Three', 'FOUR': 'Four',
+        'FIVE': 'Five', 'TEN': 'Ten',
+        
+        # ========== PHRASES COURANTES ==========
+        'ILOVEYOU': 'I love you', 'HOWAREYOU': 'How are you',
+        'WHATISYOURNAME': 'What is your name', 'MYNAMEIS': 'My name is',
+        'NICETOMEETYOU': 'Nice to meet you', 'WHEREAREYOUFROM': 'Where are you from',
+        'CANYOUHELPME': 'Can you help me', 'IDONTUNDERSTAND': "I don't understand",
+        'GOODMORNING': 'Good morning', 'GOODNIGHT': 'Good night',
+        'SEEYOULATER': 'See you later', 'HAVEANICEDAY': 'Have a nice day'
+    },
+    
+    'fr': {
+        # Version française
+        'I': 'Je', 'YOU': 'Tu', 'HE': 'Il', 'SHE': 'Elle', 'WE': 'Nous',
+        'THEY': 'Ils', 'ME': 'Moi', 'MY': 'Mon', 'YOUR': 'Ton', 'OUR': 'Notre',
+        'THEIR': 'Leur', 'HIS': 'Son', 'HER': 'Sa', 'IT': 'Il', 'ITS': 'Son',
+        
+        'BE': 'Être', 'IS': 'Est', 'ARE': 'Sont', 'AM': 'Suis', 'HAVE': 'Avoir',
+        'HAS': 'A', 'DO': 'Faire', 'DONT': 'Ne pas', 'CAN': 'Pouvoir',
+        'CANNOT': 'Ne peut pas', 'WILL': 'Vouloir', 'WOULD': 'Voudrait',
+        'SHOULD': 'Devrait', 'COULD': 'Pourrait', 'MAY': 'Peut-être',
+        'MIGHT': 'Pourrait', 'MUST': 'Doit', 'WANT': 'Vouloir',
+        'NEED': 'Avoir besoin', 'LIKE': 'Aimer', 'LOVE': 'Aimer', 'HATE': 'Détester',
+        
+        'HELLO': 'Bonjour', 'HI': 'Salut', 'GOODBYE': 'Au revoir', 'BYE': 'Salut',
+        'WELCOME': 'Bienvenue', 'THANKS': 'Merci', 'THANKYOU': 'Merci',
+        'PLEASE': 'S il vous plaît', 'SORRY': 'Désolé', 'EXCUSEME': 'Excusez-moi',
+        'YES': 'Oui', 'NO': 'Non', 'OK': 'D accord', 'FINE': 'Bien', 'GOOD': 'Bon',
+        'BAD': 'Mauvais', 'WELL': 'Bien', 'GREAT': 'Génial', 'PERFECT': 'Parfait',
+        'MAYBE': 'Peut-être', 'SURE': 'Bien sûr', 'NOT': 'Pas',
+        
+        'WHAT': 'Quoi', 'WHERE': 'Où', 'WHEN': 'Quand', 'WHY': 'Pourquoi',
+        'HOW': 'Comment', 'WHO': 'Qui', 'WHICH': 'Quel', 'WHOSE': 'À qui',
+        
+        'FAMILY': 'Famille', 'FATHER': 'Père', 'MOTHER': 'Mère',
+        'PARENTS': 'Parents', 'SON': 'Fils', 'DAUGHTER': 'Fille',
+        'BROTHER': 'Frère', 'SISTER': 'Sœur', 'BABY': 'Bébé',
+        'CHILD': 'Enfant', 'MAN': 'Homme', 'WOMAN': 'Femme', 'BOY': 'Garçon',
+        'GIRL': 'Fille', 'FRIEND': 'Ami', 'NAME': 'Nom',
+        
+        'HAPPY': 'Heureux', 'SAD': 'Triste', 'ANGRY': 'En colère',
+        'EXCITED': 'Excité', 'SCARED': 'Peur', 'CALM': 'Calme',
+        'TIRED': 'Fatigué', 'SICK': 'Malade',
+        
+        'HOME': 'Maison', 'HOUSE': 'Maison', 'ROOM': 'Pièce',
+        'BATHROOM': 'Salle de bain', 'BEDROOM': 'Chambre',
+        'KITCHEN': 'Cuisine', 'SCHOOL': 'École', 'WORK': 'Travail',
+        'OFFICE': 'Bureau', 'HOSPITAL': 'Hôpital', 'PARK': 'Parc',
+        'STORE': 'Magasin', 'CITY': 'Ville',
+        
+        'FOOD': 'Nourriture', 'EAT': 'Manger', 'DRINK': 'Boire',
+        'WATER': 'Eau', 'HUNGRY': 'Faim', 'THIRSTY': 'Soif',
+        'BREAD': 'Pain', 'MEAT': 'Viande', 'FRUIT': 'Fruit', 'MILK': 'Lait',
+        'COFFEE': 'Café',
+        
+        'GO': 'Aller', 'COME': 'Venir', 'SEE': 'Voir', 'LOOK': 'Regarder',
+        'HEAR': 'Entendre', 'LISTEN': 'Écouter', 'SPEAK': 'Parler',
+        'TALK': 'Parler', 'SAY': 'Dire', 'ASK': 'Demander',
+        'ANSWER': 'Répondre', 'THINK': 'Penser', 'KNOW': 'Savoir',
+        'UNDERSTAND': 'Comprendre', 'REMEMBER': 'Se souvenir',
+        'FORGET': 'Oublier', 'HELP': 'Aider', 'STOP': 'Arrêter',
+        'START': 'Commencer', 'WAIT': 'Attendre', 'SIT': 'S asseoir',
+        'STAND': 'Se lever', 'WALK': 'Marcher', 'RUN': 'Courir',
+        'SLEEP': 'Dormir', 'WAKE': 'Se réveiller',
+        
+        'BOOK': 'Livre', 'PEN': 'Stylo', 'PAPER': 'Papier', 'PHONE': 'Téléphone',
+        'COMPUTER': 'Ordinateur', 'CAR': 'Voiture', 'BUS': 'Bus',
+        'TRAIN': 'Train', 'BED': 'Lit', 'TABLE': 'Table', 'CHAIR': 'Chaise',
+        'DOOR': 'Porte', 'WINDOW': 'Fenêtre', 'RED': 'Rouge', 'BLUE': 'Bleu',
+        'GREEN': 'Vert', 'YELLOW': 'Jaune', 'BLACK': 'Noir', 'WHITE': 'Blanc',
+        
+        'TIME': 'Temps', 'DAY': 'Jour', 'NIGHT': 'Nuit', 'TODAY': 'Aujourd hui',
+        'TOMORROW': 'Demain', 'NOW': 'Maintenant', 'LATER': 'Plus tard',
+        'ONE': 'Un', 'TWO': 'Deux', 'THREE': 'Trois', 'FOUR': 'Quatre',
+        'FIVE': 'Cinq', 'TEN': 'Dix',
+        
+        'ILOVEYOU': 'Je t aime', 'HOWAREYOU': 'Comment allez-vous',
+        'WHATISYOURNAME': 'Comment vous appelez-vous', 'MYNAMEIS': 'Je m appelle',
+        'NICETOMEETYOU': 'Enchanté de vous rencontrer',
+        'WHEREAREYOUFROM': 'D où venez-vous', 'CANYOUHELPME': 'Pouvez-vous m aider',
+        'IDONTUNDERSTAND': 'Je ne comprends pas', 'GOODMORNING': 'Bonjour',
+        'GOODNIGHT': 'Bonne nuit', 'SEEYOULATER': 'À plus tard',
+        'HAVEANICEDAY': 'Bonne journée'
+    },
+    
+    'ar': {
+        # Version arabe
+        'I': 'أنا', 'YOU': 'أنت', 'HE': 'هو', 'SHE': 'هي', 'WE': 'نحن',
+        'THEY': 'هم', 'ME': 'أنا', 'MY': 'لي', 'YOUR': 'لك', 'OUR': 'لنا',
+        'THEIR': 'لهم', 'HIS': 'له', 'HER': 'لها', 'IT': 'هو', 'ITS': 'له',
+        
+        'BE': 'يكون', 'IS': 'هو', 'ARE': 'هم', 'AM': 'أنا', 'HAVE': 'يملك',
+        'HAS': 'يملك', 'DO': 'يفعل', 'DONT': 'لا', 'CAN': 'يستطيع',
+        'CANNOT': 'لا يستطيع', 'WILL': 'سوف', 'WOULD': 'سوف', 'SHOULD': 'يجب',
+        'COULD': 'يمكن', 'MAY': 'قد', 'MIGHT': 'قد', 'MUST': 'يجب',
+        'WANT': 'يريد', 'NEED': 'يحتاج', 'LIKE': 'يحب', 'LOVE': 'يحب',
+        'HATE': 'يكره',
+        
+        'HELLO': 'مرحبا', 'HI': 'أهلا', 'GOODBYE': 'مع السلامة', 'BYE': 'وداعا',
+        'WELCOME': 'أهلا وسهلا', 'THANKS': 'شكرا', 'THANKYOU': 'شكرا لك',
+        'PLEASE': 'من فضلك', 'SORRY': 'آسف', 'EXCUSEME': 'اعذرني',
+        'YES': 'نعم', 'NO': 'لا', 'OK': 'موافق', 'FINE': 'بخير', 'GOOD': 'جيد',
+        'BAD': 'سيء', 'WELL': 'جيد', 'GREAT': 'عظيم', 'PERFECT': 'ممتاز',
+        'MAYBE': 'ربما', 'SURE': 'بالتأكيد', 'NOT': 'ليس',
+        
+        'WHAT': 'ماذا', 'WHERE': 'أين', 'WHEN': 'متى', 'WHY': 'لماذا',
+        'HOW': 'كيف', 'WHO': 'من', 'WHICH': 'أي', 'WHOSE': 'لمن',
+        
+        'FAMILY': 'عائلة', 'FATHER': 'أب', 'MOTHER': 'أم',
+        'PARENTS': 'والدان', 'SON': 'ابن', 'DAUGHTER': 'ابنة',
+        'BROTHER': 'أخ', 'SISTER': 'أخت', 'BABY': 'طفل',
+        'CHILD': 'طفل', 'MAN': 'رجل', 'WOMAN': 'امرأة', 'BOY': 'ولد',
+        'GIRL': 'بنت', 'FRIEND': 'صديق', 'NAME': 'اسم',
+        
+        'HAPPY': 'سعيد', 'SAD': 'حزين', 'ANGRY': 'غاضب',
+        'EXCITED': 'متحمس', 'SCARED': 'خائف', 'CALM': 'هادئ',
+        'TIRED': 'متعب', 'SICK': 'مريض',
+        
+        'HOME': 'بيت', 'HOUSE': 'منزل', 'ROOM': 'غرفة',
+        'BATHROOM': 'حمام', 'BEDROOM': 'غرفة نوم', 'KITCHEN': 'مطبخ',
+        'SCHOOL': 'مدرسة', 'WORK': 'عمل', 'OFFICE': 'مكتب',
+        'HOSPITAL': 'مستشفى', 'PARK': 'حديقة', 'STORE': 'متجر',
+        'CITY': 'مدينة',
+        
+        'FOOD': 'طعام', 'EAT': 'يأكل', 'DRINK': 'يشرب', 'WATER': 'ماء',
+        'HUNGRY': 'جوعان', 'THIRSTY': 'عطشان', 'BREAD': 'خبز',
+        'MEAT': 'لحم', 'FRUIT': 'فاكهة', 'MILK': 'حليب', 'COFFEE': 'قهوة',
+        
+        'GO': 'يذهب', 'COME': 'يأتي', 'SEE': 'يرى', 'LOOK': 'ينظر',
+        'HEAR': 'يسمع', 'LISTEN': 'يستمع', 'SPEAK': 'يتكلم',
+        'TALK': 'يتحدث', 'SAY': 'يقول', 'ASK': 'يسأل', 'ANSWER': 'يجيب',
+        'THINK': 'يفكر', 'KNOW': 'يعرف', 'UNDERSTAND': 'يفهم',
+        'REMEMBER': 'يتذكر', 'FORGET': 'ينسى', 'HELP': 'يساعد',
+        'STOP': 'يتوقف', 'START': 'يبدأ', 'WAIT': 'ينتظر', 'SIT': 'يجلس',
+        'STAND': 'يقف', 'WALK': 'يمشي', 'RUN': 'يركض', 'SLEEP': 'ينام',
+        'WAKE': 'يستيقظ',
+        
+        'BOOK': 'كتاب', 'PEN': 'قلم', 'PAPER': 'ورقة', 'PHONE': 'هاتف',
+        'COMPUTER': 'كمبيوتر', 'CAR': 'سيارة', 'BUS': 'حافلة',
+        'TRAIN': 'قطار', 'BED': 'سرير', 'TABLE': 'طاولة', 'CHAIR': 'كرسي',
+        'DOOR': 'باب', 'WINDOW': 'نافذة', 'RED': 'أحمر', 'BLUE': 'أزرق',
+        'GREEN': 'أخضر', 'YELLOW': 'أصفر', 'BLACK': 'أسود', 'WHITE': 'أبيض',
+        
+        'TIME': 'وقت', 'DAY': 'يوم', 'NIGHT': 'ليل', 'TODAY': 'اليوم',
+        'TOMORROW': 'غدا', 'NOW': 'الآن', 'LATER': 'لاحقا',
+        'ONE': 'واحد', 'TWO': 'اثنان', 'THREE': 'ثلاثة', 'FOUR': 'أربعة',
+        'FIVE': 'خمسة', 'TEN': 'عشرة',
+        
+        'ILOVEYOU': 'أحبك', 'HOWAREYOU': 'كيف حالك',
+        'WHATISYOURNAME': 'ما اسمك', 'MYNAMEIS': 'اسمي هو',
+        'NICETOMEETYOU': 'تشرفت بلقائك', 'WHEREAREYOUFROM': 'من أين أنت',
+        'CANYOUHELPME': 'هل يمكنك مساعدتي', 'IDONTUNDERSTAND': 'أنا لا أفهم',
+        'GOODMORNING': 'صباح الخير', 'GOODNIGHT': 'تصبح على خير',
+        'SEEYOULATER': 'أراك لاحقا', 'HAVEANICEDAY': 'أتمنى لك يوما سعيدا'
+    }
+}
+
+def detect_semantic_words(text):
+    """Détection optimisée des mots sémantiques"""
+    text_upper = text.upper().replace(' ', '')
+    detected_words = []
+    remaining_text = text_upper
+    
+    # Chercher les mots du plus long au plus court (optimisation)
+    for word_length in range(20, 1, -1):  # Mots de 20 lettres à 2 lettres
+        for word in SEMANTIC_TRANSLATIONS['en']:
+            if len(word) == word_length and word in remaining_text:
+                detected_words.append(word)
+                remaining_text = remaining_text.replace(word, '', 1)
+    
+    return detected_words, remaining_text
+
+def smart_translation(current_word, language, translation_mode):
+    """Traduction intelligente optimisée"""
+    if not translation_mode or not current_word.strip():
+        return current_word
+    
+    detected_words, remaining = detect_semantic_words(current_word)
+    
+    if detected_words:
+        # Traduire les mots détectés
+        translated_parts = []
+        for word in detected_words:
+            if word in SEMANTIC_TRANSLATIONS[language]:
+                translated_parts.append(SEMANTIC_TRANSLATIONS[language][word])
+        
+        # Ajouter les lettres restantes
+        if remaining:
+            translated_parts.append(remaining)
+        
+        return ' '.join(translated_parts)
+    else:
+        return current_word
@@ -1,8 +1,12 @@
 import os
 import json
+import threading
+import collections
+import concurrent.futures
 import numpy as np
-from tensorflow.keras.models import load_model
-from tensorflow.keras.preprocessing.image import img_to_array
+
+# TensorFlow is imported lazily (only by the Keras backend) so that the
+# TFLite and NumPy (.npz) backends run without it.
 
 
 def load_labels(models_dir='../models'):
@@ -11,33 +15,466 @@ def load_labels(models_dir='../models'):
         raise FileNotFoundError(f"labels.json not found in {models_dir}")
     with open(labels_path, 'r') as f:
         class_map = json.load(f)
-    # class_map: index -> label
-    labels = [class_map[str(i)] if isinstance(list(class_map.keys())[0], str) else class_map[i] for i in range(len(class_map))]
-    # ensure order by index
+    # class_map: index -> label, ordered by index
     labels = [class_map[str(i)] if str(i) in class_map else class_map[i] for i in range(len(class_map))]
     return labels
 
 
+# process-wide caches: abs path -> (cache key, value)
+_MODEL_CACHE = {}
+_LABELS_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _cached(cache, path, key, loader):
+    # a changed mtime (or loader options) invalidates the entry; the load
+    # itself runs outside the lock so other paths are not blocked by it
+    with _CACHE_LOCK:
+        entry = cache.get(path)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+    value = loader()
+    with _CACHE_LOCK:
+        cache[path] = (key, value)
+    return value
+
+
+def get_model(model_path, **kwargs):
+    """Cached load_trained_model: reloads only when the file changes."""
+    if not os.path.exists(model_path):
+        raise FileNotFoundError(f"Model not found at {model_path}")
+    path = os.path.abspath(model_path)
+    key = (os.stat(path).st_mtime_ns, tuple(sorted(kwargs.items())))
+    return _cached(_MODEL_CACHE, path, key, lambda: load_trained_model(model_path, **kwargs))
+
+
+def _get_label_set(models_dir):
+    labels_path = os.path.abspath(os.path.join(models_dir, 'labels.json'))
+    if not os.path.exists(labels_path):
+        raise FileNotFoundError(f"labels.json not found in {models_dir}")
+
+    def loader():
+        labels = tuple(load_labels(models_dir))
+        array = np.array(labels)
+        array.setflags(write=False)
+        return labels, array
+
+    return _cached(_LABELS_CACHE, labels_path, os.stat(labels_path).st_mtime_ns, loader)
+
+
+def get_labels(models_dir='../models'):
+    """Cached load_labels, shared across callers (returned as a tuple)."""
+    return _get_label_set(models_dir)[0]
+
+
+def get_labels_array(models_dir='../models'):
+    """Same labels as a read-only NumPy array, for vectorized lookups."""
+    return _get_label_set(models_dir)[1]
+
+
 def preprocess_image_bgr(img_bgr, img_size=64):
     # img_bgr is an image loaded by cv2 (BGR)
     import cv2
     img_rgb = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
     img_resized = cv2.resize(img_rgb, (img_size, img_size))
-    img_arr = img_to_array(img_resized) / 255.0
+    img_arr = img_resized.astype(np.float32) / 255.0
     return np.expand_dims(img_arr, axis=0)
 
 
-def load_trained_model(model_path):
+def preprocess_image_bgr_uint8(img_bgr, img_size=64):
+    # same as preprocess_image_bgr but keeps raw 0..255 pixels, for models
+    # whose quantized input already folds in the /255 scaling
+    import cv2
+    img_rgb = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
+    img_resized = cv2.resize(img_rgb, (img_size, img_size))
+    return np.expand_dims(img_resized, axis=0)
+
+
+def preprocess_for_model(model, img_bgr, img_size=64):
+    """Preprocess one ROI in whatever input format `model` expects."""
+    kind = getattr(model, 'input_kind', 'float')
+    if kind == 'raw':
+        # resize, BGR->RGB and /255 live in the model graph
+        return img_bgr[np.newaxis]
+    if kind == 'uint8':
+        return preprocess_image_bgr_uint8(img_bgr, img_size=img_size)
+    return preprocess_image_bgr(img_bgr, img_size=img_size)
+
+
+def preprocess_batch_bgr(images_bgr, img_size=64):
+    # same transform as preprocess_image_bgr, written into one contiguous batch
+    import cv2
+    batch = np.empty((len(images_bgr), img_size, img_size, 3), dtype=np.float32)
+    for i, img_bgr in enumerate(images_bgr):
+        img_rgb = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
+        batch[i] = cv2.resize(img_rgb, (img_size, img_size))
+    batch /= 255.0
+    return batch
+
+
+def resize_batch_bgr(images_bgr, img_size=64):
+    # for raw-input models: only bring ROIs to a common size so they stack,
+    # the in-graph Resizing is then an identity
+    import cv2
+    batch = np.empty((len(images_bgr), img_size, img_size, 3), dtype=np.uint8)
+    for i, img_bgr in enumerate(images_bgr):
+        cv2.resize(img_bgr, (img_size, img_size), dst=batch[i])
+    return batch
+
+
+class Preprocessor:
+    """Allocation-free version of preprocess_for_model / preprocess_batch_bgr.
+
+    Owns its destination buffers (resized BGR, RGB, and a persistent
+    (max_batch, img_size, img_size, 3) batch) and fills them in place on
+    every call. Resizing happens before the colour swap so both work on the
+    small image; the result is identical since neither mixes channels.
+
+    The returned array is a view into the batch buffer: it is only valid
+    until the next call.
+    """
+
+    def __init__(self, img_size=64, max_batch=1, kind='float'):
+        self.img_size = img_size
+        self.kind = kind
+        self._resized = np.empty((img_size, img_size, 3), dtype=np.uint8)
+        self._rgb = np.empty((img_size, img_size, 3), dtype=np.uint8)
+        self._alloc(max_batch)
+
+    @classmethod
+    def for_model(cls, model, img_size=64, max_batch=1):
+        return cls(img_size=img_size, max_batch=max_batch, kind=getattr(model, 'input_kind', 'float'))
+
+    def _alloc(self, max_batch):
+        dtype = np.float32 if self.kind == 'float' else np.uint8
+        self.batch = np.empty((max_batch, self.img_size, self.img_size, 3), dtype=dtype)
+
+    def _fill(self, i, img_bgr):
+        import cv2
+        size = (self.img_size, self.img_size)
+        if self.kind == 'raw':
+            # colour swap and scaling are in the graph, only resize to stack
+            cv2.resize(img_bgr, size, dst=self.batch[i])
+            return
+        cv2.resize(img_bgr, size, dst=self._resized)
+        if self.kind == 'uint8':
+            cv2.cvtColor(self._resized, cv2.COLOR_BGR2RGB, dst=self.batch[i])
+        else:
+            cv2.cvtColor(self._resized, cv2.COLOR_BGR2RGB, dst=self._rgb)
+            np.divide(self._rgb, np.float32(255.0), out=self.batch[i], dtype=np.float32)
+
+    def __call__(self, img_bgr):
+        if self.kind == 'raw':
+            # a single raw crop goes to the model untouched
+            return img_bgr[np.newaxis]
+        self._fill(0, img_bgr)
+        return self.batch[:1]
+
+    def batch_of(self, images_bgr):
+        n = len(images_bgr)
+        if n > len(self.batch):
+            self._alloc(n)
+        for i, img_bgr in enumerate(images_bgr):
+            self._fill(i, img_bgr)
+        return self.batch[:n]
+
+
+def list_dataset_images(split_dir, labels):
+    """List (image_path, class_index) pairs for a split laid out as
+    split_dir/<label>/<image>, the layout train.py reads. Class indices
+    follow labels.json; folders that are not a known label are skipped.
+    """
+    index = {label: i for i, label in enumerate(labels)}
+    items = []
+    for class_name in sorted(os.listdir(split_dir)):
+        class_dir = os.path.join(split_dir, class_name)
+        if class_name not in index or not os.path.isdir(class_dir):
+            continue
+        for fname in sorted(os.listdir(class_dir)):
+            if fname.lower().endswith(('.jpg', '.jpeg', '.png', '.bmp')):
+                items.append((os.path.join(class_dir, fname), index[class_name]))
+    return items
+
+
+def load_image(path, img_size=64):
+    # decode + resize on the worker thread (cv2 releases the GIL); the later
+    # same-size resize in predict_batch is a copy, so results are unchanged
+    import cv2
+    img = cv2.imread(path)
+    if img is None:
+        return None
+    return cv2.resize(img, (img_size, img_size))
+
+
+def iter_batches(paths, batch_size, workers, img_size=64, prefetch=2):
+    """Yield (paths, images) batches while the next ones decode in the background."""
+    window = collections.deque()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        for start in range(0, len(paths), batch_size):
+            chunk = paths[start:start + batch_size]
+            window.append((chunk, pool.map(load_image, chunk, [img_size] * len(chunk))))
+            if len(window) > prefetch:
+                chunk, images = window.popleft()
+                yield chunk, list(images)
+        while window:
+            chunk, images = window.popleft()
+            yield chunk, list(images)
+
+
+def build_inference_fn(model, warmup=True):
+    """Compile a fixed-shape tf.function around model(x, training=False).
+
+    model.predict builds a data adapter and runs the callback machinery on
+    every call; for one 64x64 ROI per frame that overhead dominates. The
+    input signature pins the image shape (batch stays dynamic) so the graph
+    is traced once, and the warm-up call pays that cost at load time.
+    """
+    import tensorflow as tf
+    sample_shape = tuple(model.input_shape[1:])
+    dtype = tf.as_dtype(model.inputs[0].dtype)
+    # raw-input models declare (None, None, 3): one trace covers every ROI size
+    spec = tf.TensorSpec(shape=(None,) + sample_shape, dtype=dtype)
+
+    @tf.function(input_signature=[spec])
+    def _infer(x):
+        return model(x, training=False)
+
+    def infer(x):
+        return _infer(np.asarray(x, dtype=dtype.as_numpy_dtype)).numpy()
+
+    if warmup:
+        infer(np.zeros((1,) + tuple(d or 64 for d in sample_shape), dtype=dtype.as_numpy_dtype))
+    return infer
+
+
+def _make_interpreter(model_path, num_threads=None, use_xnnpack=True):
+    # prefer the standalone runtime; fall back to the one bundled with TF
+    try:
+        from tflite_runtime.interpreter import Interpreter, OpResolverType
+    except ImportError:
+        import tensorflow as tf
+        Interpreter = tf.lite.Interpreter
+        OpResolverType = tf.lite.experimental.OpResolverType
+    # XNNPACK is applied as the default CPU delegate; opting out means
+    # building the interpreter without default delegates
+    resolver = OpResolverType.AUTO if use_xnnpack else OpResolverType.BUILTIN_WITHOUT_DEFAULT_DELEGATES
+    return Interpreter(model_path=model_path, num_threads=num_threads,
+                       experimental_op_resolver_type=resolver)
+
+
+class TFLiteModel:
+    """TFLite interpreter backend exposing the same infer(x) contract as the
+    Keras fast path: x is the output of preprocess_image_bgr /
+    preprocess_batch_bgr, the result is a (N, num_classes) probability array.
+
+    Raw-input models accept crops of any size, but a new input shape costs
+    resize_tensor_input + allocate_tensors. Crops are therefore resized to
+    raw_size x raw_size (the img_size the model was exported with) before
+    the interpreter, as Preprocessor.batch_of does for batches: the input
+    shape stays fixed and the in-graph resize becomes a no-op.
+    """
+
+    def __init__(self, model_path, num_threads=None, use_xnnpack=True, warmup=True, raw_size=64):
+        self.model_path = model_path
+        self.raw_size = raw_size
+        self.interpreter = _make_interpreter(model_path, num_threads=num_threads, use_xnnpack=use_xnnpack)
+        self.interpreter.allocate_tensors()
+        inp = self.interpreter.get_input_details()[0]
+        out = self.interpreter.get_output_details()[0]
+        self._in_index = inp['index']
+        self._out_index = out['index']
+        self.input_dtype = inp['dtype']
+        self._in_quant = inp['quantization']
+        self._out_dtype = out['dtype']
+        self._out_quant = out['quantization']
+        self.num_classes = int(out['shape'][-1])
+        signature = inp.get('shape_signature', inp['shape'])
+        # Keras-style shape so callers can read the expected image size
+        self.input_shape = (None,) + tuple(int(d) if d > 0 else None for d in signature[1:])
+        # raw-input exports take uint8 BGR crops of any size; full-integer
+        # models calibrated on [0, 1] inputs end up with scale=1/255,
+        # zero_point=0 so resized uint8 RGB pixels can be fed unchanged
+        in_scale, in_zero = self._in_quant
+        self.input_kind = 'float'
+        if self.input_dtype == np.uint8 and self.input_shape[1] is None:
+            self.input_kind = 'raw'
+        elif self.input_dtype == np.uint8 and in_zero == 0 and abs(in_scale * 255.0 - 1.0) < 1e-3:
+            self.input_kind = 'uint8'
+        self._shape = tuple(int(d) for d in inp['shape'])
+        if warmup:
+            sample_shape = tuple(d or self.raw_size for d in self.input_shape[1:])
+            self.infer(np.zeros((1,) + sample_shape, dtype=self.input_dtype))
+
+    def _fixed_size(self, x):
+        # raw crops come at their native size: bring them to raw_size
+        if self.input_kind != 'raw' or x.shape[1:3] == (self.raw_size, self.raw_size):
+            return x
+        import cv2
+        size = (self.raw_size, self.raw_size)
+        return np.stack([cv2.resize(img, size) for img in x])
+
+    def _ensure_shape(self, shape):
+        # batch size can change between calls; reallocating is only paid
+        # when it does
+        if shape != self._shape:
+            self.interpreter.resize_tensor_input(self._in_index, shape)
+            self.interpreter.allocate_tensors()
+            self._shape = shape
+
+    def _quantize_input(self, x):
+        x = np.asarray(x)
+        if self.input_dtype == np.float32 or x.dtype == self.input_dtype:
+            return np.ascontiguousarray(x, dtype=self.input_dtype)
+        # float input to an integer model: quantize with the tensor params
+        scale, zero = self._in_quant
+        info = np.iinfo(self.input_dtype)
+        q = np.round(x / scale + zero)
+        return np.ascontiguousarray(np.clip(q, info.min, info.max), dtype=self.input_dtype)
+
+    def infer(self, x):
+        x = self._fixed_size(self._quantize_input(x))
+        self._ensure_shape(x.shape)
+        self.interpreter.set_tensor(self._in_index, x)
+        self.interpreter.invoke()
+        out = self.interpreter.get_tensor(self._out_index)
+        if self._out_dtype != np.float32:
+            scale, zero = self._out_quant
+            return (out.astype(np.float32) - zero) * scale
+        return out.copy()
+
+
+def _keras_input_kind(model):
+    if len(model.input_shape) == 2:
+        # train_landmarks.build_landmark_mlp: (None, 63) landmark features
+        return 'landmarks'
+    # models exported with build_raw_input_model take uint8 BGR crops as-is
+    return 'raw' if model.input_shape[1] is None else 'float'
+
+
+def load_trained_model(model_path, warmup=True, num_threads=None):
     if not os.path.exists(model_path):
         raise FileNotFoundError(f"Model not found at {model_path}")
+    if model_path.endswith('.tflite'):
+        return TFLiteModel(model_path, num_threads=num_threads, warmup=warmup)
+    if model_path.endswith('.npz'):
+        # export_numpy.py output: runs without importing TensorFlow
+        from numpy_models import load_numpy_model
+        return load_numpy_model(model_path)
+    from tensorflow.keras.models import load_model
     model = load_model(model_path)
+    model.input_kind = _keras_input_kind(model)
+    model.num_classes = int(model.output_shape[-1])
+    # fast path used by the live loops instead of model.predict
+    model.infer = build_inference_fn(model, warmup=warmup)
     return model
 
 
-def predict_from_frame(model, frame_bgr, labels, img_size=64):
-    x = preprocess_image_bgr(frame_bgr, img_size=img_size)
-    preds = model.predict(x)
+def run_inference(model, x):
+    """Return class probabilities for a preprocessed batch x."""
+    infer = getattr(model, 'infer', None)
+    if infer is not None:
+        return infer(x)
+    return model.predict(x, verbose=0)
+
+
+def predict_from_frame(model, frame_bgr, labels, img_size=64, preprocessor=None):
+    if preprocessor is not None:
+        x = preprocessor(frame_bgr)
+    else:
+        x = preprocess_for_model(model, frame_bgr, img_size=img_size)
+    preds = run_inference(model, x)
     idx = int(np.argmax(preds))
     prob = float(np.max(preds))
     label = labels[idx]
-    return label, prob
\ No newline at end of file
+    return label, prob
+
+
+def decode_predictions(preds, labels, top_k=5):
+    """Turn a (N, num_classes) array into [(label, prob, [(label, prob), ...]), ...]"""
+    k = min(top_k, preds.shape[1])
+    top = np.argsort(preds, axis=1)[:, ::-1][:, :k]
+    results = []
+    for row, idxs in zip(preds, top):
+        top_k_items = [(labels[i], float(row[i])) for i in idxs]
+        label, prob = top_k_items[0]
+        results.append((label, prob, top_k_items))
+    return results
+
+
+def predict_batch(model, frames_bgr, labels, img_size=64, top_k=5, batch_size=64):
+    """Classify a list of BGR frames/ROIs with a single predict call.
+
+    Returns one (label, prob, top_k) tuple per input, in input order.
+    Empty ROIs (size 0) get None instead of a result.
+    """
+    valid = [i for i, f in enumerate(frames_bgr) if f is not None and f.size != 0]
+    results = [None] * len(frames_bgr)
+    if not valid:
+        return results
+    items = [frames_bgr[i] for i in valid]
+    if getattr(model, 'input_kind', 'float') == 'raw':
+        x = resize_batch_bgr(items, img_size=img_size)
+    else:
+        x = preprocess_batch_bgr(items, img_size=img_size)
+    preds = np.concatenate([run_inference(model, x[i:i + batch_size])
+                            for i in range(0, len(x), batch_size)])
+    for i, res in zip(valid, decode_predictions(preds, labels, top_k=top_k)):
+        results[i] = res
+    return results
+
+
+NUM_LANDMARKS = 21
+
+
+def landmarks_to_array(hand_landmarks, width=1, height=1):
+    """MediaPipe hand landmarks -> (21, 3) float32 array in pixel units.
+
+    x and z are scaled by the image width and y by its height, so the hand
+    shape does not depend on the frame's aspect ratio.
+    """
+    return np.array([(p.x * width, p.y * height, p.z * width) for p in hand_landmarks.landmark],
+                    dtype=np.float32)
+
+
+def normalize_landmarks(points):
+    """(21, 3) or (N, 21, 3) landmarks -> (N, 63) features.
+
+    Translated so the wrist is the origin and scaled so the largest
+    absolute x or y coordinate is 1 (the hand fits in the [-1, 1] square
+    around the wrist; z is scaled alike but not bounded): invariant to
+    where the hand is and how far it is from the camera.
+    """
+    pts = np.asarray(points, dtype=np.float32)
+    if pts.ndim == 2:
+        pts = pts[np.newaxis]
+    pts = pts - pts[:, :1, :]
+    scale = np.abs(pts[:, :, :2]).max(axis=(1, 2), keepdims=True)
+    pts = pts / np.maximum(scale, 1e-6)
+    return pts.reshape(len(pts), -1)
+
+
+def landmark_features(hand_landmarks, width=1, height=1):
+    return normalize_landmarks(landmarks_to_array(hand_landmarks, width, height))
+
+
+def hand_bbox(lm, w, h, pad=70):
+    """Square box around the hand landmarks, padded and clipped to the frame."""
+    x_coords = [int(p.x * w) for p in lm.landmark]
+    y_coords = [int(p.y * h) for p in lm.landmark]
+
+    bbox_size = max(max(x_coords) - min(x_coords), max(y_coords) - min(y_coords))
+    x_center = (min(x_coords) + max(x_coords)) // 2
+    y_center = (min(y_coords) + max(y_coords)) // 2
+
+    x_min = max(x_center - bbox_size//2 - pad, 0)
+    x_max = min(x_center + bbox_size//2 + pad, w)
+    y_min = max(y_center - bbox_size//2 - pad, 0)
+    y_max = min(y_center + bbox_size//2 + pad, h)
+    return x_min, y_min, x_max, y_max
+
+
+def predict_from_landmarks(model, hand_landmarks, labels, width=1, height=1):
+    preds = run_inference(model, landmark_features(hand_landmarks, width, height))
+    idx = int(np.argmax(preds))
+    prob = float(np.max(preds))
+    return labels[idx], prob
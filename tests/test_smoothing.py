@@ -0,0 +1,40 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from smoothing import LetterSmoother
+
+
+def replay(labels, prob=0.9, **kwargs):
+    kwargs.setdefault('auto_commit_frames', 15)
+    smoother = LetterSmoother(**kwargs)
+    committed = []
+    for i, label in enumerate(labels):
+        _, _, token = smoother.update(label, prob, t_capture=i / 30, now=i / 30)
+        if token:
+            committed.append(token)
+    return smoother, committed
+
+
+def test_held_sign_commits_once():
+    smoother, committed = replay(['A'] * 200)
+    assert committed == ['A']
+    assert smoother.current_word == 'A'
+
+
+def test_switching_signs_commits_each_once():
+    smoother, committed = replay(['A'] * 40 + ['B'] * 60)
+    assert committed == ['A', 'B']
+    assert smoother.current_word == 'AB'
+
+
+def test_stale_votes_do_not_commit_previous_letter():
+    # short settings: the buffer would still hold A votes when B starts
+    smoother, committed = replay(['A'] * 10 + ['B'] * 10, auto_commit_frames=3, cooldown_frames=2)
+    assert committed == ['A', 'B']
+
+
+def test_same_letter_again_after_hand_leaves():
+    smoother, committed = replay(['A'] * 40 + [None] * 3 + ['A'] * 40)
+    assert smoother.current_word == 'AA'
@@ -0,0 +1,25 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from transcribe import build_transcript, frame_ranges
+
+
+def test_held_sign_yields_one_letter():
+    preds = [(i, 'A', 0.9) for i in range(120)]
+    transcript = build_transcript(preds, fps=30.0)
+    assert transcript['text'] == 'A'
+    assert [entry['letter'] for entry in transcript['letters']] == ['A']
+    assert [word['text'] for word in transcript['words']] == ['A']
+
+
+def test_last_range_is_open_ended():
+    ranges = frame_ranges(1000, workers=2, min_chunk=150)
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] is None
+    assert all(stop == start for (_, stop), (start, _) in zip(ranges, ranges[1:]))
+
+
+def test_unknown_frame_count_is_one_open_range():
+    assert frame_ranges(0, workers=4) == [(0, None)]